@@ -0,0 +1,120 @@
+"""
+Benchmark das calculadoras: laço Python vs. backend NumPy.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_calculators
+"""
+
+import timeit
+
+import numpy as np
+
+from src.calculators import CalculatorFactory
+from src.calculators.cet_calculator import calcular_cet_lote
+from src.calculators.indexed_calculator import calcular_indexado, colunas_indexadas
+from src.calculators.rate_path_model import ModeloTrajetorias
+from src.calculators.vectorized_calculator import calcular_lote
+from src.models.domain import EncargosFinanciamento
+
+VALOR = 400_000.0
+TAXA_MENSAL = 0.8368
+PRAZO = 480
+TAMANHO_LOTE = 500
+
+
+def _medir(funcao, repeticoes: int) -> float:
+    """Melhor tempo por execução, em milissegundos."""
+    tempos = timeit.repeat(funcao, number=repeticoes, repeat=5)
+    return min(tempos) / repeticoes * 1000
+
+
+def bench_tabela_unica() -> None:
+    print(f"Tabela única ({PRAZO} meses)")
+
+    for tipo in ("PRICE", "SAC"):
+        loop = CalculatorFactory.create(tipo, backend="python")
+        vetorizado = CalculatorFactory.create(tipo, backend="numpy")
+
+        t_loop = _medir(lambda c=loop: c.calcular(VALOR, TAXA_MENSAL, PRAZO), 200)
+        t_numpy = _medir(lambda c=vetorizado: c.calcular(VALOR, TAXA_MENSAL, PRAZO), 200)
+
+        print(
+            f"  {tipo:5}  python: {t_loop:7.3f} ms   numpy: {t_numpy:7.3f} ms"
+            f"   speedup: {t_loop / t_numpy:5.1f}x"
+        )
+
+
+def bench_lote() -> None:
+    print(f"Lote ({TAMANHO_LOTE} financiamentos, prazos 120-{PRAZO} meses)")
+
+    rng = np.random.default_rng(42)
+    valores = rng.uniform(100_000, 1_000_000, TAMANHO_LOTE)
+    taxas = rng.uniform(0.6, 1.2, TAMANHO_LOTE)
+    prazos = rng.integers(120, PRAZO + 1, TAMANHO_LOTE)
+
+    for tipo in ("PRICE", "SAC"):
+        loop = CalculatorFactory.create(tipo, backend="python")
+
+        def executar_loop(c=loop):
+            for valor, taxa, prazo in zip(valores, taxas, prazos, strict=True):
+                c.calcular(float(valor), float(taxa), int(prazo))
+
+        t_loop = _medir(executar_loop, 3)
+        t_numpy = _medir(lambda t=tipo: calcular_lote(t, valores, taxas, prazos), 20)
+
+        print(
+            f"  {tipo:5}  python: {t_loop:9.2f} ms   numpy: {t_numpy:7.2f} ms"
+            f"   speedup: {t_loop / t_numpy:5.1f}x"
+        )
+
+
+def bench_indexada() -> None:
+    print(f"Tabela indexada ({PRAZO} meses, taxa e correção variáveis)")
+
+    rng = np.random.default_rng(42)
+    taxas = rng.uniform(0.6, 1.2, PRAZO)
+    correcoes = rng.uniform(0.0, 0.5, PRAZO)
+
+    for tipo in ("PRICE", "SAC"):
+        t_numpy = _medir(lambda t=tipo: calcular_indexado(t, VALOR, taxas, correcoes, PRAZO), 1000)
+
+        print(f"  {tipo:5}  numpy: {t_numpy:7.3f} ms")
+
+
+def bench_cet_lote() -> None:
+    print(f"CET em lote ({TAMANHO_LOTE} ofertas de {PRAZO} meses)")
+
+    rng = np.random.default_rng(42)
+    valores = rng.uniform(100_000, 1_000_000, TAMANHO_LOTE)
+    taxas = rng.uniform(0.6, 1.2, TAMANHO_LOTE)
+    prazos = np.full(TAMANHO_LOTE, PRAZO)
+    encargos = EncargosFinanciamento(3000, 25, 0.02, 0.01)
+
+    for tipo in ("PRICE", "SAC"):
+        lote = calcular_lote(tipo, valores, taxas, prazos)
+        t_cet = _medir(lambda lo=lote: calcular_cet_lote(lo, valores, encargos, 1_500_000), 10)
+
+        print(f"  {tipo:5}  numpy: {t_cet:7.2f} ms")
+
+
+def bench_monte_carlo() -> None:
+    trajetorias, meses = 10_000, 360
+    print(f"Monte Carlo ({trajetorias} trajetórias × {meses} meses, geração + tabela PRICE)")
+
+    historico = np.random.default_rng(42).normal(0.4, 0.2, 120)
+    modelo = ModeloTrajetorias.calibrar(historico)
+
+    def executar():
+        correcoes = modelo.gerar(trajetorias, meses, np.random.default_rng(1))
+        parcela, _, _, saldos = colunas_indexadas("PRICE", VALOR, TAXA_MENSAL, correcoes, meses)
+        np.percentile(parcela.sum(axis=1), [5, 50, 95])
+
+    print(f"  numpy: {_medir(executar, 1):7.1f} ms")
+
+
+if __name__ == "__main__":
+    bench_tabela_unica()
+    bench_lote()
+    bench_indexada()
+    bench_cet_lote()
+    bench_monte_carlo()
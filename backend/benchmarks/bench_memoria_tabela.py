@@ -0,0 +1,51 @@
+"""
+Memória e alocações de TabelaAmortizacao (colunas) vs. lista de Parcela.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_memoria_tabela
+"""
+
+import tracemalloc
+
+from src.calculators import CalculatorFactory
+
+PRAZOS = [12, 60, 120, 240, 360, 480]
+
+
+def _medir(funcao):
+    """Bytes retidos e número de blocos alocados pelo resultado de `funcao`."""
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+
+    resultado = funcao()
+
+    depois = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    diferencas = depois.compare_to(antes, "filename")
+    tamanho = sum(d.size_diff for d in diferencas)
+    blocos = sum(d.count_diff for d in diferencas)
+
+    return resultado, tamanho, blocos
+
+
+def main() -> None:
+    print(f"{'prazo':>5}  {'tipo':5}  {'colunas':>14}  {'list[Parcela]':>20}")
+
+    for tipo in ("PRICE", "SAC"):
+        calc = CalculatorFactory.create(tipo, backend="python")
+
+        for prazo in PRAZOS:
+            tabela, bytes_tabela, blocos_tabela = _medir(
+                lambda c=calc, n=prazo: c.calcular(400_000.0, 0.8368, n)
+            )
+            _, bytes_lista, blocos_lista = _medir(lambda t=tabela: list(t.parcelas))
+
+            print(
+                f"{prazo:>5}  {tipo:5}  {bytes_tabela / 1024:7.1f} KiB/{blocos_tabela:<4}"
+                f"  {bytes_lista / 1024:7.1f} KiB/{blocos_lista:<6} blocos"
+            )
+
+
+if __name__ == "__main__":
+    main()
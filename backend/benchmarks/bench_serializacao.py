@@ -0,0 +1,90 @@
+"""
+Custo de serialização por requisição: resposta HTTP + item do DynamoDB.
+
+Compara o caminho anterior (model_dump convertido para o DynamoDB, outro
+model_dump e json.dumps para a resposta) com o atual (model_dump_json uma vez;
+o item do DynamoDB sai desse JSON com números já em Decimal) e com um acerto
+no cache de simulações. Nenhum dos caminhos grava de fato na tabela.
+
+Uso (a partir de backend/):
+    python -m benchmarks.bench_serializacao
+"""
+
+import json
+import logging
+import os
+import timeit
+
+from src.handlers.financing_handler import _com_envelope
+from src.models.domain import Indicador
+from src.models.requests import ComparacaoRequest, SimulationRequest
+from src.services.dynamodb_service import DynamoDBService
+from src.services.financing_service import CAMPOS_DO_ENVELOPE, FinancingService
+
+REQUEST = {"valor_imovel": 500_000, "entrada": 100_000, "prazo_meses": 360, "regiao": "SP"}
+
+
+def _medir(funcao, repeticoes: int = 2000) -> float:
+    """Melhor tempo por execução, em microssegundos."""
+    tempos = timeit.repeat(funcao, number=repeticoes, repeat=5)
+    return min(tempos) / repeticoes * 1_000_000
+
+
+def _dois_dumps(result, db: DynamoDBService) -> dict:
+    item = db._para_item(result.model_dump(mode="json"))
+    resposta = result.model_dump(mode="json")
+    resposta["request_id"] = "bench"
+    json.dumps(resposta, ensure_ascii=False, default=str)
+    return item
+
+
+def _passagem_unica(result, db: DynamoDBService) -> dict:
+    corpo = result.model_dump_json(exclude={"request_id"})
+    return db._para_item(_com_envelope(corpo, {"request_id": "bench"}))
+
+
+def _acerto_no_cache(corpo: str, db: DynamoDBService) -> dict:
+    envelope = {"request_id": "bench", "timestamp": "2026-01-06T15:30:00"}
+    return db._para_item(_com_envelope(corpo, envelope))
+
+
+def main() -> None:
+    logging.disable(logging.CRITICAL)
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+    # Só a conversão para item é medida; o recurso boto3 não faz chamadas de rede
+    db = DynamoDBService()
+
+    service = FinancingService()
+    indicador = Indicador(
+        tipo="SELIC", valor=11.75, fonte="Banco Central do Brasil", data_referencia="2026-01-06"
+    )
+    snapshot = service.indicator_service._montar_snapshot(indicador)
+
+    simulacao = service._simular_com_snapshot(
+        "bench", SimulationRequest(**REQUEST, tipo_amortizacao="PRICE"), snapshot
+    )
+    service.indicator_service.criar_snapshot = lambda deadline=None: snapshot
+    comparacao = service.comparar(ComparacaoRequest(**REQUEST))
+
+    corpo = simulacao.model_dump_json(exclude=CAMPOS_DO_ENVELOPE)
+
+    print(f"{'resposta':12}  {'2x model_dump':>14}  {'model_dump_json':>16}  {'cache':>9}")
+
+    for nome, result in (("simulação", simulacao), ("comparação", comparacao)):
+        t_antigo = _medir(lambda r=result: _dois_dumps(r, db))
+        t_novo = _medir(lambda r=result: _passagem_unica(r, db))
+        t_cache = (
+            f"{_medir(lambda: _acerto_no_cache(corpo, db)):6.1f} µs" if result is simulacao else "-"
+        )
+
+        print(
+            f"{nome:12}  {t_antigo:11.1f} µs  {t_novo:13.1f} µs  {t_cache:>9}"
+            f"   ({len(result.model_dump_json())} bytes)"
+        )
+
+    service.close()
+
+
+if __name__ == "__main__":
+    main()
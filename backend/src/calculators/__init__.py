@@ -1,16 +1,64 @@
-from typing import Literal
+import os
+from typing import Any, Callable, Dict, Literal, Optional, Type, Union
 
 from src.calculators.base_calculator import BaseCalculator
+from src.calculators.cents_calculator import CentavosPRICECalculator, CentavosSACCalculator
 from src.calculators.price_calculator import PRICECalculator
 from src.calculators.sac_calculator import SACCalculator
 
+# Backends "python" e "centavos" não dependem do NumPy: o vetorizado só é
+# importado quando usado
+_VETORIZADOS = {"VectorizedPRICECalculator", "VectorizedSACCalculator"}
+
+
+Calculadoras = Dict[str, Type[BaseCalculator]]
+
+
+def _backend_numpy() -> Calculadoras:
+    from src.calculators.vectorized_calculator import (
+        VectorizedPRICECalculator,
+        VectorizedSACCalculator,
+    )
+
+    return {"PRICE": VectorizedPRICECalculator, "SAC": VectorizedSACCalculator}
+
+
+def __getattr__(nome: str) -> Any:
+    if nome in _VETORIZADOS:
+        from src.calculators import vectorized_calculator
+
+        return getattr(vectorized_calculator, nome)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
 
 class CalculatorFactory:
-    _calculators = {"PRICE": PRICECalculator, "SAC": SACCalculator}
+    _calculators: Calculadoras = {"PRICE": PRICECalculator, "SAC": SACCalculator}
+
+    _backends: Dict[str, Union[Calculadoras, Callable[[], Calculadoras]]] = {
+        "python": _calculators,
+        "numpy": _backend_numpy,
+        "centavos": {"PRICE": CentavosPRICECalculator, "SAC": CentavosSACCalculator},
+    }
 
     @classmethod
-    def create(cls, tipo_amortizacao: Literal["PRICE", "SAC"]) -> BaseCalculator:
-        calculator_class = cls._calculators.get(tipo_amortizacao)
+    def create(
+        cls, tipo_amortizacao: Literal["PRICE", "SAC"], backend: Optional[str] = None
+    ) -> BaseCalculator:
+        backend = backend or cls.backend_padrao()
+        calculators = cls._backends.get(backend)
+
+        if calculators is None:
+            backends_validos = ", ".join(cls._backends.keys())
+            raise ValueError(
+                f"Backend de cálculo '{backend}' não suportado. "
+                f"Backends válidos: {backends_validos}"
+            )
+
+        if callable(calculators):
+            calculators = calculators()
+
+        calculator_class = calculators.get(tipo_amortizacao)
 
         if calculator_class is None:
             tipos_validos = ", ".join(cls._calculators.keys())
@@ -25,5 +73,22 @@ class CalculatorFactory:
     def tipos_disponiveis(cls) -> list[str]:
         return list(cls._calculators.keys())
 
+    @classmethod
+    def backends_disponiveis(cls) -> list[str]:
+        return list(cls._backends.keys())
+
+    @classmethod
+    def backend_padrao(cls) -> str:
+        return os.getenv("CALCULATOR_BACKEND", "python")
+
 
-__all__ = ["BaseCalculator", "PRICECalculator", "SACCalculator", "CalculatorFactory"]
+__all__ = [
+    "BaseCalculator",
+    "PRICECalculator",
+    "SACCalculator",
+    "VectorizedPRICECalculator",
+    "VectorizedSACCalculator",
+    "CentavosPRICECalculator",
+    "CentavosSACCalculator",
+    "CalculatorFactory",
+]
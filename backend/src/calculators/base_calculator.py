@@ -1,16 +1,187 @@
+import math
 from abc import ABC, abstractmethod
-from typing import List
+from array import array
+from typing import Iterator, Optional, Sequence
 
-from src.models.domain import Parcela, TabelaAmortizacao
+from src.models.domain import (
+    AmortizacaoExtraordinaria,
+    Parcela,
+    ResumoAmortizacao,
+    TabelaAmortizacao,
+    indices_resumo,
+)
 
 
 class BaseCalculator(ABC):
+    TIPO_AMORTIZACAO: str
+
     @abstractmethod
     def calcular(
-        self, valor_financiado: float, taxa_juros_mensal: float, prazo_meses: int
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
     ) -> TabelaAmortizacao:
+        """Tabela completa; `amortizacoes` são eventos em meses crescentes."""
+
+    def calcular_resumo(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        num_pontos: int = 12,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
+    ) -> ResumoAmortizacao:
+        """
+        Totais e pontos do resumo calculados em forma fechada.
+
+        Cada parcela do resumo é obtida diretamente pelo mês, sem gerar a tabela
+        completa: O(num_pontos) em vez de O(prazo_meses). Com amortizações
+        extraordinárias a forma fechada vale só entre eventos, então o resumo
+        sai da tabela com os eventos.
+        """
+        if amortizacoes:
+            tabela = self.calcular(valor_financiado, taxa_juros_mensal, prazo_meses, amortizacoes)
+            return self._resumo_da_tabela(tabela, num_pontos)
+
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+
+        parcelas = [
+            self._parcela_do_mes(valor_financiado, taxa_decimal, prazo_meses, indice + 1)
+            for indice in indices_resumo(prazo_meses, num_pontos)
+        ]
+
+        total_pago, total_juros = self._totais_fechados(valor_financiado, taxa_decimal, prazo_meses)
+
+        return ResumoAmortizacao(
+            parcelas=parcelas,
+            total_pago=total_pago,
+            total_juros=total_juros,
+            prazo_meses=prazo_meses,
+            num_pontos=num_pontos,
+        )
+
+    def gerar_parcelas(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        de_mes: int = 1,
+        ate_mes: Optional[int] = None,
+    ) -> Iterator[Parcela]:
+        """
+        Gera as parcelas de `de_mes` a `ate_mes` (inclusive), uma por vez.
+
+        Cada parcela vem da forma fechada do mês, então uma janela no meio do
+        prazo custa apenas o número de meses da janela.
+        """
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        ate_mes = prazo_meses if ate_mes is None else ate_mes
+        if not 1 <= de_mes <= ate_mes <= prazo_meses:
+            raise ValueError(f"Intervalo de meses inválido: {de_mes} a {ate_mes}")
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+
+        # Validação acima é imediata; só a geração das parcelas é preguiçosa
+        return (
+            self._parcela_do_mes(valor_financiado, taxa_decimal, prazo_meses, mes)
+            for mes in range(de_mes, ate_mes + 1)
+        )
+
+    @abstractmethod
+    def valor_maximo_financiado(
+        self, parcela_maxima: float, taxa_juros_mensal: float, prazo_meses: int
+    ) -> float:
+        """Maior valor financiado cuja maior parcela não passa de `parcela_maxima`."""
+
+    def prazo_minimo(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        parcela_maxima: float,
+        prazo_min: int = 12,
+        prazo_max: int = 480,
+    ) -> Optional[int]:
+        """
+        Menor prazo em [prazo_min, prazo_max] cuja maior parcela cabe em `parcela_maxima`.
+
+        Retorna None se nem o prazo máximo atende.
+        """
+        self._validar_parcela_maxima(parcela_maxima)
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_min)
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+
+        estimativa = self._prazo_estimado(valor_financiado, taxa_decimal, parcela_maxima)
+        if estimativa is None:
+            return None
+
+        prazo = min(max(math.ceil(estimativa), prazo_min), prazo_max + 1)
+
+        # Ajuste de arredondamento de ponto flutuante ao redor da igualdade
+        while prazo > prazo_min and (
+            self._maior_parcela(valor_financiado, taxa_decimal, prazo - 1) <= parcela_maxima
+        ):
+            prazo -= 1
+        while prazo <= prazo_max and (
+            self._maior_parcela(valor_financiado, taxa_decimal, prazo) > parcela_maxima
+        ):
+            prazo += 1
+
+        return prazo if prazo <= prazo_max else None
+
+    @abstractmethod
+    def _prazo_estimado(
+        self, valor_financiado: float, taxa_decimal: float, parcela_maxima: float
+    ) -> Optional[float]:
+        """Prazo (real) em que a maior parcela iguala `parcela_maxima`; None se não existe."""
+
+    @abstractmethod
+    def _maior_parcela(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int
+    ) -> float:
         pass
 
+    @abstractmethod
+    def _parcela_do_mes(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int, mes: int
+    ) -> Parcela:
+        pass
+
+    @abstractmethod
+    def _totais_fechados(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int
+    ) -> tuple[float, float]:
+        pass
+
+    def _calcular_com_amortizacoes(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria],
+    ) -> TabelaAmortizacao:
+        # Importado sob demanda: o motor de eventos depende do NumPy, a tabela sem eventos não
+        from src.calculators.prepayment_calculator import calcular_com_amortizacoes
+
+        return calcular_com_amortizacoes(
+            self.TIPO_AMORTIZACAO, valor_financiado, taxa_juros_mensal, prazo_meses, amortizacoes
+        )
+
+    def _resumo_da_tabela(self, tabela: TabelaAmortizacao, num_pontos: int) -> ResumoAmortizacao:
+        # Prazo efetivo: REDUZIR_PRAZO e quitação antecipada encurtam a tabela
+        return ResumoAmortizacao(
+            parcelas=tabela.resumo(num_pontos),
+            total_pago=tabela.total_pago,
+            total_juros=tabela.total_juros,
+            prazo_meses=len(tabela.parcelas),
+            num_pontos=num_pontos,
+        )
+
     def _converter_taxa_percentual_para_decimal(self, taxa_percentual: float) -> float:
         return taxa_percentual / 100
 
@@ -26,8 +197,22 @@ class BaseCalculator(ABC):
         if prazo_meses <= 0:
             raise ValueError("Prazo deve ser maior que zero")
 
-    def _calcular_totais(self, parcelas: List[Parcela]) -> tuple[float, float]:
-        total_pago = sum(p.valor_parcela for p in parcelas)
-        total_juros = sum(p.valor_juros for p in parcelas)
+    def _validar_parcela_maxima(self, parcela_maxima: float) -> None:
+        if parcela_maxima <= 0:
+            raise ValueError("Parcela máxima deve ser maior que zero")
 
-        return total_pago, total_juros
+    def _montar_tabela(
+        self,
+        valores_parcela: array,
+        valores_juros: array,
+        valores_amortizacao: array,
+        saldos_devedores: array,
+    ) -> TabelaAmortizacao:
+        return TabelaAmortizacao(
+            valores_parcela=valores_parcela,
+            valores_juros=valores_juros,
+            valores_amortizacao=valores_amortizacao,
+            saldos_devedores=saldos_devedores,
+            total_pago=sum(valores_parcela),
+            total_juros=sum(valores_juros),
+        )
@@ -0,0 +1,136 @@
+from array import array
+from typing import Iterator, Optional, Sequence, Tuple
+
+from src.calculators.base_calculator import BaseCalculator
+from src.calculators.price_calculator import PRICECalculator
+from src.calculators.sac_calculator import SACCalculator
+from src.models.domain import (
+    AmortizacaoExtraordinaria,
+    Parcela,
+    ResumoAmortizacao,
+    TabelaAmortizacao,
+)
+
+# Taxa mensal como inteiro: taxa decimal × 10^10 (taxa percentual com 8 casas)
+ESCALA_TAXA = 10**10
+
+ColunasCentavos = Tuple[array, array, array, array]
+
+
+def colunas_em_centavos(
+    tipo_amortizacao: str, valor_financiado: float, taxa_juros_mensal: float, prazo_meses: int
+) -> ColunasCentavos:
+    """
+    Colunas (parcela, juros, amortização, saldo) em centavos inteiros.
+
+    Juros de cada mês são arredondados para o centavo (metade para cima) em
+    aritmética inteira. A parcela PRICE (ou a amortização SAC) é arredondada
+    uma vez; a última parcela quita o saldo restante e absorve o resíduo dos
+    arredondamentos, então o saldo final é exatamente zero.
+    """
+    saldo = round(valor_financiado * 100)
+    taxa = round(taxa_juros_mensal / 100 * ESCALA_TAXA)
+    metade = ESCALA_TAXA // 2
+
+    if tipo_amortizacao == "PRICE":
+        taxa_decimal = taxa_juros_mensal / 100
+        if taxa_decimal == 0:
+            parcela_fixa = round(saldo / prazo_meses)
+        else:
+            fator = (1 + taxa_decimal) ** prazo_meses
+            parcela_fixa = round(saldo * taxa_decimal * fator / (fator - 1))
+    elif tipo_amortizacao == "SAC":
+        amortizacao_fixa = round(saldo / prazo_meses)
+    else:
+        raise ValueError(f"Tipo de amortização '{tipo_amortizacao}' não suportado")
+
+    parcelas = array("q")
+    juros_mensais = array("q")
+    amortizacoes = array("q")
+    saldos = array("q")
+
+    for mes in range(1, prazo_meses + 1):
+        juros = (saldo * taxa + metade) // ESCALA_TAXA
+
+        if mes == prazo_meses:
+            amortizacao = saldo
+        elif tipo_amortizacao == "PRICE":
+            amortizacao = min(parcela_fixa - juros, saldo)
+        else:
+            amortizacao = min(amortizacao_fixa, saldo)
+
+        saldo -= amortizacao
+
+        parcelas.append(amortizacao + juros)
+        juros_mensais.append(juros)
+        amortizacoes.append(amortizacao)
+        saldos.append(saldo)
+
+    return parcelas, juros_mensais, amortizacoes, saldos
+
+
+class CalculoEmCentavos(BaseCalculator):
+    """
+    Tabela calculada em centavos inteiros (backend "centavos").
+
+    As linhas arredondadas somam exatamente os totais, e a última parcela
+    absorve o resíduo. Como os valores dependem dos arredondamentos mês a mês,
+    resumo e janelas de meses saem da tabela completa, não da forma fechada.
+    Amortizações extraordinárias ainda não são calculadas em centavos.
+    """
+
+    def calcular(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
+    ) -> TabelaAmortizacao:
+        if amortizacoes:
+            raise ValueError("Backend 'centavos' não suporta amortizações extraordinárias")
+
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        return TabelaAmortizacao.de_centavos(
+            *colunas_em_centavos(
+                self.TIPO_AMORTIZACAO, valor_financiado, taxa_juros_mensal, prazo_meses
+            )
+        )
+
+    def calcular_resumo(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        num_pontos: int = 12,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
+    ) -> ResumoAmortizacao:
+        tabela = self.calcular(valor_financiado, taxa_juros_mensal, prazo_meses, amortizacoes)
+
+        return self._resumo_da_tabela(tabela, num_pontos)
+
+    def gerar_parcelas(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        de_mes: int = 1,
+        ate_mes: Optional[int] = None,
+    ) -> Iterator[Parcela]:
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        ate_mes = prazo_meses if ate_mes is None else ate_mes
+        if not 1 <= de_mes <= ate_mes <= prazo_meses:
+            raise ValueError(f"Intervalo de meses inválido: {de_mes} a {ate_mes}")
+
+        tabela = self.calcular(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        return (tabela.linha(indice) for indice in range(de_mes - 1, ate_mes))
+
+
+class CentavosPRICECalculator(CalculoEmCentavos, PRICECalculator):
+    TIPO_AMORTIZACAO = "PRICE"
+
+
+class CentavosSACCalculator(CalculoEmCentavos, SACCalculator):
+    TIPO_AMORTIZACAO = "SAC"
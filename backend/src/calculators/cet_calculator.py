@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from src.calculators.vectorized_calculator import LoteAmortizacao
+from src.models.domain import EncargosFinanciamento, TabelaAmortizacao
+
+# Intervalo de busca da taxa mensal: de −50% a 100% ao mês
+_TAXA_MINIMA = -0.5
+_TAXA_MAXIMA = 1.0
+_TAXA_INICIAL = 0.01
+
+
+@dataclass
+class ResultadoCET:
+    """CET mensal e anual, em %, e o fluxo de caixa usado no cálculo."""
+
+    cet_mensal: float
+    cet_anual: float
+    fluxo: np.ndarray
+
+
+def calcular_cet(
+    tabela: TabelaAmortizacao,
+    valor_financiado: float,
+    encargos: EncargosFinanciamento,
+    valor_imovel: float = 0.0,
+) -> ResultadoCET:
+    """CET de uma tabela de amortização acrescida dos encargos."""
+    fluxo = fluxos_de_caixa(
+        np.asarray(tabela.valores_parcela, dtype=np.float64)[None, :],
+        np.asarray(tabela.saldos_devedores, dtype=np.float64)[None, :],
+        np.array([valor_financiado]),
+        encargos,
+        np.array([valor_imovel]),
+    )
+
+    cet_mensal, cet_anual = cet_de_fluxos(fluxo)
+
+    return ResultadoCET(
+        cet_mensal=float(cet_mensal[0]), cet_anual=float(cet_anual[0]), fluxo=fluxo[0]
+    )
+
+
+def calcular_cet_lote(
+    lote: LoteAmortizacao,
+    valores_financiados: np.ndarray,
+    encargos: EncargosFinanciamento,
+    valores_imovel: Union[float, np.ndarray] = 0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """CET mensal e anual (em %) de cada financiamento de um lote, em uma chamada."""
+    fluxos = fluxos_de_caixa(
+        lote.parcela,
+        lote.saldo,
+        valores_financiados,
+        encargos,
+        np.broadcast_to(np.asarray(valores_imovel, dtype=np.float64), lote.prazos.shape),
+        prazos=lote.prazos,
+    )
+
+    return cet_de_fluxos(fluxos)
+
+
+def fluxos_de_caixa(
+    parcelas: np.ndarray,
+    saldos: np.ndarray,
+    valores_financiados: np.ndarray,
+    encargos: EncargosFinanciamento,
+    valores_imovel: np.ndarray,
+    prazos: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Fluxos (financiamentos × meses+1) do ponto de vista do tomador.
+
+    Mês 0: valor liberado menos tarifas iniciais (positivo). Meses seguintes:
+    parcela + administração + MIP sobre o saldo antes do pagamento + DFI sobre
+    o valor do imóvel (negativos). Meses além de `prazos` ficam zerados.
+    """
+    valores = np.asarray(valores_financiados, dtype=np.float64)
+    imoveis = np.asarray(valores_imovel, dtype=np.float64)
+
+    if encargos.tarifas_iniciais >= valores.min():
+        raise ValueError("Tarifas iniciais devem ser menores que o valor financiado")
+
+    saldos_anteriores = np.empty_like(saldos)
+    saldos_anteriores[:, 0] = valores
+    saldos_anteriores[:, 1:] = saldos[:, :-1]
+
+    pagamentos = (
+        parcelas
+        + encargos.taxa_administracao_mensal
+        + saldos_anteriores * (encargos.mip_percentual_mensal / 100)
+        + imoveis[:, None] * (encargos.dfi_percentual_mensal / 100)
+    )
+
+    if prazos is not None:
+        meses = np.arange(1, parcelas.shape[1] + 1)
+        pagamentos = np.where(meses[None, :] <= np.asarray(prazos)[:, None], pagamentos, 0.0)
+
+    fluxos = np.empty((parcelas.shape[0], parcelas.shape[1] + 1))
+    fluxos[:, 0] = valores - encargos.tarifas_iniciais
+    fluxos[:, 1:] = -pagamentos
+
+    return fluxos
+
+
+def cet_de_fluxos(fluxos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """CET mensal e anual (em %) de cada linha de fluxos."""
+    taxa = taxa_interna_retorno(fluxos)
+
+    return taxa * 100, np.expm1(12 * np.log1p(taxa)) * 100
+
+
+def taxa_interna_retorno(
+    fluxos: np.ndarray, tolerancia: float = 1e-10, max_iteracoes: int = 100
+) -> np.ndarray:
+    """
+    TIR mensal (decimal) de cada linha de `fluxos`, todas resolvidas juntas.
+
+    Newton com intervalo de segurança: cada linha mantém um intervalo onde o
+    VPL troca de sinal; passos de Newton que saem dele viram bissecção. Linhas
+    sem troca de sinal em [−50%, 100%] ao mês resultam em NaN.
+    """
+    fluxos = np.atleast_2d(np.asarray(fluxos, dtype=np.float64))
+    total = fluxos.shape[0]
+    periodos = np.arange(fluxos.shape[1], dtype=np.float64)
+
+    baixo = np.full(total, _TAXA_MINIMA)
+    alto = np.full(total, _TAXA_MAXIMA)
+    vpl_baixo, _ = _vpl(fluxos, periodos, baixo)
+    vpl_alto, _ = _vpl(fluxos, periodos, alto)
+
+    valida = np.sign(vpl_baixo) != np.sign(vpl_alto)
+    taxa = np.full(total, _TAXA_INICIAL)
+    ativas = np.flatnonzero(valida)
+
+    for _ in range(max_iteracoes):
+        if ativas.size == 0:
+            break
+
+        r = taxa[ativas]
+        vpl, derivada = _vpl(fluxos[ativas], periodos, r)
+
+        # Mantém o intervalo: substitui o extremo com o mesmo sinal do VPL
+        lado_baixo = np.sign(vpl) == np.sign(vpl_baixo[ativas])
+        baixo[ativas] = np.where(lado_baixo, r, baixo[ativas])
+        vpl_baixo[ativas] = np.where(lado_baixo, vpl, vpl_baixo[ativas])
+        alto[ativas] = np.where(lado_baixo, alto[ativas], r)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            candidata = r - vpl / derivada
+
+        dentro = (candidata > baixo[ativas]) & (candidata < alto[ativas])
+        nova = np.where(dentro, candidata, (baixo[ativas] + alto[ativas]) / 2)
+
+        taxa[ativas] = nova
+        ativas = ativas[(np.abs(nova - r) > tolerancia) & (vpl != 0)]
+
+    taxa[~valida] = np.nan
+
+    return taxa
+
+
+def _vpl(
+    fluxos: np.ndarray, periodos: np.ndarray, taxas: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """VPL de cada linha e sua derivada em relação à taxa."""
+    descontos = (1 + taxas[:, None]) ** -periodos[None, :]
+    descontados = fluxos * descontos
+
+    vpl = descontados.sum(axis=1)
+    derivada = -(descontados * periodos[None, :]).sum(axis=1) / (1 + taxas)
+
+    return vpl, derivada
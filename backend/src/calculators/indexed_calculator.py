@@ -0,0 +1,127 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+from src.calculators.segments import Colunas, tabela_de_colunas
+from src.models.domain import TabelaAmortizacao
+
+Trajetoria = Union[float, Sequence[float], np.ndarray]
+
+
+def calcular_indexado(
+    tipo_amortizacao: str,
+    valor_financiado: float,
+    taxas_juros_mensais: Trajetoria,
+    correcoes_mensais: Trajetoria,
+    prazo_meses: int,
+) -> TabelaAmortizacao:
+    """
+    Tabela PRICE ou SAC com saldo corrigido mensalmente (TR, IPCA).
+
+    Taxas e correções são percentuais mensais: um valor único vale para todos
+    os meses, uma sequência dá um valor por mês. A cada mês k:
+
+    - o saldo é corrigido: S' = S_{k-1}·(1 + c_k);
+    - os juros incidem sobre o saldo corrigido: J_k = S'·i_k;
+    - PRICE recalcula a parcela para o prazo restante; SAC divide o saldo
+      corrigido pelos meses restantes.
+    """
+    return tabela_de_colunas(
+        colunas_indexadas(
+            tipo_amortizacao, valor_financiado, taxas_juros_mensais, correcoes_mensais, prazo_meses
+        )
+    )
+
+
+def colunas_indexadas(
+    tipo_amortizacao: str,
+    valor_financiado: float,
+    taxas_juros_mensais: Trajetoria,
+    correcoes_mensais: Trajetoria,
+    prazo_meses: int,
+) -> Colunas:
+    """
+    Colunas (parcela, juros, amortização, saldo) da tabela indexada.
+
+    Em ambos os sistemas a amortização do mês é uma fração a_k do saldo
+    corrigido, que depende só da taxa e do prazo restante r = n − k + 1:
+
+    - PRICE: a_k = i_k / ((1+i_k)^r − 1)  (ou 1/r com taxa zero)
+    - SAC:   a_k = 1/r
+
+    Logo S_k = S_0 · Π (1 + c_j)(1 − a_j), calculado com um único cumprod.
+
+    Trajetórias 2-D (trajetórias × meses) calculam várias tabelas de uma vez;
+    o mês é sempre o último eixo.
+    """
+    if valor_financiado <= 0:
+        raise ValueError("Valor financiado deve ser maior que zero")
+    if prazo_meses <= 0:
+        raise ValueError("Prazo deve ser maior que zero")
+
+    taxas = _trajetoria(taxas_juros_mensais, prazo_meses, "taxas de juros") / 100
+    correcoes = _trajetoria(correcoes_mensais, prazo_meses, "correções") / 100
+
+    if np.any(taxas < 0):
+        raise ValueError("Taxa de juros não pode ser negativa")
+    if np.any(correcoes <= -1):
+        raise ValueError("Correção mensal deve ser maior que -100%")
+
+    restantes = np.arange(prazo_meses, 0, -1, dtype=np.float64)
+
+    if tipo_amortizacao == "PRICE":
+        # Taxa zero: evita divisão por zero e usa a fração 1/r
+        taxas_seguras = np.where(taxas > 0, taxas, 1.0)
+        fracao = np.where(
+            taxas > 0, taxas_seguras / np.expm1(restantes * np.log1p(taxas_seguras)), 1 / restantes
+        )
+    elif tipo_amortizacao == "SAC":
+        fracao = 1 / restantes
+    else:
+        raise ValueError(f"Tipo de amortização '{tipo_amortizacao}' não suportado")
+
+    # Último mês quita o saldo corrigido exatamente
+    fracao[..., -1] = 1.0
+
+    fator_correcao = 1 + correcoes
+    saldos = valor_financiado * np.cumprod(fator_correcao * (1 - fracao), axis=-1)
+
+    saldos_corrigidos = np.empty_like(saldos)
+    saldos_corrigidos[..., 0] = valor_financiado
+    saldos_corrigidos[..., 1:] = saldos[..., :-1]
+    saldos_corrigidos *= fator_correcao
+
+    juros = saldos_corrigidos * taxas
+    amortizacao = saldos_corrigidos * fracao
+
+    return amortizacao + juros, juros, amortizacao, saldos
+
+
+def projetar_correcoes(historico_mensal: Sequence[float], prazo_meses: int) -> np.ndarray:
+    """
+    Trajetória de correção projetada a partir da série histórica do indicador.
+
+    Repete a média geométrica das variações mensais observadas (em %).
+    """
+    historico = np.asarray(historico_mensal, dtype=np.float64)
+
+    if historico.size == 0:
+        raise ValueError("Série histórica do indicador vazia")
+    if np.any(historico <= -100):
+        raise ValueError("Variação mensal deve ser maior que -100%")
+
+    media = np.expm1(np.log1p(historico / 100).mean()) * 100
+
+    return np.full(prazo_meses, media)
+
+
+def _trajetoria(valores: Trajetoria, prazo_meses: int, nome: str) -> np.ndarray:
+    trajetoria = np.asarray(valores, dtype=np.float64)
+
+    if trajetoria.ndim == 0:
+        return np.full(prazo_meses, float(trajetoria))
+
+    if trajetoria.shape[-1] != prazo_meses:
+        raise ValueError(f"Trajetória de {nome} deve ter {prazo_meses} meses")
+
+    return trajetoria
@@ -0,0 +1,155 @@
+import math
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+from src.calculators.segments import Colunas, segmento_price, segmento_sac, tabela_de_colunas
+from src.models.domain import AmortizacaoExtraordinaria, TabelaAmortizacao
+
+# Tolerância para prazos calculados em ponto flutuante (ex.: 99.9999999997 meses)
+_TOLERANCIA_PRAZO = 1e-9
+
+
+def _parcela_price(saldo: float, taxa_decimal: float, prazo_meses: int) -> float:
+    if taxa_decimal == 0:
+        return saldo / prazo_meses
+
+    fator = (1 + taxa_decimal) ** prazo_meses
+    return saldo * taxa_decimal * fator / (fator - 1)
+
+
+def _prazo_price(saldo: float, taxa_decimal: float, parcela: float) -> int:
+    # n = −ln(1 − S·i/PMT) / ln(1+i)
+    if taxa_decimal == 0:
+        prazo = saldo / parcela
+    else:
+        prazo = -math.log(1 - saldo * taxa_decimal / parcela) / math.log(1 + taxa_decimal)
+
+    return max(1, math.ceil(prazo - _TOLERANCIA_PRAZO))
+
+
+def _prazo_sac(saldo: float, taxa_decimal: float, amortizacao: float) -> int:
+    return max(1, math.ceil(saldo / amortizacao - _TOLERANCIA_PRAZO))
+
+
+# Por tipo: (segmento, parâmetro para um prazo, prazo para um parâmetro).
+# O parâmetro é a parcela fixa (PRICE) ou a amortização constante (SAC).
+_SISTEMAS: Dict[str, tuple[Callable[..., Colunas], Callable, Callable]] = {
+    "PRICE": (segmento_price, _parcela_price, _prazo_price),
+    "SAC": (segmento_sac, lambda saldo, taxa, prazo: saldo / prazo, _prazo_sac),
+}
+
+
+def calcular_com_amortizacoes(
+    tipo_amortizacao: str,
+    valor_financiado: float,
+    taxa_juros_mensal: float,
+    prazo_meses: int,
+    eventos: Sequence[AmortizacaoExtraordinaria],
+) -> TabelaAmortizacao:
+    """
+    Tabela PRICE ou SAC com amortizações extraordinárias.
+
+    Entre dois eventos o sistema segue sua forma fechada, então cada trecho é
+    calculado de uma vez (segmento_price/segmento_sac). A cada evento:
+
+    - o valor extra entra na amortização (e na parcela) do mês do evento;
+    - REDUZIR_PARCELA recalcula a parcela (PRICE) ou a amortização (SAC)
+      para o prazo restante;
+    - REDUZIR_PRAZO mantém parcela/amortização e encurta o prazo restante.
+
+    A última parcela quita exatamente o saldo. O custo é proporcional ao
+    número de eventos, não a meses × eventos.
+    """
+    if tipo_amortizacao not in _SISTEMAS:
+        raise ValueError(f"Tipo de amortização '{tipo_amortizacao}' não suportado")
+
+    if valor_financiado <= 0:
+        raise ValueError("Valor financiado deve ser maior que zero")
+    if taxa_juros_mensal < 0:
+        raise ValueError("Taxa de juros não pode ser negativa")
+    if prazo_meses <= 0:
+        raise ValueError("Prazo deve ser maior que zero")
+
+    _validar_eventos(eventos, prazo_meses)
+
+    segmento, parametro_para_prazo, prazo_para_parametro = _SISTEMAS[tipo_amortizacao]
+    taxa_decimal = taxa_juros_mensal / 100
+
+    saldo = valor_financiado
+    mes_atual = 0
+    prazo_final = prazo_meses
+    parametro = parametro_para_prazo(saldo, taxa_decimal, prazo_meses)
+    trechos: List[Colunas] = []
+
+    for evento in eventos:
+        if evento.mes >= prazo_final:
+            raise ValueError(
+                f"Amortização extraordinária no mês {evento.mes} após a quitação "
+                f"(mês {prazo_final})"
+            )
+
+        parcela, juros, amortizacao, saldos = segmento(
+            saldo, taxa_decimal, parametro, evento.mes - mes_atual
+        )
+
+        extra = min(evento.valor, float(saldos[-1]))
+        parcela[-1] += extra
+        amortizacao[-1] += extra
+        saldos[-1] -= extra
+
+        trechos.append((parcela, juros, amortizacao, saldos))
+        saldo = float(saldos[-1])
+        mes_atual = evento.mes
+
+        if saldo <= 0:
+            saldos[-1] = 0.0
+            return tabela_de_colunas(_concatenar(trechos))
+
+        if evento.modo == "REDUZIR_PARCELA":
+            parametro = parametro_para_prazo(saldo, taxa_decimal, prazo_final - mes_atual)
+        else:
+            prazo_final = mes_atual + prazo_para_parametro(saldo, taxa_decimal, parametro)
+
+    parcela, juros, amortizacao, saldos = segmento(
+        saldo, taxa_decimal, parametro, prazo_final - mes_atual
+    )
+
+    # Última parcela quita o saldo remanescente (parcial após REDUZIR_PRAZO)
+    saldo_anterior = saldos[-2] if len(saldos) > 1 else saldo
+    amortizacao[-1] = saldo_anterior
+    parcela[-1] = saldo_anterior + juros[-1]
+    saldos[-1] = 0.0
+
+    trechos.append((parcela, juros, amortizacao, saldos))
+
+    return tabela_de_colunas(_concatenar(trechos))
+
+
+def _validar_eventos(eventos: Sequence[AmortizacaoExtraordinaria], prazo_meses: int) -> None:
+    mes_anterior = 0
+
+    for evento in eventos:
+        if evento.valor <= 0:
+            raise ValueError("Valor da amortização extraordinária deve ser maior que zero")
+
+        if evento.mes <= mes_anterior:
+            raise ValueError("Amortizações extraordinárias devem estar em meses crescentes")
+
+        if evento.mes >= prazo_meses:
+            raise ValueError(
+                f"Mês da amortização extraordinária deve estar entre 1 e {prazo_meses - 1}"
+            )
+
+        if evento.modo not in ("REDUZIR_PRAZO", "REDUZIR_PARCELA"):
+            raise ValueError(f"Modo de amortização '{evento.modo}' não suportado")
+
+        mes_anterior = evento.mes
+
+
+def _concatenar(trechos: List[Colunas]) -> Colunas:
+    parcela, juros, amortizacao, saldo = (
+        np.concatenate(coluna) for coluna in zip(*trechos, strict=True)
+    )
+
+    return parcela, juros, amortizacao, saldo
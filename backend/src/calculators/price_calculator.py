@@ -1,24 +1,33 @@
-from typing import List
+import math
+from array import array
+from typing import Optional, Sequence
 
 from src.calculators.base_calculator import BaseCalculator
-from src.models.domain import Parcela, TabelaAmortizacao
+from src.models.domain import AmortizacaoExtraordinaria, Parcela, TabelaAmortizacao
 
 
 class PRICECalculator(BaseCalculator):
+    TIPO_AMORTIZACAO = "PRICE"
+
     def calcular(
-        self, valor_financiado: float, taxa_juros_mensal: float, prazo_meses: int
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
     ) -> TabelaAmortizacao:
+        if amortizacoes:
+            return self._calcular_com_amortizacoes(
+                valor_financiado, taxa_juros_mensal, prazo_meses, amortizacoes
+            )
+
         self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
 
         taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
 
         parcela_fixa = self._calcular_parcela_price(valor_financiado, taxa_decimal, prazo_meses)
 
-        parcelas = self._gerar_tabela(valor_financiado, parcela_fixa, taxa_decimal, prazo_meses)
-
-        total_pago, total_juros = self._calcular_totais(parcelas)
-
-        return TabelaAmortizacao(parcelas=parcelas, total_pago=total_pago, total_juros=total_juros)
+        return self._gerar_tabela(valor_financiado, parcela_fixa, taxa_decimal, prazo_meses)
 
     def _calcular_parcela_price(
         self, valor_presente: float, taxa_decimal: float, num_parcelas: int
@@ -32,10 +41,46 @@ class PRICECalculator(BaseCalculator):
 
         return parcela
 
+    def valor_maximo_financiado(
+        self, parcela_maxima: float, taxa_juros_mensal: float, prazo_meses: int
+    ) -> float:
+        # Inversa da anuidade: P = PMT·(1 − (1+i)^−n)/i
+        self._validar_parcela_maxima(parcela_maxima)
+        self._validar_parametros(parcela_maxima, taxa_juros_mensal, prazo_meses)
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+
+        if taxa_decimal == 0:
+            return parcela_maxima * prazo_meses
+
+        return parcela_maxima * (1 - (1 + taxa_decimal) ** -prazo_meses) / taxa_decimal
+
+    def _prazo_estimado(
+        self, valor_financiado: float, taxa_decimal: float, parcela_maxima: float
+    ) -> Optional[float]:
+        if taxa_decimal == 0:
+            return valor_financiado / parcela_maxima
+
+        # Parcela só de juros nunca amortiza o saldo
+        if parcela_maxima <= valor_financiado * taxa_decimal:
+            return None
+
+        # n = −ln(1 − P·i/PMT) / ln(1+i)
+        return -math.log(1 - valor_financiado * taxa_decimal / parcela_maxima) / math.log(
+            1 + taxa_decimal
+        )
+
+    def _maior_parcela(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int
+    ) -> float:
+        return self._calcular_parcela_price(valor_financiado, taxa_decimal, prazo_meses)
+
     def _gerar_tabela(
         self, saldo_inicial: float, parcela_fixa: float, taxa_decimal: float, num_parcelas: int
-    ) -> List[Parcela]:
-        parcelas = []
+    ) -> TabelaAmortizacao:
+        valores_juros = array("d")
+        valores_amortizacao = array("d")
+        saldos_devedores = array("d")
         saldo_devedor = saldo_inicial
 
         for mes in range(1, num_parcelas + 1):
@@ -48,14 +93,51 @@ class PRICECalculator(BaseCalculator):
             if mes == num_parcelas:
                 saldo_devedor = 0.0
 
-            parcela = Parcela(
-                numero=mes,
-                valor_parcela=parcela_fixa,
-                valor_juros=juros,
-                valor_amortizacao=amortizacao,
-                saldo_devedor=saldo_devedor,
-            )
+            valores_juros.append(juros)
+            valores_amortizacao.append(amortizacao)
+            saldos_devedores.append(saldo_devedor)
+
+        valores_parcela = array("d", [parcela_fixa]) * num_parcelas
+
+        return self._montar_tabela(
+            valores_parcela, valores_juros, valores_amortizacao, saldos_devedores
+        )
+
+    def _saldo_apos(
+        self, valor_presente: float, parcela_fixa: float, taxa_decimal: float, mes: int
+    ) -> float:
+        # S_k = P·(1+i)^k − A·((1+i)^k − 1)/i
+        if taxa_decimal == 0:
+            return valor_presente - parcela_fixa * mes
+
+        crescimento = (1 + taxa_decimal) ** mes
+
+        return valor_presente * crescimento - parcela_fixa * (crescimento - 1) / taxa_decimal
+
+    def _parcela_do_mes(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int, mes: int
+    ) -> Parcela:
+        parcela_fixa = self._calcular_parcela_price(valor_financiado, taxa_decimal, prazo_meses)
+
+        saldo_anterior = self._saldo_apos(valor_financiado, parcela_fixa, taxa_decimal, mes - 1)
+        juros = saldo_anterior * taxa_decimal
+        amortizacao = parcela_fixa - juros
+
+        saldo_devedor = 0.0 if mes == prazo_meses else saldo_anterior - amortizacao
+
+        return Parcela(
+            numero=mes,
+            valor_parcela=parcela_fixa,
+            valor_juros=juros,
+            valor_amortizacao=amortizacao,
+            saldo_devedor=saldo_devedor,
+        )
+
+    def _totais_fechados(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int
+    ) -> tuple[float, float]:
+        parcela_fixa = self._calcular_parcela_price(valor_financiado, taxa_decimal, prazo_meses)
 
-            parcelas.append(parcela)
+        total_pago = parcela_fixa * prazo_meses
 
-        return parcelas
+        return total_pago, total_pago - valor_financiado
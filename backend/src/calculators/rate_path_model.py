@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+# Mínimo de observações mensais para estimar média, persistência e volatilidade
+MINIMO_OBSERVACOES = 12
+
+_PERSISTENCIA_MAXIMA = 0.99
+
+
+@dataclass(frozen=True)
+class ModeloTrajetorias:
+    """
+    Modelo AR(1) para a variação mensal de um indicador (SELIC, IPCA).
+
+    Trabalha em x = ln(1 + v/100), onde v é a variação mensal em %:
+
+        x_t = μ + φ·(x_{t-1} − μ) + σ·ε_t,   ε_t ~ N(0, 1)
+
+    e parte do último valor observado.
+    """
+
+    media: float
+    persistencia: float
+    volatilidade: float
+    ultimo: float
+    observacoes: int
+
+    @classmethod
+    def calibrar(cls, historico_mensal: Sequence[float]) -> "ModeloTrajetorias":
+        """Estima μ, φ e σ a partir das variações mensais (%), da mais antiga à mais recente."""
+        historico = np.asarray(historico_mensal, dtype=np.float64)
+
+        if historico.size < MINIMO_OBSERVACOES:
+            raise ValueError(
+                f"Série histórica precisa de pelo menos {MINIMO_OBSERVACOES} meses "
+                f"({historico.size} informados)"
+            )
+        if np.any(historico <= -100):
+            raise ValueError("Variação mensal deve ser maior que -100%")
+
+        x = np.log1p(historico / 100)
+        media = float(x.mean())
+        desvios = x - media
+
+        anteriores, seguintes = desvios[:-1], desvios[1:]
+        variancia = float(anteriores @ anteriores)
+        persistencia = float(anteriores @ seguintes) / variancia if variancia > 0 else 0.0
+        persistencia = min(max(persistencia, 0.0), _PERSISTENCIA_MAXIMA)
+
+        residuos = seguintes - persistencia * anteriores
+
+        return cls(
+            media=media,
+            persistencia=persistencia,
+            volatilidade=float(residuos.std(ddof=1)),
+            ultimo=float(x[-1]),
+            observacoes=int(historico.size),
+        )
+
+    def gerar(
+        self, num_trajetorias: int, meses: int, rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """Matriz (trajetórias × meses) de variações mensais em %."""
+        rng = rng or np.random.default_rng()
+
+        # Gerada como meses × trajetórias: a recorrência é sequencial nos meses e
+        # cada passo opera sobre uma linha contígua com todas as trajetórias.
+        choques = rng.standard_normal((meses, num_trajetorias))
+        choques *= self.volatilidade
+
+        desvio = np.full(num_trajetorias, self.ultimo - self.media)
+        for mes in range(meses):
+            desvio *= self.persistencia
+            desvio += choques[mes]
+            choques[mes] = desvio
+
+        choques += self.media
+        np.expm1(choques, out=choques)
+        choques *= 100
+
+        return np.ascontiguousarray(choques.T)
@@ -1,36 +1,47 @@
-from typing import List
+import math
+from array import array
+from typing import Optional, Sequence
 
 from src.calculators.base_calculator import BaseCalculator
-from src.models.domain import Parcela, TabelaAmortizacao
+from src.calculators.price_calculator import PRICECalculator
+from src.models.domain import AmortizacaoExtraordinaria, Parcela, TabelaAmortizacao
 
 
 class SACCalculator(BaseCalculator):
+    TIPO_AMORTIZACAO = "SAC"
 
     def calcular(
-        self, valor_financiado: float, taxa_juros_mensal: float, prazo_meses: int
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
     ) -> TabelaAmortizacao:
+        if amortizacoes:
+            return self._calcular_com_amortizacoes(
+                valor_financiado, taxa_juros_mensal, prazo_meses, amortizacoes
+            )
+
         self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
 
         taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
 
         amortizacao_constante = valor_financiado / prazo_meses
 
-        parcelas = self._gerar_tabela(
+        return self._gerar_tabela(
             valor_financiado, amortizacao_constante, taxa_decimal, prazo_meses
         )
 
-        total_pago, total_juros = self._calcular_totais(parcelas)
-
-        return TabelaAmortizacao(parcelas=parcelas, total_pago=total_pago, total_juros=total_juros)
-
     def _gerar_tabela(
         self,
         saldo_inicial: float,
         amortizacao_constante: float,
         taxa_decimal: float,
         num_parcelas: int,
-    ) -> List[Parcela]:
-        parcelas = []
+    ) -> TabelaAmortizacao:
+        valores_parcela = array("d")
+        valores_juros = array("d")
+        saldos_devedores = array("d")
         saldo_devedor = saldo_inicial
 
         for mes in range(1, num_parcelas + 1):
@@ -45,17 +56,68 @@ class SACCalculator(BaseCalculator):
             if mes == num_parcelas:
                 saldo_devedor = 0.0
 
-            parcela = Parcela(
-                numero=mes,
-                valor_parcela=valor_parcela,
-                valor_juros=juros,
-                valor_amortizacao=amortizacao,
-                saldo_devedor=saldo_devedor,
-            )
+            valores_parcela.append(valor_parcela)
+            valores_juros.append(juros)
+            saldos_devedores.append(saldo_devedor)
 
-            parcelas.append(parcela)
+        valores_amortizacao = array("d", [amortizacao_constante]) * num_parcelas
 
-        return parcelas
+        return self._montar_tabela(
+            valores_parcela, valores_juros, valores_amortizacao, saldos_devedores
+        )
+
+    def _parcela_do_mes(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int, mes: int
+    ) -> Parcela:
+        amortizacao = valor_financiado / prazo_meses
+
+        # S_{k-1} = P − (k−1)·A
+        saldo_anterior = valor_financiado - amortizacao * (mes - 1)
+        juros = saldo_anterior * taxa_decimal
+
+        saldo_devedor = 0.0 if mes == prazo_meses else saldo_anterior - amortizacao
+
+        return Parcela(
+            numero=mes,
+            valor_parcela=amortizacao + juros,
+            valor_juros=juros,
+            valor_amortizacao=amortizacao,
+            saldo_devedor=saldo_devedor,
+        )
+
+    def _totais_fechados(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int
+    ) -> tuple[float, float]:
+        # Juros totais: i·P·(n+1)/2
+        total_juros = taxa_decimal * valor_financiado * (prazo_meses + 1) / 2
+
+        return valor_financiado + total_juros, total_juros
+
+    def valor_maximo_financiado(
+        self, parcela_maxima: float, taxa_juros_mensal: float, prazo_meses: int
+    ) -> float:
+        # A primeira parcela é a maior: PMT = P/n + P·i  =>  P = PMT/(1/n + i)
+        self._validar_parcela_maxima(parcela_maxima)
+        self._validar_parametros(parcela_maxima, taxa_juros_mensal, prazo_meses)
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+
+        return parcela_maxima / (1 / prazo_meses + taxa_decimal)
+
+    def _prazo_estimado(
+        self, valor_financiado: float, taxa_decimal: float, parcela_maxima: float
+    ) -> Optional[float]:
+        # Primeira parcela P/n + P·i <= PMT  =>  n >= P / (PMT − P·i)
+        folga = parcela_maxima - valor_financiado * taxa_decimal
+        if folga <= 0:
+            return None
+
+        return valor_financiado / folga
+
+    def _maior_parcela(
+        self, valor_financiado: float, taxa_decimal: float, prazo_meses: int
+    ) -> float:
+        return self.calcular_primeira_parcela(valor_financiado, taxa_decimal * 100, prazo_meses)
 
     def calcular_primeira_parcela(
         self, valor_financiado: float, taxa_juros_mensal: float, prazo_meses: int
@@ -77,3 +139,43 @@ class SACCalculator(BaseCalculator):
         juros_ultimo_mes = saldo_antes_ultima * taxa_decimal
 
         return amortizacao + juros_ultimo_mes
+
+    def mes_cruzamento_price(
+        self, valor_financiado: float, taxa_juros_mensal: float, prazo_meses: int
+    ) -> int:
+        """
+        Primeiro mês em que a parcela SAC fica menor ou igual à parcela fixa PRICE.
+
+        Parcela SAC do mês k: A + (P − (k−1)·A)·i. Igualando à parcela PRICE:
+        k − 1 = (A + P·i − PMT) / (A·i).
+        """
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+        if taxa_decimal == 0:
+            return 1
+
+        amortizacao = valor_financiado / prazo_meses
+        parcela_price = PRICECalculator()._calcular_parcela_price(
+            valor_financiado, taxa_decimal, prazo_meses
+        )
+
+        def parcela_sac(mes: int) -> float:
+            return amortizacao + (valor_financiado - (mes - 1) * amortizacao) * taxa_decimal
+
+        mes = max(
+            1,
+            math.ceil(
+                (amortizacao + valor_financiado * taxa_decimal - parcela_price)
+                / (amortizacao * taxa_decimal)
+            )
+            + 1,
+        )
+
+        # Ajuste de arredondamento de ponto flutuante ao redor da igualdade
+        while mes > 1 and parcela_sac(mes - 1) <= parcela_price:
+            mes -= 1
+        while mes < prazo_meses and parcela_sac(mes) > parcela_price:
+            mes += 1
+
+        return mes
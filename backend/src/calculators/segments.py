@@ -0,0 +1,59 @@
+from typing import Tuple
+
+import numpy as np
+
+from src.models.domain import TabelaAmortizacao
+
+Colunas = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def segmento_price(
+    saldo_inicial: float, taxa_decimal: float, parcela_fixa: float, meses: int
+) -> Colunas:
+    """
+    Colunas (parcela, juros, amortização, saldo) de `meses` parcelas PRICE fixas.
+
+    Saldo após o mês k: S_k = S_0·(1+i)^k − A·((1+i)^k − 1)/i
+    """
+    k = np.arange(meses + 1, dtype=np.float64)
+
+    if taxa_decimal == 0:
+        saldos = saldo_inicial - parcela_fixa * k
+    else:
+        crescimento = (1 + taxa_decimal) ** k
+        saldos = saldo_inicial * crescimento - parcela_fixa * (crescimento - 1) / taxa_decimal
+
+    juros = saldos[:-1] * taxa_decimal
+    parcela = np.full(meses, parcela_fixa)
+
+    return parcela, juros, parcela - juros, saldos[1:].copy()
+
+
+def segmento_sac(
+    saldo_inicial: float, taxa_decimal: float, amortizacao_constante: float, meses: int
+) -> Colunas:
+    """
+    Colunas (parcela, juros, amortização, saldo) de `meses` parcelas SAC.
+
+    Saldo após o mês k: S_k = S_0 − k·A
+    """
+    k = np.arange(meses + 1, dtype=np.float64)
+
+    saldos = saldo_inicial - amortizacao_constante * k
+    juros = saldos[:-1] * taxa_decimal
+    amortizacao = np.full(meses, amortizacao_constante)
+
+    return amortizacao + juros, juros, amortizacao, saldos[1:].copy()
+
+
+def tabela_de_colunas(colunas: Colunas) -> TabelaAmortizacao:
+    parcela, juros, amortizacao, saldo = colunas
+
+    return TabelaAmortizacao(
+        valores_parcela=parcela.tolist(),
+        valores_juros=juros.tolist(),
+        valores_amortizacao=amortizacao.tolist(),
+        saldos_devedores=saldo.tolist(),
+        total_pago=float(parcela.sum()),
+        total_juros=float(juros.sum()),
+    )
@@ -0,0 +1,241 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from src.calculators.price_calculator import PRICECalculator
+from src.calculators.sac_calculator import SACCalculator
+from src.calculators.segments import Colunas, segmento_price, segmento_sac, tabela_de_colunas
+from src.models.domain import (
+    AmortizacaoExtraordinaria,
+    Parcela,
+    ResumoAmortizacao,
+    TabelaAmortizacao,
+    indices_resumo,
+)
+
+
+def colunas_price(valor_financiado: float, taxa_decimal: float, prazo_meses: int) -> Colunas:
+    """Colunas (parcela, juros, amortização, saldo) da tabela PRICE em operações vetoriais."""
+    if taxa_decimal == 0:
+        parcela_fixa = valor_financiado / prazo_meses
+    else:
+        fator = (1 + taxa_decimal) ** prazo_meses
+        parcela_fixa = valor_financiado * (taxa_decimal * fator) / (fator - 1)
+
+    colunas = segmento_price(valor_financiado, taxa_decimal, parcela_fixa, prazo_meses)
+    colunas[3][-1] = 0.0
+
+    return colunas
+
+
+def colunas_sac(valor_financiado: float, taxa_decimal: float, prazo_meses: int) -> Colunas:
+    """Colunas (parcela, juros, amortização, saldo) da tabela SAC em operações vetoriais."""
+    colunas = segmento_sac(
+        valor_financiado, taxa_decimal, valor_financiado / prazo_meses, prazo_meses
+    )
+    colunas[3][-1] = 0.0
+
+    return colunas
+
+
+class VectorizedPRICECalculator(PRICECalculator):
+    def calcular(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
+    ) -> TabelaAmortizacao:
+        if amortizacoes:
+            return self._calcular_com_amortizacoes(
+                valor_financiado, taxa_juros_mensal, prazo_meses, amortizacoes
+            )
+
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+
+        return tabela_de_colunas(colunas_price(valor_financiado, taxa_decimal, prazo_meses))
+
+
+class VectorizedSACCalculator(SACCalculator):
+    def calcular(
+        self,
+        valor_financiado: float,
+        taxa_juros_mensal: float,
+        prazo_meses: int,
+        amortizacoes: Sequence[AmortizacaoExtraordinaria] = (),
+    ) -> TabelaAmortizacao:
+        if amortizacoes:
+            return self._calcular_com_amortizacoes(
+                valor_financiado, taxa_juros_mensal, prazo_meses, amortizacoes
+            )
+
+        self._validar_parametros(valor_financiado, taxa_juros_mensal, prazo_meses)
+
+        taxa_decimal = self._converter_taxa_percentual_para_decimal(taxa_juros_mensal)
+
+        return tabela_de_colunas(colunas_sac(valor_financiado, taxa_decimal, prazo_meses))
+
+
+@dataclass
+class LoteAmortizacao:
+    """
+    Tabelas de vários financiamentos calculadas de uma vez.
+
+    As matrizes têm formato (financiamentos × maior prazo); meses além do prazo
+    de cada financiamento são zero.
+    """
+
+    parcela: np.ndarray
+    juros: np.ndarray
+    amortizacao: np.ndarray
+    saldo: np.ndarray
+    prazos: np.ndarray
+
+    @property
+    def total_pago(self) -> np.ndarray:
+        total: np.ndarray = self.parcela.sum(axis=1)
+        return total
+
+    @property
+    def total_juros(self) -> np.ndarray:
+        total: np.ndarray = self.juros.sum(axis=1)
+        return total
+
+    def resumo(self, linha: int, num_pontos: int = 12) -> ResumoAmortizacao:
+        """Resumo de um financiamento do lote, no formato de calcular_resumo."""
+        prazo = int(self.prazos[linha])
+
+        parcelas = [
+            Parcela(
+                numero=indice + 1,
+                valor_parcela=float(self.parcela[linha, indice]),
+                valor_juros=float(self.juros[linha, indice]),
+                valor_amortizacao=float(self.amortizacao[linha, indice]),
+                saldo_devedor=float(self.saldo[linha, indice]),
+            )
+            for indice in indices_resumo(prazo, num_pontos)
+        ]
+
+        return ResumoAmortizacao(
+            parcelas=parcelas,
+            total_pago=float(self.total_pago[linha]),
+            total_juros=float(self.total_juros[linha]),
+            prazo_meses=prazo,
+            num_pontos=num_pontos,
+        )
+
+
+def calcular_lote(
+    tipo_amortizacao: str,
+    valores_financiados: np.ndarray,
+    taxas_juros_mensais: np.ndarray,
+    prazos_meses: np.ndarray,
+) -> LoteAmortizacao:
+    """Calcula PRICE ou SAC para N financiamentos em uma única passada vetorial."""
+    valores = np.asarray(valores_financiados, dtype=np.float64)[:, None]
+    taxas = (np.asarray(taxas_juros_mensais, dtype=np.float64) / 100)[:, None]
+    prazos_1d = np.asarray(prazos_meses, dtype=np.int64)
+    prazos = prazos_1d[:, None].astype(np.float64)
+
+    if np.any(valores <= 0) or np.any(taxas < 0) or np.any(prazos <= 0):
+        raise ValueError("Parâmetros inválidos no lote de financiamentos")
+
+    meses = np.arange(int(prazos_1d.max()) + 1, dtype=np.float64)[None, :]
+    ativo = meses[:, 1:] <= prazos
+
+    if tipo_amortizacao == "PRICE":
+        # Taxa zero: evita divisão por zero e usa parcela = P/n
+        taxas_seguras = np.where(taxas > 0, taxas, 1.0)
+        fator = (1 + taxas_seguras) ** prazos
+        parcela_fixa = np.where(
+            taxas > 0, valores * taxas_seguras * fator / (fator - 1), valores / prazos
+        )
+        crescimento = (1 + taxas) ** meses
+        saldos = np.where(
+            taxas > 0,
+            valores * crescimento - parcela_fixa * (crescimento - 1) / taxas_seguras,
+            valores - parcela_fixa * meses,
+        )
+        juros = saldos[:, :-1] * taxas
+        parcela = np.broadcast_to(parcela_fixa, juros.shape)
+        amortizacao = parcela - juros
+
+    elif tipo_amortizacao == "SAC":
+        amortizacao_constante = valores / prazos
+        saldos = valores - amortizacao_constante * meses
+        juros = saldos[:, :-1] * taxas
+        amortizacao = np.broadcast_to(amortizacao_constante, juros.shape)
+        parcela = amortizacao + juros
+
+    else:
+        raise ValueError(f"Tipo de amortização '{tipo_amortizacao}' não suportado")
+
+    saldo = np.where(meses[:, 1:] < prazos, saldos[:, 1:], 0.0)
+
+    return LoteAmortizacao(
+        parcela=np.where(ativo, parcela, 0.0),
+        juros=np.where(ativo, juros, 0.0),
+        amortizacao=np.where(ativo, amortizacao, 0.0),
+        saldo=saldo,
+        prazos=prazos_1d,
+    )
+
+
+@dataclass
+class TotaisFechados:
+    """Primeira/última parcela e totais, com o formato dos arrays de entrada."""
+
+    primeira_parcela: np.ndarray
+    ultima_parcela: np.ndarray
+    total_pago: np.ndarray
+    total_juros: np.ndarray
+
+
+def totais_fechados(
+    tipo_amortizacao: str,
+    valores_financiados: np.ndarray,
+    taxa_juros_mensal: float,
+    prazos_meses: np.ndarray,
+) -> TotaisFechados:
+    """
+    Totais de PRICE ou SAC em forma fechada, com broadcasting entre valores e prazos.
+
+    Ex.: valores de formato (E, 1) e prazos (1, P) produzem matrizes E × P.
+    """
+    valores = np.asarray(valores_financiados, dtype=np.float64)
+    prazos = np.asarray(prazos_meses, dtype=np.float64)
+    taxa = taxa_juros_mensal / 100
+
+    if np.any(valores <= 0) or taxa < 0 or np.any(prazos <= 0):
+        raise ValueError("Parâmetros inválidos na grade de financiamentos")
+
+    if tipo_amortizacao == "PRICE":
+        if taxa == 0:
+            parcela = valores / prazos
+        else:
+            fator = (1 + taxa) ** prazos
+            parcela = valores * taxa * fator / (fator - 1)
+
+        total_pago = parcela * prazos
+        return TotaisFechados(
+            primeira_parcela=parcela,
+            ultima_parcela=parcela,
+            total_pago=total_pago,
+            total_juros=total_pago - valores,
+        )
+
+    if tipo_amortizacao == "SAC":
+        amortizacao = valores / prazos
+        # Juros totais: i·P·(n+1)/2
+        total_juros = taxa * valores * (prazos + 1) / 2
+        return TotaisFechados(
+            primeira_parcela=amortizacao + valores * taxa,
+            ultima_parcela=amortizacao * (1 + taxa),
+            total_pago=valores + total_juros,
+            total_juros=total_juros,
+        )
+
+    raise ValueError(f"Tipo de amortização '{tipo_amortizacao}' não suportado")
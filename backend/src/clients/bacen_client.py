@@ -1,10 +1,14 @@
 import logging
 import os
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+
+import httpx
 
 from src.clients.base_client import BaseHTTPClient
+from src.clients.response_cache import get_response_cache
 from src.models.domain import Indicador
+from src.utils.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
@@ -15,24 +19,68 @@ class BacenClient:
     Documentação: https://www3.bcb.gov.br/sgspub/
 
     Série consultada: 432 (Taxa Selic)
+    Séries históricas mensais: 4390 (Selic acumulada no mês) e 433 (IPCA)
     """
 
+    SERIES_MENSAIS = {"SELIC": 4390, "IPCA": 433}
+
     def __init__(self):
         self.base_url = os.getenv(
             "BACEN_API_URL",
             "https://api.bcb.gov.br/dados/serie/bcdata.sgs.432/dados/ultimos/1?formato=json",
         )
+        self.sgs_url = os.getenv(
+            "BACEN_SGS_URL",
+            "https://api.bcb.gov.br/dados/serie/bcdata.sgs.{serie}/dados/ultimos/{quantidade}",
+        )
         self.timeout = int(os.getenv("API_TIMEOUT", "3"))
         self.max_retries = int(os.getenv("API_RETRY_ATTEMPTS", "2"))
 
-        self.http_client = BaseHTTPClient(timeout=self.timeout, max_retries=self.max_retries)
+        self.http_client = BaseHTTPClient(
+            timeout=self.timeout, max_retries=self.max_retries, cache=get_response_cache()
+        )
 
-    def buscar_selic(self) -> Optional[Indicador]:
-        try:
-            logger.info("Consultando taxa SELIC no Banco Central")
+    def buscar_selic(self, deadline: Optional[Deadline] = None) -> Optional[Indicador]:
+        logger.info("Consultando taxa SELIC no Banco Central")
 
-            response_data = self.http_client.get(self.base_url)
+        return self._interpretar_resposta(self.http_client.get(self.base_url, deadline=deadline))
+
+    async def buscar_selic_async(
+        self, client: httpx.AsyncClient, deadline: Optional[Deadline] = None
+    ) -> Optional[Indicador]:
+        logger.info("Consultando taxa SELIC no Banco Central (assíncrono)")
+
+        response_data = await self.http_client.aget(client, self.base_url, deadline=deadline)
+        return self._interpretar_resposta(response_data)
+
+    def buscar_historico(
+        self, tipo: str, meses: int, deadline: Optional[Deadline] = None
+    ) -> Optional[List[float]]:
+        """Variações mensais (%) dos últimos `meses` meses, da mais antiga à mais recente."""
+        serie = self.SERIES_MENSAIS[tipo]
+
+        logger.info(
+            "Consultando série histórica no Banco Central",
+            extra={"tipo": tipo, "serie": serie, "meses": meses},
+        )
 
+        url = self.sgs_url.format(serie=serie, quantidade=meses)
+        response_data = self.http_client.get(url, params={"formato": "json"}, deadline=deadline)
+
+        if not isinstance(response_data, list) or not response_data:
+            logger.warning("Série histórica vazia ou inválida", extra={"serie": serie})
+            return None
+
+        try:
+            return [float(dados["valor"]) for dados in response_data]
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(
+                "Erro ao interpretar série histórica", extra={"serie": serie, "error": str(e)}
+            )
+            return None
+
+    def _interpretar_resposta(self, response_data: Optional[dict]) -> Optional[Indicador]:
+        try:
             if not response_data:
                 logger.warning("Resposta vazia do Banco Central")
                 return None
@@ -1,77 +1,300 @@
+import asyncio
 import logging
-from typing import Optional
+import os
+import time
+from typing import Optional, Tuple
 
 import httpx
 
+from src.clients.circuit_breaker import CircuitBreaker, obter_circuit_breaker
+from src.clients.response_cache import EntradaCache, ResponseCache
+from src.clients.retry import RetryPolicy
+from src.utils.deadline import Deadline
+
 logger = logging.getLogger(__name__)
 
 
 class BaseHTTPClient:
-    def __init__(self, timeout: int = 3, max_retries: int = 2):
+    def __init__(
+        self,
+        timeout: int = 3,
+        max_retries: int = 2,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         self.timeout = timeout
-        self.max_retries = max_retries
-        self.client = httpx.Client(timeout=httpx.Timeout(timeout), follow_redirects=True)
+        # Com retry_policy explícita, o número de tentativas vem dela
+        self.retry_policy = retry_policy or RetryPolicy.do_ambiente(max_retries)
+        self.cache = cache
+        self.client = httpx.Client(
+            timeout=httpx.Timeout(timeout), follow_redirects=True, limits=self._limites()
+        )
+
+    @property
+    def max_retries(self) -> int:
+        return self.retry_policy.max_tentativas
 
     def get(
-        self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Optional[dict]:
+        chave, entrada = self._consultar_cache(url, params)
+        if entrada is not None and self._fresca(entrada):
+            dados: dict = entrada.dados
+            return dados
+
+        headers = self._headers_condicionais(headers, entrada)
+        breaker = self._obter_breaker(url)
+
         for attempt in range(1, self.max_retries + 1):
+            timeout = self._timeout_tentativa(url, attempt, deadline)
+            if timeout is None or not self._circuito_permite(breaker, url):
+                return None
+
             try:
-                logger.info(
-                    "Requisição HTTP GET",
-                    extra={"url": url, "attempt": attempt, "max_retries": self.max_retries},
-                )
+                self._log_tentativa(url, attempt)
 
-                response = self.client.get(url, params=params, headers=headers)
+                response = self.client.get(url, params=params, headers=headers, timeout=timeout)
 
-                response.raise_for_status()
+                return self._processar_resposta(url, response, attempt, breaker, chave, entrada)
 
-                logger.info(
-                    "Requisição bem-sucedida",
-                    extra={"url": url, "status_code": response.status_code, "attempt": attempt},
-                )
+            except Exception as e:
+                if not self._deve_tentar_novamente(url, e, attempt, breaker):
+                    return None
 
-                return response.json()
+            espera = self._espera_antes_de_nova_tentativa(url, attempt, deadline)
+            if espera is None:
+                return None
+            time.sleep(espera)
 
-            except httpx.TimeoutException as e:
-                logger.warning(
-                    f"Timeout na requisição (tentativa {attempt}/{self.max_retries})",
-                    extra={"url": url, "error": str(e), "attempt": attempt},
-                )
+        return None
+
+    async def aget(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Optional[dict]:
+        """Versão assíncrona de get, usando um httpx.AsyncClient do chamador."""
+        chave, entrada = self._consultar_cache(url, params)
+        if entrada is not None and self._fresca(entrada):
+            dados: dict = entrada.dados
+            return dados
+
+        headers = self._headers_condicionais(headers, entrada)
+        breaker = self._obter_breaker(url)
+
+        for attempt in range(1, self.max_retries + 1):
+            timeout = self._timeout_tentativa(url, attempt, deadline)
+            if timeout is None or not self._circuito_permite(breaker, url):
+                return None
 
-                if attempt == self.max_retries:
-                    logger.error(
-                        f"Falha após {self.max_retries} tentativas - Timeout", extra={"url": url}
+            try:
+                self._log_tentativa(url, attempt)
+
+                try:
+                    response = await client.get(
+                        url, params=params, headers=headers, timeout=timeout
                     )
-                    return None
+                except asyncio.CancelledError:
+                    # Cancelada (ex.: a outra fonte respondeu antes): sem sucesso
+                    # nem falha, mas o teste do circuito não pode ficar preso
+                    breaker.liberar_teste()
+                    raise
 
-            except httpx.HTTPStatusError as e:
-                logger.error(
-                    f"Erro HTTP {e.response.status_code}",
-                    extra={"url": url, "status_code": e.response.status_code, "attempt": attempt},
-                )
+                return self._processar_resposta(url, response, attempt, breaker, chave, entrada)
 
-                if 400 <= e.response.status_code < 500:
+            except Exception as e:
+                if not self._deve_tentar_novamente(url, e, attempt, breaker):
                     return None
 
-                if attempt == self.max_retries:
-                    return None
+            espera = self._espera_antes_de_nova_tentativa(url, attempt, deadline)
+            if espera is None:
+                return None
+            await asyncio.sleep(espera)
 
-            except Exception as e:
+        return None
+
+    def criar_cliente_async(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout), follow_redirects=True, limits=self._limites()
+        )
+
+    def _limites(self) -> httpx.Limits:
+        # O padrão do httpx descarta conexões ociosas após 5s; entre invocações
+        # "quentes" o intervalo costuma ser maior, então o pool vive mais tempo.
+        return httpx.Limits(
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "10")),
+            max_keepalive_connections=int(os.getenv("HTTP_MAX_KEEPALIVE", "5")),
+            keepalive_expiry=float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "120")),
+        )
+
+    def _obter_breaker(self, url: str) -> CircuitBreaker:
+        return obter_circuit_breaker(httpx.URL(url).host)
+
+    def _circuito_permite(self, breaker: CircuitBreaker, url: str) -> bool:
+        if breaker.permite_requisicao():
+            return True
+
+        logger.warning(
+            "Circuito aberto, requisição não enviada",
+            extra={"url": url, "host": breaker.host, "estado": breaker.estado},
+        )
+        return False
+
+    def _timeout_tentativa(
+        self, url: str, attempt: int, deadline: Optional[Deadline]
+    ) -> Optional[float]:
+        timeout = self.retry_policy.timeout_tentativa(self.timeout, deadline)
+
+        if timeout is None:
+            logger.warning(
+                "Prazo da requisição esgotado, tentativa não enviada",
+                extra={"url": url, "attempt": attempt},
+            )
+
+        return timeout
+
+    def _espera_antes_de_nova_tentativa(
+        self, url: str, attempt: int, deadline: Optional[Deadline]
+    ) -> Optional[float]:
+        espera = self.retry_policy.espera(attempt)
+
+        if not self.retry_policy.pode_esperar(espera, deadline):
+            logger.warning(
+                "Sem tempo para nova tentativa dentro do prazo da requisição",
+                extra={"url": url, "attempt": attempt, "espera": round(espera, 3)},
+            )
+            return None
+
+        return espera
+
+    def _log_tentativa(self, url: str, attempt: int) -> None:
+        logger.info(
+            "Requisição HTTP GET",
+            extra={"url": url, "attempt": attempt, "max_retries": self.max_retries},
+        )
+
+    def _processar_resposta(
+        self,
+        url: str,
+        response: httpx.Response,
+        attempt: int,
+        breaker: CircuitBreaker,
+        chave: Optional[str] = None,
+        entrada: Optional[EntradaCache] = None,
+    ) -> dict:
+        if response.status_code == 304 and entrada is not None:
+            # Só há entrada (e ETag para revalidar) com cache e chave
+            assert self.cache is not None and chave is not None
+
+            breaker.registrar_sucesso()
+            self.cache.renovar(chave, url, entrada, response)
+            logger.info("Resposta revalidada (304 Not Modified)", extra={"url": url})
+            revalidados: dict = entrada.dados
+            return revalidados
+
+        if self.cache and chave is not None and 400 <= response.status_code < 500:
+            self.cache.salvar_negativa(chave, response.status_code)
+
+        response.raise_for_status()
+
+        breaker.registrar_sucesso()
+
+        logger.info(
+            "Requisição bem-sucedida",
+            extra={"url": url, "status_code": response.status_code, "attempt": attempt},
+        )
+
+        dados: dict = response.json()
+
+        if self.cache and chave is not None:
+            self.cache.salvar_resposta(chave, url, response, dados)
+
+        return dados
+
+    def _consultar_cache(
+        self, url: str, params: Optional[dict]
+    ) -> Tuple[Optional[str], Optional[EntradaCache]]:
+        if not self.cache:
+            return None, None
+
+        chave = self.cache.chave(url, params)
+        entrada = self.cache.obter(chave)
+
+        if entrada is not None and self._fresca(entrada):
+            logger.info(
+                "Resposta obtida do cache HTTP",
+                extra={"url": url, "negativa": entrada.negativa},
+            )
+
+        return chave, entrada
+
+    def _fresca(self, entrada: EntradaCache) -> bool:
+        return self.cache is not None and entrada.fresca(self.cache.agora())
+
+    def _headers_condicionais(
+        self, headers: Optional[dict], entrada: Optional[EntradaCache]
+    ) -> Optional[dict]:
+        if entrada is None or entrada.negativa:
+            return headers
+
+        condicionais = entrada.headers_condicionais()
+        if not condicionais:
+            return headers
+
+        return {**(headers or {}), **condicionais}
+
+    def _deve_tentar_novamente(
+        self, url: str, e: Exception, attempt: int, breaker: CircuitBreaker
+    ) -> bool:
+        # Erros 4xx indicam um problema na requisição, não no host externo
+        if isinstance(e, httpx.HTTPStatusError) and 400 <= e.response.status_code < 500:
+            breaker.registrar_sucesso()
+        else:
+            breaker.registrar_falha()
+
+        if isinstance(e, httpx.TimeoutException):
+            logger.warning(
+                f"Timeout na requisição (tentativa {attempt}/{self.max_retries})",
+                extra={"url": url, "error": str(e), "attempt": attempt},
+            )
+
+            if attempt == self.max_retries:
                 logger.error(
-                    "Erro inesperado na requisição",
-                    extra={
-                        "url": url,
-                        "error": str(e),
-                        "error_type": type(e).__name__,
-                        "attempt": attempt,
-                    },
+                    f"Falha após {self.max_retries} tentativas - Timeout", extra={"url": url}
                 )
+                return False
 
-                if attempt == self.max_retries:
-                    return None
+            return True
 
-        return None
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.error(
+                f"Erro HTTP {e.response.status_code}",
+                extra={"url": url, "status_code": e.response.status_code, "attempt": attempt},
+            )
+
+            if 400 <= e.response.status_code < 500:
+                return False
+
+            return attempt < self.max_retries
+
+        logger.error(
+            "Erro inesperado na requisição",
+            extra={
+                "url": url,
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "attempt": attempt,
+            },
+        )
+
+        return attempt < self.max_retries
 
     def close(self):
         self.client.close()
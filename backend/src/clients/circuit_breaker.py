@@ -0,0 +1,142 @@
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Literal
+
+from src.utils.metrics import registrar_metrica
+
+logger = logging.getLogger(__name__)
+
+EstadoCircuito = Literal["CLOSED", "OPEN", "HALF_OPEN"]
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker por host externo.
+
+    - CLOSED: requisições passam; falhas consecutivas são contadas.
+    - OPEN: após `limite_falhas` falhas, requisições falham imediatamente
+      durante `tempo_espera` segundos.
+    - HALF_OPEN: passado o tempo de espera, uma única requisição de teste é
+      liberada. Sucesso fecha o circuito; falha o abre novamente.
+
+    A requisição de teste tem um prazo (`duracao_teste`): se ela não registrar
+    resultado nesse tempo (ex.: task cancelada), outro teste é liberado.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        limite_falhas: int = 5,
+        tempo_espera: float = 30.0,
+        duracao_teste: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.host = host
+        self.limite_falhas = limite_falhas
+        self.tempo_espera = tempo_espera
+        self.duracao_teste = duracao_teste
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._estado: EstadoCircuito = "CLOSED"
+        self._falhas = 0
+        self._aberto_em = 0.0
+        self._teste_em_andamento = False
+        self._teste_iniciado_em = 0.0
+
+    @property
+    def estado(self) -> EstadoCircuito:
+        with self._lock:
+            if self._estado == "OPEN" and self._espera_concluida():
+                self._transicionar("HALF_OPEN")
+            return self._estado
+
+    def permite_requisicao(self) -> bool:
+        with self._lock:
+            if self._estado == "OPEN":
+                if not self._espera_concluida():
+                    registrar_metrica("CircuitBreakerRejected", host=self.host)
+                    return False
+                self._transicionar("HALF_OPEN")
+
+            if self._estado == "HALF_OPEN":
+                if self._teste_em_andamento and not self._teste_expirado():
+                    registrar_metrica("CircuitBreakerRejected", host=self.host)
+                    return False
+                self._teste_em_andamento = True
+                self._teste_iniciado_em = self._clock()
+
+            return True
+
+    def registrar_sucesso(self) -> None:
+        with self._lock:
+            self._falhas = 0
+            self._teste_em_andamento = False
+
+            if self._estado != "CLOSED":
+                self._transicionar("CLOSED")
+
+    def liberar_teste(self) -> None:
+        """Libera a requisição de teste que terminou sem resultado (ex.: cancelada)."""
+        with self._lock:
+            self._teste_em_andamento = False
+
+    def registrar_falha(self) -> None:
+        with self._lock:
+            self._falhas += 1
+            self._teste_em_andamento = False
+
+            if self._estado == "HALF_OPEN" or (
+                self._estado == "CLOSED" and self._falhas >= self.limite_falhas
+            ):
+                self._aberto_em = self._clock()
+                self._transicionar("OPEN")
+
+    def _espera_concluida(self) -> bool:
+        return self._clock() - self._aberto_em >= self.tempo_espera
+
+    def _teste_expirado(self) -> bool:
+        return self._clock() - self._teste_iniciado_em >= self.duracao_teste
+
+    def _transicionar(self, novo_estado: EstadoCircuito) -> None:
+        anterior = self._estado
+        self._estado = novo_estado
+
+        logger.warning(
+            "Transição de circuit breaker",
+            extra={
+                "host": self.host,
+                "estado_anterior": anterior,
+                "estado_novo": novo_estado,
+                "falhas_consecutivas": self._falhas,
+            },
+        )
+        registrar_metrica("CircuitBreakerTransition", host=self.host, estado=novo_estado)
+
+
+# Estado compartilhado por todos os clients do processo (e entre invocações "quentes")
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def obter_circuit_breaker(host: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+
+        if breaker is None:
+            breaker = CircuitBreaker(
+                host=host,
+                limite_falhas=int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")),
+                tempo_espera=float(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30")),
+                duracao_teste=float(os.getenv("CIRCUIT_BREAKER_PROBE_TIMEOUT", "10")),
+            )
+            _breakers[host] = breaker
+
+        return breaker
+
+
+def resetar_circuit_breakers() -> None:
+    with _breakers_lock:
+        _breakers.clear()
@@ -8,8 +8,12 @@ import os
 from datetime import datetime
 from typing import Optional
 
+import httpx
+
 from src.clients.base_client import BaseHTTPClient
+from src.clients.response_cache import get_response_cache
 from src.models.domain import Indicador
+from src.utils.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
@@ -31,14 +35,25 @@ class IBGEClient:
         self.timeout = int(os.getenv("API_TIMEOUT", "3"))
         self.max_retries = int(os.getenv("API_RETRY_ATTEMPTS", "2"))
 
-        self.http_client = BaseHTTPClient(timeout=self.timeout, max_retries=self.max_retries)
+        self.http_client = BaseHTTPClient(
+            timeout=self.timeout, max_retries=self.max_retries, cache=get_response_cache()
+        )
 
-    def buscar_ipca(self) -> Optional[Indicador]:
-        try:
-            logger.info("Consultando IPCA no IBGE")
+    def buscar_ipca(self, deadline: Optional[Deadline] = None) -> Optional[Indicador]:
+        logger.info("Consultando IPCA no IBGE")
 
-            response_data = self.http_client.get(self.base_url)
+        return self._interpretar_resposta(self.http_client.get(self.base_url, deadline=deadline))
 
+    async def buscar_ipca_async(
+        self, client: httpx.AsyncClient, deadline: Optional[Deadline] = None
+    ) -> Optional[Indicador]:
+        logger.info("Consultando IPCA no IBGE (assíncrono)")
+
+        response_data = await self.http_client.aget(client, self.base_url, deadline=deadline)
+        return self._interpretar_resposta(response_data)
+
+    def _interpretar_resposta(self, response_data: Optional[dict]) -> Optional[Indicador]:
+        try:
             if not response_data:
                 logger.warning("Resposta vazia do IBGE")
                 return None
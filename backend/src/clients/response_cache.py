@@ -0,0 +1,229 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# TTL mínimo por prefixo de URL: as séries do SGS e os agregados do IBGE mudam
+# no máximo uma vez por dia, independentemente do que os cabeçalhos indicam.
+TTL_MINIMO_PADRAO = {
+    "https://api.bcb.gov.br/dados/serie/": float(os.getenv("HTTP_CACHE_MIN_TTL_SGS", "3600")),
+    "https://servicodados.ibge.gov.br/api/v3/agregados/": float(
+        os.getenv("HTTP_CACHE_MIN_TTL_IBGE", "3600")
+    ),
+}
+
+
+@dataclass
+class EntradaCache:
+    dados: Any
+    status_code: int
+    expira_em: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def negativa(self) -> bool:
+        return self.status_code >= 400
+
+    def fresca(self, agora: float) -> bool:
+        return agora < self.expira_em
+
+    def headers_condicionais(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    Cache de respostas HTTP GET para o BaseHTTPClient.
+
+    - Chave: URL + parâmetros (ordenados).
+    - Respeita Cache-Control (max-age, no-cache, no-store) e Expires.
+    - Guarda ETag/Last-Modified para revalidar com requisições condicionais (304).
+    - `ttl_minimo` eleva o TTL de URLs conhecidas (por prefixo), exceto com no-store.
+    - Respostas 4xx ficam em cache negativo por `ttl_negativo` segundos.
+    - Com `diretorio`, as entradas também são gravadas em disco (ex.: /tmp), o que
+      as preserva quando o módulo é recarregado no mesmo ambiente de execução.
+    """
+
+    def __init__(
+        self,
+        ttl_minimo: Optional[Dict[str, float]] = None,
+        ttl_negativo: float = 60.0,
+        diretorio: Optional[str] = None,
+        max_entradas: int = 256,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.ttl_minimo = ttl_minimo if ttl_minimo is not None else dict(TTL_MINIMO_PADRAO)
+        self.ttl_negativo = ttl_negativo
+        self.diretorio = diretorio
+        self.max_entradas = max_entradas
+        self._clock = clock
+        self._entradas: Dict[str, EntradaCache] = {}
+        self._lock = threading.Lock()
+
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+    def chave(self, url: str, params: Optional[dict] = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def agora(self) -> float:
+        return self._clock()
+
+    def obter(self, chave: str) -> Optional[EntradaCache]:
+        with self._lock:
+            entrada = self._entradas.get(chave)
+
+        if entrada is None and self.diretorio:
+            entrada = self._ler_arquivo(chave)
+            if entrada:
+                self._guardar_em_memoria(chave, entrada)
+
+        return entrada
+
+    def salvar_resposta(self, chave: str, url: str, response: httpx.Response, dados: Any) -> None:
+        ttl = self._ttl_da_resposta(url, response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if ttl is None or (ttl <= 0 and not (etag or last_modified)):
+            return
+
+        self._guardar(
+            chave,
+            EntradaCache(
+                dados=dados,
+                status_code=response.status_code,
+                expira_em=self.agora() + ttl,
+                etag=etag,
+                last_modified=last_modified,
+            ),
+        )
+
+    def salvar_negativa(self, chave: str, status_code: int) -> None:
+        self._guardar(
+            chave,
+            EntradaCache(
+                dados=None, status_code=status_code, expira_em=self.agora() + self.ttl_negativo
+            ),
+        )
+
+    def renovar(
+        self, chave: str, url: str, entrada: EntradaCache, response: httpx.Response
+    ) -> None:
+        """Atualiza a expiração de uma entrada após resposta 304 (Not Modified)."""
+        ttl = self._ttl_da_resposta(url, response)
+
+        entrada.expira_em = self.agora() + max(ttl or 0.0, 0.0)
+        entrada.etag = response.headers.get("ETag", entrada.etag)
+        entrada.last_modified = response.headers.get("Last-Modified", entrada.last_modified)
+
+        self._guardar(chave, entrada)
+
+    def limpar(self) -> None:
+        with self._lock:
+            self._entradas.clear()
+
+    def _ttl_da_resposta(self, url: str, response: httpx.Response) -> Optional[float]:
+        diretivas = {}
+        for parte in response.headers.get("Cache-Control", "").lower().split(","):
+            nome, _, valor = parte.strip().partition("=")
+            if nome:
+                diretivas[nome] = valor.strip('"')
+
+        if "no-store" in diretivas:
+            return None
+
+        ttl = 0.0
+        if "no-cache" in diretivas:
+            ttl = 0.0
+        elif "max-age" in diretivas:
+            try:
+                ttl = float(diretivas["max-age"])
+            except ValueError:
+                ttl = 0.0
+        elif "Expires" in response.headers:
+            try:
+                expira = parsedate_to_datetime(response.headers["Expires"]).timestamp()
+                ttl = max(0.0, expira - self.agora())
+            except (TypeError, ValueError):
+                ttl = 0.0
+
+        for prefixo, minimo in self.ttl_minimo.items():
+            if url.startswith(prefixo):
+                ttl = max(ttl, minimo)
+
+        return ttl
+
+    def _guardar(self, chave: str, entrada: EntradaCache) -> None:
+        self._guardar_em_memoria(chave, entrada)
+
+        if self.diretorio:
+            self._gravar_arquivo(chave, entrada)
+
+    def _guardar_em_memoria(self, chave: str, entrada: EntradaCache) -> None:
+        with self._lock:
+            self._entradas.pop(chave, None)
+            self._entradas[chave] = entrada
+
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.pop(next(iter(self._entradas)))
+
+    def _caminho(self, chave: str) -> str:
+        # Só usado com cache em disco (ver _guardar e obter)
+        assert self.diretorio is not None
+
+        nome = hashlib.sha256(chave.encode("utf-8")).hexdigest()
+        return os.path.join(self.diretorio, f"{nome}.json")
+
+    def _ler_arquivo(self, chave: str) -> Optional[EntradaCache]:
+        try:
+            with open(self._caminho(chave), encoding="utf-8") as arquivo:
+                return EntradaCache(**json.load(arquivo))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("Erro ao ler cache HTTP em disco", extra={"error": str(e)})
+            return None
+
+    def _gravar_arquivo(self, chave: str, entrada: EntradaCache) -> None:
+        caminho = self._caminho(chave)
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+
+        try:
+            with open(temporario, "w", encoding="utf-8") as arquivo:
+                json.dump(asdict(entrada), arquivo, ensure_ascii=False)
+            os.replace(temporario, caminho)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Erro ao gravar cache HTTP em disco", extra={"error": str(e)})
+
+
+_cache = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Cache compartilhado pelos clients do processo, se HTTP_CACHE_ENABLED=true."""
+    global _cache
+    if _cache is None and os.getenv("HTTP_CACHE_ENABLED", "false").lower() == "true":
+        _cache = ResponseCache(
+            ttl_negativo=float(os.getenv("HTTP_CACHE_NEGATIVE_TTL", "60")),
+            diretorio=os.getenv("HTTP_CACHE_DIR") or None,
+        )
+    return _cache
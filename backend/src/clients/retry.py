@@ -0,0 +1,51 @@
+import os
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from src.utils.deadline import Deadline
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Backoff exponencial com "full jitter": a espera antes da tentativa n+1 é
+    sorteada entre 0 e min(backoff_max, backoff_base × 2^(n-1)). O sorteio
+    espalha as novas tentativas de vários containers e evita sobrecarregar
+    um serviço externo que está se recuperando.
+    """
+
+    max_tentativas: int = 2
+    backoff_base: float = 0.2
+    backoff_max: float = 2.0
+    tempo_minimo_tentativa: float = 0.25
+
+    @classmethod
+    def do_ambiente(cls, max_tentativas: int) -> "RetryPolicy":
+        return cls(
+            max_tentativas=max_tentativas,
+            backoff_base=float(os.getenv("API_RETRY_BACKOFF_BASE", "0.2")),
+            backoff_max=float(os.getenv("API_RETRY_BACKOFF_MAX", "2.0")),
+        )
+
+    def espera(self, tentativa: int) -> float:
+        teto = min(self.backoff_max, self.backoff_base * (2 ** (tentativa - 1)))
+        return random.uniform(0, teto)
+
+    def timeout_tentativa(self, timeout: float, deadline: Optional[Deadline]) -> Optional[float]:
+        """Timeout da próxima tentativa, ou None se não houver tempo para ela."""
+        if deadline is None:
+            return timeout
+
+        restante = deadline.limitar(timeout)
+        if restante < self.tempo_minimo_tentativa:
+            return None
+
+        return restante
+
+    def pode_esperar(self, espera: float, deadline: Optional[Deadline]) -> bool:
+        """Indica se, após a espera, ainda resta tempo para uma tentativa útil."""
+        if deadline is None:
+            return True
+
+        return deadline.restante() - espera >= self.tempo_minimo_tentativa
@@ -1,17 +1,29 @@
 import json
+import os
 from datetime import datetime, timezone
-from typing import Any, Dict
-
-from pydantic import ValidationError
-
-from src.models.requests import SimulationRequest
-from src.services import FinancingService
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from src.models.domain import Parcela
+from src.models.requests import (
+    CapacidadeRequest,
+    ComparacaoRequest,
+    GridRequest,
+    MonteCarloRequest,
+    PrazoRequest,
+    SimulationRequest,
+)
 from src.services.dynamodb_service import get_dynamodb_service
+from src.services.financing_service import get_financing_service
+from src.utils.deadline import Deadline
 from src.utils.exceptions import BusinessException, ExternalServiceException
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+FORMATOS_TABELA = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     request_id = context.request_id if hasattr(context, "request_id") else "local"
@@ -40,6 +52,9 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 request_id=request_id,
             )
 
+        if not isinstance(body, dict):
+            return _body_nao_objeto(request_id)
+
         try:
             simulation_request = SimulationRequest(**body)
         except ValidationError as e:
@@ -50,38 +65,27 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 status_code=400,
                 error_code="VALIDATION_ERROR",
                 message="Dados de entrada inválidos",
-                details=[
-                    {"field": err["loc"][0] if err["loc"] else "unknown", "message": err["msg"]}
-                    for err in e.errors()
-                ],
+                details=_detalhes_validacao(e),
                 request_id=request_id,
             )
 
-        service = FinancingService()
-        try:
-            result = service.simular(simulation_request)
-        finally:
-            service.close()
-
-        logger.info(
-            "Simulação concluída com sucesso",
-            extra={"request_id": request_id, "parcela_mensal": result.resultado.parcela_mensal},
+        service = get_financing_service()
+        corpo = service.simular_serializado(
+            simulation_request, deadline=Deadline.do_contexto_lambda(context)
         )
+        envelope = {"request_id": request_id, "timestamp": datetime.utcnow().isoformat()}
+
+        logger.info("Simulação concluída com sucesso", extra={"request_id": request_id})
 
         # ✨ NOVO: Persistir no DynamoDB
         simulation_id = None
         try:
-            headers = event.get("headers", {})
-            user_identifier = headers.get("x-user-id") or event.get("requestContext", {}).get(
-                "http", {}
-            ).get("sourceIp", "unknown")
-
-            # Converte resultado para dict
-            result_dict = result.model_dump(mode="json")
+            user_identifier = _identificar_usuario(event)
 
+            # O item é o próprio corpo da resposta, sem decodificá-lo aqui
             db_service = get_dynamodb_service()
             db_result = db_service.save_simulation(
-                simulation_data=result_dict, user_identifier=user_identifier
+                simulation_data=_com_envelope(corpo, envelope), user_identifier=user_identifier
             )
 
             simulation_id = db_result["simulation_id"]
@@ -91,7 +95,313 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             logger.warning(f"Erro ao persistir no DynamoDB: {str(db_error)}", exc_info=True)
             # Continua sem quebrar - persistência é opcional
 
-        return _success_response(result, request_id, simulation_id)
+        if simulation_id:
+            envelope["simulation_id"] = simulation_id
+
+        # O corpo em cache segue como está; só os campos da requisição são acrescentados
+        return _json_response(_com_envelope(corpo, envelope), request_id)
+
+    except ExternalServiceException as e:
+        logger.error("Erro em serviço externo", extra={"request_id": request_id, "error": str(e)})
+        return _error_response(
+            status_code=503,
+            error_code="EXTERNAL_SERVICE_ERROR",
+            message="Serviços externos temporariamente indisponíveis",
+            details=str(e),
+            request_id=request_id,
+        )
+
+    except BusinessException as e:
+        logger.error("Erro de negócio", extra={"request_id": request_id, "error": str(e)})
+        return _error_response(
+            status_code=400, error_code="BUSINESS_ERROR", message=str(e), request_id=request_id
+        )
+
+    except Exception as e:
+        logger.exception(
+            "Erro não tratado", extra={"request_id": request_id, "error_type": type(e).__name__}
+        )
+        return _error_response(
+            status_code=500,
+            error_code="INTERNAL_ERROR",
+            message="Erro interno do servidor",
+            details="Entre em contato com o suporte se o problema persistir",
+            request_id=request_id,
+        )
+
+
+def simular_lote(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Simula vários financiamentos em uma requisição.
+
+    Body: {"simulacoes": [SimulationRequest, ...]} (até BATCH_MAX_ITEMS itens).
+
+    Todos os itens válidos usam o mesmo snapshot de taxa e são gravados juntos
+    no DynamoDB. Itens inválidos não interrompem o lote: cada posição da
+    resposta traz o resultado ou os erros de validação daquele item.
+    """
+    request_id = context.request_id if hasattr(context, "request_id") else "local"
+
+    try:
+        try:
+            body = _parse_body(event)
+        except ValueError as e:
+            return _error_response(
+                status_code=400,
+                error_code="INVALID_JSON",
+                message="Body JSON inválido",
+                details=str(e),
+                request_id=request_id,
+            )
+
+        itens = body.get("simulacoes") if isinstance(body, dict) else None
+        max_itens = int(os.getenv("BATCH_MAX_ITEMS", "500"))
+
+        if not isinstance(itens, list) or not 1 <= len(itens) <= max_itens:
+            return _error_response(
+                status_code=400,
+                error_code="VALIDATION_ERROR",
+                message=f"'simulacoes' deve ser uma lista com 1 a {max_itens} itens",
+                request_id=request_id,
+            )
+
+        resultados: list = [None] * len(itens)
+        validos = []
+
+        for indice, item in enumerate(itens):
+            try:
+                if not isinstance(item, dict):
+                    raise TypeError("Item deve ser um objeto JSON")
+                validos.append((indice, SimulationRequest(**item)))
+            except ValidationError as e:
+                resultados[indice] = {
+                    "indice": indice,
+                    "status": "erro",
+                    "erros": _detalhes_validacao(e),
+                }
+            except TypeError as e:
+                resultados[indice] = {
+                    "indice": indice,
+                    "status": "erro",
+                    "erros": [{"field": "unknown", "message": str(e)}],
+                }
+
+        snapshot_id = None
+
+        if validos:
+            service = get_financing_service()
+            snapshot, simulacoes = service.simular_lote(
+                [request for _, request in validos],
+                deadline=Deadline.do_contexto_lambda(context),
+            )
+            snapshot_id = snapshot.snapshot_id
+
+            # Cada simulação é codificada uma vez; o mesmo JSON vai para o DynamoDB
+            corpos = [simulacao.model_dump_json() for simulacao in simulacoes]
+            ids = _persistir_lote(event, corpos)
+
+            for posicao, (indice, _) in enumerate(validos):
+                resultados[indice] = _com_fragmentos(
+                    {
+                        "indice": indice,
+                        "status": "ok",
+                        "simulation_id": ids[posicao] if ids else None,
+                    },
+                    resultado=corpos[posicao],
+                )
+
+        logger.info(
+            "Lote de simulações processado",
+            extra={"request_id": request_id, "total": len(itens), "validos": len(validos)},
+        )
+
+        # Itens com erro ainda são dicts; os simulados já chegam codificados
+        itens_json = (
+            item if isinstance(item, str) else json.dumps(item, ensure_ascii=False, default=str)
+            for item in resultados
+        )
+
+        return _json_response(
+            _com_fragmentos(
+                {
+                    "snapshot_id": snapshot_id,
+                    "total": len(itens),
+                    "sucesso": len(validos),
+                    "falhas": len(itens) - len(validos),
+                    "request_id": request_id,
+                },
+                resultados=f"[{','.join(itens_json)}]",
+            ),
+            request_id,
+        )
+
+    except ExternalServiceException as e:
+        logger.error("Erro em serviço externo", extra={"request_id": request_id, "error": str(e)})
+        return _error_response(
+            status_code=503,
+            error_code="EXTERNAL_SERVICE_ERROR",
+            message="Serviços externos temporariamente indisponíveis",
+            details=str(e),
+            request_id=request_id,
+        )
+
+    except Exception as e:
+        logger.exception(
+            "Erro não tratado", extra={"request_id": request_id, "error_type": type(e).__name__}
+        )
+        return _error_response(
+            status_code=500,
+            error_code="INTERNAL_ERROR",
+            message="Erro interno do servidor",
+            details="Entre em contato com o suporte se o problema persistir",
+            request_id=request_id,
+        )
+
+
+def _persistir_lote(event: Dict[str, Any], corpos: List[str]) -> Optional[List[str]]:
+    try:
+        db_results = get_dynamodb_service().save_simulations(
+            corpos, user_identifier=_identificar_usuario(event)
+        )
+        return [db_result["simulation_id"] for db_result in db_results]
+
+    except Exception as db_error:
+        logger.warning(f"Erro ao persistir lote no DynamoDB: {str(db_error)}", exc_info=True)
+        # Continua sem quebrar - persistência é opcional
+        return None
+
+
+def comparar(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Simula PRICE e SAC lado a lado com a mesma taxa.
+
+    Body: ComparacaoRequest (os campos de SimulationRequest, sem tipo_amortizacao).
+    Retorna as duas simulações, o mês em que as parcelas se cruzam e a
+    diferença de juros totais. A comparação é persistida como um único item.
+    """
+
+    def executar(request: ComparacaoRequest, request_id: str, deadline: Optional[Deadline]):
+        result = get_financing_service().comparar(request, deadline=deadline)
+
+        corpo = result.model_dump_json(exclude={"request_id"})
+        envelope = {"request_id": request_id}
+
+        try:
+            db_result = get_dynamodb_service().save_simulation(
+                simulation_data=_com_envelope(corpo, envelope),
+                user_identifier=_identificar_usuario(event),
+            )
+            envelope["simulation_id"] = db_result["simulation_id"]
+
+        except Exception as db_error:
+            logger.warning(f"Erro ao persistir no DynamoDB: {str(db_error)}", exc_info=True)
+            # Continua sem quebrar - persistência é opcional
+
+        return _json_response(_com_envelope(corpo, envelope), request_id)
+
+    return _executar(event, context, ComparacaoRequest, executar)
+
+
+def grade(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Grade de simulações (entradas × prazos × tipos de amortização) em uma chamada.
+
+    Body: GridRequest. Retorna, para cada tipo, matrizes de parcela mensal,
+    última parcela, total pago e juros totais, todas com a mesma taxa.
+    """
+
+    def executar(request: GridRequest, request_id: str, deadline: Optional[Deadline]):
+        result = get_financing_service().simular_grade(request, deadline=deadline)
+        return _success_response(result, request_id)
+
+    return _executar(event, context, GridRequest, executar)
+
+
+def cenarios(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Distribuição de resultados de um financiamento corrigido por SELIC ou IPCA.
+
+    Body: MonteCarloRequest. Simula `num_trajetorias` trajetórias do indexador
+    (modelo calibrado na série histórica do BCB) e retorna percentis do total
+    pago, da maior parcela e do maior saldo devedor.
+    """
+
+    def executar(request: MonteCarloRequest, request_id: str, deadline: Optional[Deadline]):
+        result = get_financing_service().simular_cenarios(request, deadline=deadline)
+        return _success_response(result, request_id)
+
+    return _executar(event, context, MonteCarloRequest, executar)
+
+
+def capacidade(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Maior valor financiável para uma renda mensal.
+
+    Body: CapacidadeRequest. A parcela máxima é renda × comprometimento; o
+    valor vem da inversa da anuidade (PRICE) ou da primeira parcela (SAC).
+    """
+
+    def executar(request: CapacidadeRequest, request_id: str, deadline: Optional[Deadline]):
+        result = get_financing_service().calcular_capacidade(request, deadline=deadline)
+        return _success_response(result, request_id)
+
+    return _executar(event, context, CapacidadeRequest, executar)
+
+
+def prazo(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Menor prazo cuja parcela não passa de um valor máximo.
+
+    Body: PrazoRequest. Retorna o prazo mínimo (12 a 480 meses) e a simulação
+    com esse prazo; se nenhum prazo atende, responde BUSINESS_ERROR.
+    """
+
+    def executar(request: PrazoRequest, request_id: str, deadline: Optional[Deadline]):
+        result = get_financing_service().calcular_prazo_minimo(request, deadline=deadline)
+        return _success_response(result, request_id)
+
+    return _executar(event, context, PrazoRequest, executar)
+
+
+def _executar(
+    event: Dict[str, Any],
+    context: Any,
+    modelo: Type[BaseModel],
+    executar: Callable[[Any, str, Optional[Deadline]], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Fluxo comum dos endpoints: parse, validação do body e tratamento de erros."""
+    request_id = context.request_id if hasattr(context, "request_id") else "local"
+
+    try:
+        try:
+            body = _parse_body(event)
+        except ValueError as e:
+            return _error_response(
+                status_code=400,
+                error_code="INVALID_JSON",
+                message="Body JSON inválido",
+                details=str(e),
+                request_id=request_id,
+            )
+
+        if not isinstance(body, dict):
+            return _body_nao_objeto(request_id)
+
+        try:
+            request = modelo(**body)
+        except ValidationError as e:
+            logger.warning(
+                "Erro de validação", extra={"request_id": request_id, "errors": e.errors()}
+            )
+            return _error_response(
+                status_code=400,
+                error_code="VALIDATION_ERROR",
+                message="Dados de entrada inválidos",
+                details=_detalhes_validacao(e),
+                request_id=request_id,
+            )
+
+        return executar(request, request_id, Deadline.do_contexto_lambda(context))
 
     except ExternalServiceException as e:
         logger.error("Erro em serviço externo", extra={"request_id": request_id, "error": str(e)})
@@ -122,6 +432,171 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         )
 
 
+def tabela(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Tabela de amortização completa, em NDJSON ou CSV, paginada por meses.
+
+    Query Parameters:
+        - from_month (opcional): Primeiro mês da janela (padrão: 1)
+        - to_month (opcional): Último mês da janela (padrão: fim da página)
+        - format (opcional): "ndjson" (padrão) ou "csv"; também aceito via Accept
+
+    Cada resposta cobre no máximo TABLE_MAX_PAGE_MONTHS meses. Se houver mais,
+    o cabeçalho X-Next-From-Month indica onde começa a próxima página.
+    """
+    request_id = context.request_id if hasattr(context, "request_id") else "local"
+
+    try:
+        try:
+            body = _parse_body(event)
+        except ValueError as e:
+            return _error_response(
+                status_code=400,
+                error_code="INVALID_JSON",
+                message="Body JSON inválido",
+                details=str(e),
+                request_id=request_id,
+            )
+
+        if not isinstance(body, dict):
+            return _body_nao_objeto(request_id)
+
+        try:
+            simulation_request = SimulationRequest(**body)
+        except ValidationError as e:
+            return _error_response(
+                status_code=400,
+                error_code="VALIDATION_ERROR",
+                message="Dados de entrada inválidos",
+                details=_detalhes_validacao(e),
+                request_id=request_id,
+            )
+
+        try:
+            formato = _formato_tabela(event)
+            de_mes, ate_mes = _janela_de_meses(event, simulation_request.prazo_meses)
+        except ValueError as e:
+            return _error_response(
+                status_code=400,
+                error_code="INVALID_PARAMETERS",
+                message="Parâmetros inválidos",
+                details=str(e),
+                request_id=request_id,
+            )
+
+        service = get_financing_service()
+        snapshot, parcelas = service.gerar_tabela(
+            simulation_request,
+            de_mes=de_mes,
+            ate_mes=ate_mes,
+            deadline=Deadline.do_contexto_lambda(context),
+        )
+
+        headers = {
+            "Content-Type": FORMATOS_TABELA[formato],
+            "Access-Control-Allow-Origin": "*",
+            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key",
+            "Access-Control-Allow-Methods": "POST,OPTIONS",
+            "Access-Control-Expose-Headers": "X-Next-From-Month,X-Total-Months,X-Snapshot-Id",
+            "X-Request-Id": request_id,
+            "X-Snapshot-Id": snapshot.snapshot_id,
+            "X-Total-Months": str(simulation_request.prazo_meses),
+        }
+        if ate_mes < simulation_request.prazo_meses:
+            headers["X-Next-From-Month"] = str(ate_mes + 1)
+
+        linhas = _linhas_csv(parcelas) if formato == "csv" else _linhas_ndjson(parcelas)
+
+        return {"statusCode": 200, "headers": headers, "body": "".join(linhas)}
+
+    except ExternalServiceException as e:
+        logger.error("Erro em serviço externo", extra={"request_id": request_id, "error": str(e)})
+        return _error_response(
+            status_code=503,
+            error_code="EXTERNAL_SERVICE_ERROR",
+            message="Serviços externos temporariamente indisponíveis",
+            details=str(e),
+            request_id=request_id,
+        )
+
+    except Exception as e:
+        logger.exception(
+            "Erro não tratado", extra={"request_id": request_id, "error_type": type(e).__name__}
+        )
+        return _error_response(
+            status_code=500,
+            error_code="INTERNAL_ERROR",
+            message="Erro interno do servidor",
+            details="Entre em contato com o suporte se o problema persistir",
+            request_id=request_id,
+        )
+
+
+def _formato_tabela(event: Dict[str, Any]) -> str:
+    query_params = event.get("queryStringParameters") or {}
+    formato = query_params.get("format")
+
+    if formato is None:
+        accept = (event.get("headers") or {}).get("accept", "")
+        formato = "csv" if "text/csv" in accept else "ndjson"
+
+    if formato not in FORMATOS_TABELA:
+        raise ValueError(f"Formato '{formato}' não suportado. Use: ndjson, csv")
+
+    return formato
+
+
+def _janela_de_meses(event: Dict[str, Any], prazo_meses: int) -> Tuple[int, int]:
+    query_params = event.get("queryStringParameters") or {}
+    maximo = int(os.getenv("TABLE_MAX_PAGE_MONTHS", "120"))
+
+    de_mes = int(query_params.get("from_month", 1))
+    ate_mes = int(query_params.get("to_month", de_mes + maximo - 1))
+    ate_mes = min(ate_mes, prazo_meses, de_mes + maximo - 1)
+
+    if not 1 <= de_mes <= ate_mes:
+        raise ValueError(f"Intervalo de meses inválido: from_month={de_mes}, to_month={ate_mes}")
+
+    return de_mes, ate_mes
+
+
+def _linhas_ndjson(parcelas: Iterable[Parcela]) -> Iterator[str]:
+    for parcela in parcelas:
+        yield json.dumps(parcela.to_dict()) + "\n"
+
+
+def _linhas_csv(parcelas: Iterable[Parcela]) -> Iterator[str]:
+    yield "mes,parcela,juros,amortizacao,saldo_devedor\n"
+    for parcela in parcelas:
+        yield ",".join(str(valor) for valor in parcela.to_dict().values()) + "\n"
+
+
+def _identificar_usuario(event: Dict[str, Any]) -> str:
+    headers = event.get("headers") or {}
+    usuario: str = headers.get("x-user-id") or event.get("requestContext", {}).get("http", {}).get(
+        "sourceIp", "unknown"
+    )
+    return usuario
+
+
+def _detalhes_validacao(e: ValidationError) -> List[Dict[str, Any]]:
+    return [
+        {"field": err["loc"][0] if err["loc"] else "unknown", "message": err["msg"]}
+        for err in e.errors()
+    ]
+
+
+def _body_nao_objeto(request_id: str) -> Dict[str, Any]:
+    # JSON válido, mas não um objeto (null, lista, string...): sem campos para validar
+    return _error_response(
+        status_code=400,
+        error_code="VALIDATION_ERROR",
+        message="Dados de entrada inválidos",
+        details="Body deve ser um objeto JSON",
+        request_id=request_id,
+    )
+
+
 def _parse_body(event: Dict[str, Any]) -> Dict[str, Any]:
     body = event.get("body", "{}")
 
@@ -134,14 +609,42 @@ def _parse_body(event: Dict[str, Any]) -> Dict[str, Any]:
     return body
 
 
-def _success_response(result: Any, request_id: str, simulation_id: str = None) -> Dict[str, Any]:
-    response_dict = result.model_dump(mode="json")
-
-    response_dict["request_id"] = request_id
+def _success_response(
+    result: BaseModel, request_id: str, simulation_id: str = None
+) -> Dict[str, Any]:
+    """Resposta 200 com o modelo codificado direto pelo serializador do Pydantic."""
+    envelope = {"request_id": request_id}
 
     if simulation_id:
-        response_dict["simulation_id"] = simulation_id
+        envelope["simulation_id"] = simulation_id
+
+    return _json_response(
+        _com_envelope(result.model_dump_json(exclude={"request_id"}), envelope), request_id
+    )
+
+
+def _com_envelope(corpo: str, campos: Dict[str, Any]) -> str:
+    """Acrescenta `campos` a um objeto JSON já serializado, sem decodificá-lo."""
+    if not campos:
+        return corpo
+
+    envelope = json.dumps(campos, ensure_ascii=False, default=str)
+
+    # Objeto vazio: não há membros do corpo para emendar após a vírgula
+    restante = corpo[1:].lstrip()
+    if restante.startswith("}"):
+        return envelope
+
+    return f"{envelope[:-1]},{restante}"
+
+
+def _com_fragmentos(campos: Dict[str, Any], **fragmentos: str) -> str:
+    """Objeto JSON com `campos` codificados e `fragmentos` já em JSON, inseridos como estão."""
+    inseridos = ",".join(f'"{chave}":{valor}' for chave, valor in fragmentos.items())
+    return _com_envelope(f"{{{inseridos}}}", campos)
+
 
+def _json_response(corpo: str, request_id: str) -> Dict[str, Any]:
     return {
         "statusCode": 200,
         "headers": {
@@ -151,7 +654,7 @@ def _success_response(result: Any, request_id: str, simulation_id: str = None) -
             "Access-Control-Allow-Methods": "POST,OPTIONS",
             "X-Request-Id": request_id,
         },
-        "body": json.dumps(response_dict, ensure_ascii=False, default=str),
+        "body": corpo,
     }
 
 
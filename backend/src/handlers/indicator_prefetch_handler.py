@@ -0,0 +1,50 @@
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+from src.services.indicator_service import IndicatorService
+from src.utils.deadline import Deadline
+from src.utils.exceptions import ExternalServiceException
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    """
+    Função agendada que consulta SELIC e IPCA e publica um snapshot de taxa versionado.
+
+    Com o snapshot publicado, o handler de simulação não consulta as APIs externas
+    durante a requisição do usuário.
+    """
+    service = IndicatorService()
+
+    try:
+        snapshot = service.publicar_snapshot(deadline=Deadline.do_contexto_lambda(context))
+
+    except ExternalServiceException as e:
+        # Propagada para que a invocação conte como erro (retries e alarmes do Lambda)
+        logger.error("Falha no prefetch de indicadores", extra={"error": str(e)})
+        raise
+
+    finally:
+        service.close()
+
+    logger.info(
+        "Prefetch de indicadores concluído",
+        extra={
+            "snapshot_id": snapshot.snapshot_id,
+            "versao": snapshot.versao,
+            "indicador_tipo": snapshot.indicador.tipo,
+            "taxa_anual": snapshot.taxa.taxa_anual,
+        },
+    )
+
+    return {
+        "status": "ok",
+        "snapshot_id": snapshot.snapshot_id,
+        "versao": snapshot.versao,
+        "indicador": snapshot.indicador.tipo,
+        "taxa_anual": snapshot.taxa.taxa_anual,
+        "taxa_mensal": snapshot.taxa.taxa_mensal,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
@@ -2,13 +2,38 @@
 Módulo de modelos de dados.
 """
 
-from src.models.domain import Indicador, Parcela, ResultadoCalculo, TabelaAmortizacao, TaxaJuros
-from src.models.requests import SimulationRequest
+from src.models.domain import (
+    AmortizacaoExtraordinaria,
+    EncargosFinanciamento,
+    Indicador,
+    Parcela,
+    ResultadoCalculo,
+    ResumoAmortizacao,
+    SnapshotTaxa,
+    TabelaAmortizacao,
+    TaxaJuros,
+)
+from src.models.requests import (
+    CapacidadeRequest,
+    ComparacaoRequest,
+    GridRequest,
+    MonteCarloRequest,
+    PrazoRequest,
+    SimulationRequest,
+)
 from src.models.responses import (
     Analise,
+    CapacidadeResponse,
+    ComparacaoResponse,
+    ComparacaoSistemas,
     Comparativo,
     DadosSimulacao,
     ErrorResponse,
+    GradeAmortizacao,
+    GridResponse,
+    MonteCarloResponse,
+    Percentis,
+    PrazoResponse,
     ResultadoFinanciamento,
     SimulationResponse,
     TaxasAplicadas,
@@ -17,9 +42,22 @@ from src.models.responses import (
 __all__ = [
     # Requests
     "SimulationRequest",
+    "GridRequest",
+    "ComparacaoRequest",
+    "CapacidadeRequest",
+    "PrazoRequest",
+    "MonteCarloRequest",
     # Responses
     "SimulationResponse",
     "ErrorResponse",
+    "GridResponse",
+    "ComparacaoResponse",
+    "ComparacaoSistemas",
+    "CapacidadeResponse",
+    "PrazoResponse",
+    "GradeAmortizacao",
+    "MonteCarloResponse",
+    "Percentis",
     "DadosSimulacao",
     "TaxasAplicadas",
     "ResultadoFinanciamento",
@@ -28,7 +66,11 @@ __all__ = [
     # Domain
     "Indicador",
     "TaxaJuros",
+    "SnapshotTaxa",
     "Parcela",
+    "AmortizacaoExtraordinaria",
+    "EncargosFinanciamento",
     "TabelaAmortizacao",
+    "ResumoAmortizacao",
     "ResultadoCalculo",
 ]
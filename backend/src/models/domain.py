@@ -1,5 +1,7 @@
+import math
+from array import array
 from dataclasses import dataclass
-from typing import List, Literal
+from typing import Iterable, Iterator, List, Literal, Optional, Sequence, Union, overload
 
 
 @dataclass
@@ -18,7 +20,58 @@ class TaxaJuros:
     formula: str
 
 
-@dataclass
+@dataclass(frozen=True)
+class SnapshotTaxa:
+    """Taxa aplicada a uma simulação, obtida uma única vez por requisição."""
+
+    snapshot_id: str
+    taxa: TaxaJuros
+    obtido_em: str
+    versao: Optional[int] = None
+
+    @property
+    def indicador(self) -> Indicador:
+        return self.taxa.indicador
+
+
+@dataclass(frozen=True)
+class AmortizacaoExtraordinaria:
+    """Pagamento extra feito junto com a parcela do mês `mes`."""
+
+    mes: int
+    valor: float
+    modo: Literal["REDUZIR_PRAZO", "REDUZIR_PARCELA"]
+
+
+@dataclass(frozen=True)
+class EncargosFinanciamento:
+    """
+    Custos que, somados às parcelas, compõem o CET.
+
+    Tarifas iniciais são pagas na contratação; os seguros MIP (sobre o saldo
+    devedor) e DFI (sobre o valor do imóvel) e a taxa de administração, a cada mês.
+    """
+
+    tarifas_iniciais: float = 0.0
+    taxa_administracao_mensal: float = 0.0
+    mip_percentual_mensal: float = 0.0
+    dfi_percentual_mensal: float = 0.0
+
+
+def arredondar_centavos(valor: float) -> float:
+    """
+    Arredonda para o centavo, com empates (meio centavo) para longe do zero.
+
+    Os backends chegam ao mesmo valor por caminhos diferentes (laço, NumPy,
+    forma fechada) e diferem no ruído de ponto flutuante; round(x, 2) decidia
+    empates como 1234.565 conforme esse ruído. O valor é primeiro fixado em
+    4 casas de centavo, o que absorve o ruído, e só então arredondado.
+    """
+    centavos = math.floor(round(abs(valor) * 100, 4) + 0.5)
+    return (centavos if valor >= 0 else -centavos) / 100
+
+
+@dataclass(slots=True)
 class Parcela:
     numero: int
     valor_parcela: float
@@ -29,18 +82,158 @@ class Parcela:
     def to_dict(self) -> dict:
         return {
             "mes": self.numero,
-            "parcela": round(self.valor_parcela, 2),
-            "juros": round(self.valor_juros, 2),
-            "amortizacao": round(self.valor_amortizacao, 2),
-            "saldo_devedor": round(self.saldo_devedor, 2),
+            "parcela": arredondar_centavos(self.valor_parcela),
+            "juros": arredondar_centavos(self.valor_juros),
+            "amortizacao": arredondar_centavos(self.valor_amortizacao),
+            "saldo_devedor": arredondar_centavos(self.saldo_devedor),
         }
 
 
-@dataclass
+class ParcelasView(Sequence[Parcela]):
+    """
+    Sequência somente leitura sobre as colunas de uma TabelaAmortizacao.
+
+    Cada Parcela é criada no acesso; nada é mantido além das colunas.
+    """
+
+    __slots__ = ("_tabela",)
+
+    def __init__(self, tabela: "TabelaAmortizacao"):
+        self._tabela = tabela
+
+    def __len__(self) -> int:
+        return len(self._tabela.valores_parcela)
+
+    @overload
+    def __getitem__(self, indice: int) -> Parcela: ...
+
+    @overload
+    def __getitem__(self, indice: slice) -> List[Parcela]: ...
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._tabela.linha(i) for i in range(*indice.indices(len(self)))]
+
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Índice de parcela fora da tabela")
+
+        return self._tabela.linha(indice)
+
+    def __iter__(self) -> Iterator[Parcela]:
+        for indice in range(len(self)):
+            yield self._tabela.linha(indice)
+
+
 class TabelaAmortizacao:
+    """
+    Tabela de amortização em colunas (array('d') ou arrays NumPy), uma por campo.
+
+    Guarda 4 floats por mês em vez de um objeto Parcela por mês. `parcelas`
+    continua indexável e iterável, criando as linhas sob demanda.
+    """
+
+    __slots__ = (
+        "valores_parcela",
+        "valores_juros",
+        "valores_amortizacao",
+        "saldos_devedores",
+        "total_pago",
+        "total_juros",
+    )
+
+    def __init__(
+        self,
+        valores_parcela: Sequence[float],
+        valores_juros: Sequence[float],
+        valores_amortizacao: Sequence[float],
+        saldos_devedores: Sequence[float],
+        total_pago: float,
+        total_juros: float,
+    ):
+        self.valores_parcela = valores_parcela
+        self.valores_juros = valores_juros
+        self.valores_amortizacao = valores_amortizacao
+        self.saldos_devedores = saldos_devedores
+        self.total_pago = total_pago
+        self.total_juros = total_juros
+
+    @classmethod
+    def de_parcelas(
+        cls, parcelas: Iterable[Parcela], total_pago: float, total_juros: float
+    ) -> "TabelaAmortizacao":
+        parcelas = list(parcelas)
+
+        return cls(
+            valores_parcela=array("d", (p.valor_parcela for p in parcelas)),
+            valores_juros=array("d", (p.valor_juros for p in parcelas)),
+            valores_amortizacao=array("d", (p.valor_amortizacao for p in parcelas)),
+            saldos_devedores=array("d", (p.saldo_devedor for p in parcelas)),
+            total_pago=total_pago,
+            total_juros=total_juros,
+        )
+
+    @classmethod
+    def de_centavos(
+        cls,
+        parcelas: Sequence[int],
+        juros: Sequence[int],
+        amortizacoes: Sequence[int],
+        saldos: Sequence[int],
+    ) -> "TabelaAmortizacao":
+        """
+        Tabela a partir de colunas em centavos inteiros.
+
+        Cada valor vira o float mais próximo de c/100, então round(x, 2) devolve
+        exatamente o centavo calculado, e os totais são somados em inteiros.
+        """
+        return cls(
+            valores_parcela=array("d", (c / 100 for c in parcelas)),
+            valores_juros=array("d", (c / 100 for c in juros)),
+            valores_amortizacao=array("d", (c / 100 for c in amortizacoes)),
+            saldos_devedores=array("d", (c / 100 for c in saldos)),
+            total_pago=sum(parcelas) / 100,
+            total_juros=sum(juros) / 100,
+        )
+
+    @property
+    def parcelas(self) -> ParcelasView:
+        return ParcelasView(self)
+
+    def linha(self, indice: int) -> Parcela:
+        return Parcela(
+            numero=indice + 1,
+            valor_parcela=float(self.valores_parcela[indice]),
+            valor_juros=float(self.valores_juros[indice]),
+            valor_amortizacao=float(self.valores_amortizacao[indice]),
+            saldo_devedor=float(self.saldos_devedores[indice]),
+        )
+
+    def primeira_parcela(self) -> Parcela:
+        return self.linha(0)
+
+    def ultima_parcela(self) -> Parcela:
+        return self.linha(len(self.valores_parcela) - 1)
+
+    def resumo(self, num_pontos: int = 12) -> List[Parcela]:
+        return [self.linha(i) for i in indices_resumo(len(self.valores_parcela), num_pontos)]
+
+
+@dataclass
+class ResumoAmortizacao:
+    """
+    Pontos do resumo e totais de uma tabela, sem as demais parcelas.
+
+    Calculado em forma fechada (ver BaseCalculator.calcular_resumo); oferece a
+    mesma interface de leitura de TabelaAmortizacao usada na resposta da simulação.
+    """
+
     parcelas: List[Parcela]
     total_pago: float
     total_juros: float
+    prazo_meses: int
+    num_pontos: int
 
     def primeira_parcela(self) -> Parcela:
         return self.parcelas[0]
@@ -49,24 +242,31 @@ class TabelaAmortizacao:
         return self.parcelas[-1]
 
     def resumo(self, num_pontos: int = 12) -> List[Parcela]:
-        total_parcelas = len(self.parcelas)
-        if total_parcelas <= num_pontos:
-            return self.parcelas
+        if num_pontos != self.num_pontos:
+            raise ValueError(f"Resumo calculado com {self.num_pontos} pontos, não {num_pontos}")
+
+        return self.parcelas
+
+
+def indices_resumo(total_parcelas: int, num_pontos: int = 12) -> List[int]:
+    """Índices (base 0) das parcelas exibidas no resumo: primeira, intermediárias e última."""
+    if total_parcelas <= num_pontos:
+        return list(range(total_parcelas))
 
-        indices = [0]
+    indices = [0]
 
-        step = total_parcelas // (num_pontos - 1)
-        for i in range(1, num_pontos - 1):
-            indices.append(i * step)
+    step = total_parcelas // (num_pontos - 1)
+    for i in range(1, num_pontos - 1):
+        indices.append(i * step)
 
-        indices.append(total_parcelas - 1)
+    indices.append(total_parcelas - 1)
 
-        return [self.parcelas[i] for i in indices]
+    return indices
 
 
 @dataclass
 class ResultadoCalculo:
-    tabela: TabelaAmortizacao
+    tabela: Union[TabelaAmortizacao, ResumoAmortizacao]
     parcela_mensal: float
     taxa: TaxaJuros
 
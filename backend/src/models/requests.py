@@ -1,23 +1,10 @@
-from typing import Literal
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
-class SimulationRequest(BaseModel):
-    valor_imovel: float = Field(
-        gt=0, le=100_000_000, description="Valor do imóvel em reais", examples=[500000.00]
-    )
-
-    entrada: float = Field(ge=0, description="Valor da entrada em reais", examples=[100000.00])
-
-    prazo_meses: int = Field(
-        ge=12, le=480, description="Prazo do financiamento em meses", examples=[360]
-    )
-
-    tipo_amortizacao: Literal["PRICE", "SAC"] = Field(
-        description="Sistema de amortização: PRICE (parcelas fixas) ou SAC (parcelas decrescentes)",
-        examples=["PRICE"],
-    )
+class DadosRegiao(BaseModel):
+    """UF do imóvel, validada e em maiúsculas."""
 
     regiao: str = Field(
         min_length=2, max_length=2, description="Sigla da UF (ex: SP, RJ, MG)", examples=["SP"]
@@ -68,6 +55,28 @@ class SimulationRequest(BaseModel):
 
         return v
 
+
+class DadosImovel(DadosRegiao):
+    """Valor do imóvel e UF."""
+
+    valor_imovel: float = Field(
+        gt=0, le=100_000_000, description="Valor do imóvel em reais", examples=[500000.00]
+    )
+
+
+class DadosPrazo(BaseModel):
+    """Prazo do financiamento."""
+
+    prazo_meses: int = Field(
+        ge=12, le=480, description="Prazo do financiamento em meses", examples=[360]
+    )
+
+
+class DadosEntrada(DadosImovel):
+    """Valor do imóvel, entrada (menor que o imóvel) e UF."""
+
+    entrada: float = Field(ge=0, description="Valor da entrada em reais", examples=[100000.00])
+
     @field_validator("entrada")
     @classmethod
     def entrada_menor_que_imovel(cls, v: float, info) -> float:
@@ -82,6 +91,74 @@ class SimulationRequest(BaseModel):
         """Calcula o percentual da entrada sobre o valor do imóvel."""
         return (self.entrada / self.valor_imovel) * 100
 
+
+class DadosFinanciamento(DadosPrazo, DadosEntrada):
+    """Campos comuns às requisições de um financiamento."""
+
+
+class SimulationRequest(DadosFinanciamento):
+    tipo_amortizacao: Literal["PRICE", "SAC"] = Field(
+        description="Sistema de amortização: PRICE (parcelas fixas) ou SAC (parcelas decrescentes)",
+        examples=["PRICE"],
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "valor_imovel": 500000.00,
+                "entrada": 100000.00,
+                "prazo_meses": 360,
+                "tipo_amortizacao": "PRICE",
+                "regiao": "SP",
+            }
+        }
+
+
+class ComparacaoRequest(DadosFinanciamento):
+    """Simulação nos dois sistemas (PRICE e SAC) com a mesma taxa."""
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "valor_imovel": 500000.00,
+                "entrada": 100000.00,
+                "prazo_meses": 360,
+                "regiao": "SP",
+            }
+        }
+
+    def para_sistema(self, tipo_amortizacao: Literal["PRICE", "SAC"]) -> SimulationRequest:
+        return SimulationRequest(**self.model_dump(), tipo_amortizacao=tipo_amortizacao)
+
+
+class MonteCarloRequest(DadosFinanciamento):
+    """Distribuição de resultados de um financiamento com saldo corrigido por um indexador."""
+
+    tipo_amortizacao: Literal["PRICE", "SAC"] = Field(
+        description="Sistema de amortização: PRICE (parcelas fixas) ou SAC (parcelas decrescentes)",
+        examples=["PRICE"],
+    )
+
+    indexador: Literal["SELIC", "IPCA"] = Field(
+        default="IPCA",
+        description="Indicador que corrige o saldo devedor mês a mês",
+        examples=["IPCA"],
+    )
+
+    num_trajetorias: int = Field(
+        default=1000,
+        ge=100,
+        le=10_000,
+        description="Número de trajetórias simuladas do indexador",
+        examples=[1000],
+    )
+
+    semente: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Semente do gerador aleatório, para resultados reprodutíveis",
+    )
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -90,5 +167,90 @@ class SimulationRequest(BaseModel):
                 "prazo_meses": 360,
                 "tipo_amortizacao": "PRICE",
                 "regiao": "SP",
+                "indexador": "IPCA",
+                "num_trajetorias": 1000,
             }
         }
+
+
+class CapacidadeRequest(DadosPrazo, DadosRegiao):
+    """Maior financiamento possível para uma renda mensal."""
+
+    renda_mensal: float = Field(
+        gt=0, description="Renda mensal bruta em reais", examples=[15000.00]
+    )
+
+    comprometimento_renda: float = Field(
+        default=30,
+        gt=0,
+        le=100,
+        description="Percentual máximo da renda comprometido com a parcela",
+        examples=[30],
+    )
+
+    entrada: float = Field(
+        default=0, ge=0, description="Valor da entrada em reais", examples=[100000.00]
+    )
+
+    tipo_amortizacao: Literal["PRICE", "SAC"] = Field(
+        description="Sistema de amortização: PRICE (parcelas fixas) ou SAC (parcelas decrescentes)",
+        examples=["PRICE"],
+    )
+
+    def parcela_maxima(self) -> float:
+        return self.renda_mensal * self.comprometimento_renda / 100
+
+
+class PrazoRequest(DadosEntrada):
+    """Menor prazo cuja parcela não passa de um valor máximo."""
+
+    parcela_maxima: float = Field(
+        gt=0, description="Maior parcela mensal aceita, em reais", examples=[4000.00]
+    )
+
+    tipo_amortizacao: Literal["PRICE", "SAC"] = Field(
+        description="Sistema de amortização: PRICE (parcelas fixas) ou SAC (parcelas decrescentes)",
+        examples=["PRICE"],
+    )
+
+
+class GridRequest(DadosImovel):
+    """Grade de simulações: combinações de entrada × prazo para cada tipo de amortização."""
+
+    entradas: List[float] = Field(
+        min_length=1,
+        max_length=50,
+        description="Valores de entrada em reais (linhas da grade)",
+        examples=[[50000.00, 100000.00, 150000.00]],
+    )
+
+    prazos_meses: List[int] = Field(
+        min_length=1,
+        max_length=50,
+        description="Prazos em meses (colunas da grade)",
+        examples=[[120, 240, 360]],
+    )
+
+    tipos_amortizacao: List[Literal["PRICE", "SAC"]] = Field(
+        default=["PRICE", "SAC"],
+        min_length=1,
+        max_length=2,
+        description="Sistemas de amortização calculados",
+    )
+
+    @field_validator("prazos_meses")
+    @classmethod
+    def prazos_no_intervalo(cls, v: List[int]) -> List[int]:
+        for prazo in v:
+            if not 12 <= prazo <= 480:
+                raise ValueError(f"Prazo {prazo} fora do intervalo de 12 a 480 meses")
+        return v
+
+    @model_validator(mode="after")
+    def entradas_menores_que_imovel(self) -> "GridRequest":
+        for entrada in self.entradas:
+            if not 0 <= entrada < self.valor_imovel:
+                raise ValueError(
+                    f"Entrada {entrada} deve ser não negativa e menor que o valor do imóvel"
+                )
+        return self
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Literal
+from typing import Dict, List, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -18,6 +18,8 @@ class TaxasAplicadas(BaseModel):
     taxa_juros_anual: float = Field(description="Taxa de juros anual aplicada (%)")
     taxa_juros_mensal: float = Field(description="Taxa de juros mensal aplicada (%)")
     formula_aplicada: str = Field(description="Fórmula utilizada no cálculo da taxa")
+    snapshot_id: str = Field(description="ID do snapshot de taxa usado na simulação")
+    obtido_em: str = Field(description="Data e hora (UTC) em que o indicador foi obtido")
 
 
 class DadosSimulacao(BaseModel):
@@ -128,6 +130,8 @@ class SimulationResponse(BaseModel):
                     "taxa_juros_anual": 10.50,
                     "taxa_juros_mensal": 0.8368,
                     "formula_aplicada": "taxa_base + (selic * fator_ajuste)",
+                    "snapshot_id": "9b2c1f4e-7d3a-4a51-9f0e-2a6c8d4b1e73",
+                    "obtido_em": "2026-01-06T15:29:59.812345+00:00",
                 },
                 "resultado": {
                     "parcela_mensal": 3656.45,
@@ -176,6 +180,123 @@ class SimulationResponse(BaseModel):
     )
 
 
+class ComparacaoSistemas(BaseModel):
+    """Diferenças entre PRICE e SAC para o mesmo financiamento."""
+
+    mes_cruzamento: int = Field(
+        description="Primeiro mês em que a parcela SAC fica menor ou igual à parcela PRICE"
+    )
+    diferenca_juros_totais: float = Field(
+        description="Juros totais PRICE menos juros totais SAC (R$)"
+    )
+    diferenca_primeira_parcela: float = Field(
+        description="Primeira parcela SAC menos parcela PRICE (R$)"
+    )
+    sistema_menor_custo: Literal["PRICE", "SAC"] = Field(
+        description="Sistema com menor total de juros"
+    )
+
+
+class ComparacaoResponse(BaseModel):
+    """Simulações PRICE e SAC calculadas com o mesmo snapshot de taxa."""
+
+    request_id: str = Field(description="ID único da requisição")
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow, description="Data e hora da simulação"
+    )
+    price: SimulationResponse
+    sac: SimulationResponse
+    comparacao: ComparacaoSistemas
+
+
+class CapacidadeResponse(BaseModel):
+    """Maior financiamento cuja parcela cabe na renda informada."""
+
+    request_id: str = Field(description="ID único da requisição")
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow, description="Data e hora da simulação"
+    )
+    parcela_maxima: float = Field(description="Parcela máxima pela renda e comprometimento (R$)")
+    valor_financiado_maximo: float = Field(description="Maior valor financiável (R$)")
+    valor_imovel_maximo: float = Field(description="Valor financiado máximo mais a entrada (R$)")
+    simulacao: SimulationResponse = Field(description="Simulação com o valor financiado máximo")
+
+
+class PrazoResponse(BaseModel):
+    """Menor prazo cuja maior parcela cabe na parcela máxima informada."""
+
+    request_id: str = Field(description="ID único da requisição")
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow, description="Data e hora da simulação"
+    )
+    parcela_maxima: float = Field(description="Maior parcela mensal aceita (R$)")
+    prazo_minimo: int = Field(description="Menor prazo, em meses, que atende à parcela máxima")
+    simulacao: SimulationResponse = Field(description="Simulação com o prazo mínimo")
+
+
+class GradeAmortizacao(BaseModel):
+    """Matrizes entradas × prazos de um sistema de amortização."""
+
+    parcela_mensal: List[List[float]] = Field(
+        description="Parcela mensal (PRICE fixo, SAC primeira parcela)"
+    )
+    ultima_parcela: List[List[float]] = Field(description="Valor da última parcela")
+    total_pago: List[List[float]] = Field(description="Valor total pago")
+    juros_totais: List[List[float]] = Field(description="Valor total de juros pagos")
+
+
+class GridResponse(BaseModel):
+    """Grade de simulações calculada com um único snapshot de taxa."""
+
+    request_id: str = Field(description="ID único da requisição")
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow, description="Data e hora da simulação"
+    )
+    valor_imovel: float
+    entradas: List[float] = Field(description="Linhas das matrizes")
+    prazos_meses: List[int] = Field(description="Colunas das matrizes")
+    taxas: TaxasAplicadas
+    grades: Dict[Literal["PRICE", "SAC"], GradeAmortizacao]
+
+
+class Percentis(BaseModel):
+    """Percentis de uma grandeza entre as trajetórias simuladas."""
+
+    p5: float
+    p25: float
+    p50: float
+    p75: float
+    p95: float
+
+
+class CalibracaoIndexador(BaseModel):
+    """Parâmetros do modelo AR(1) estimados na série histórica do indexador."""
+
+    indexador: Literal["SELIC", "IPCA"]
+    observacoes: int = Field(description="Meses da série histórica usados na calibração")
+    media_mensal: float = Field(description="Variação mensal média (%)")
+    volatilidade_mensal: float = Field(description="Desvio-padrão dos choques mensais (%)")
+    persistencia: float = Field(description="Coeficiente AR(1) entre meses consecutivos")
+
+
+class MonteCarloResponse(BaseModel):
+    """Distribuição de resultados de um financiamento indexado."""
+
+    request_id: str = Field(description="ID único da requisição")
+    timestamp: datetime = Field(
+        default_factory=datetime.utcnow, description="Data e hora da simulação"
+    )
+    dados: DadosSimulacao
+    taxas: TaxasAplicadas
+    calibracao: CalibracaoIndexador
+    num_trajetorias: int
+    total_pago: Percentis = Field(description="Valor total pago ao final do financiamento")
+    parcela_maxima: Percentis = Field(description="Maior parcela de cada trajetória")
+    saldo_devedor_maximo: Percentis = Field(
+        description="Maior saldo devedor de cada trajetória, após o pagamento do mês"
+    )
+
+
 class ErrorDetail(BaseModel):
     """Detalhes de um erro de validação."""
 
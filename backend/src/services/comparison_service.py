@@ -1,9 +1,12 @@
 import logging
 import os
-from typing import List, Literal
+from typing import TYPE_CHECKING, List, Literal, Tuple
 
 from src.models.responses import Analise, Comparativo
 
+if TYPE_CHECKING:
+    from src.models.domain import SnapshotTaxa
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,6 +16,28 @@ class ComparisonService:
         self.taxa_media_nacional = float(os.getenv("TAXA_MEDIA_NACIONAL", "9.80"))
         self.comprometimento_ideal = 30
 
+    def avaliar(
+        self,
+        snapshot: "SnapshotTaxa",
+        parcela_mensal: float,
+        prazo_meses: int,
+        percentual_juros: float,
+    ) -> Tuple[Comparativo, Analise]:
+        """Comparativo e análise de viabilidade usando a taxa do snapshot da requisição."""
+        taxa_anual = snapshot.taxa.taxa_anual
+
+        comparativo = self.comparar_com_media_nacional(taxa_anual)
+
+        analise = self.analisar_viabilidade(
+            parcela_mensal=parcela_mensal,
+            taxa_aplicada=taxa_anual,
+            taxa_media=comparativo.taxa_media_nacional,
+            prazo_meses=prazo_meses,
+            percentual_juros=percentual_juros,
+        )
+
+        return comparativo, analise
+
     def comparar_com_media_nacional(self, taxa_aplicada: float) -> Comparativo:
         diferenca = ((taxa_aplicada - self.taxa_media_nacional) / self.taxa_media_nacional) * 100
 
@@ -1,9 +1,11 @@
+import json
 import logging
+import math
 import os
 import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import boto3
 from boto3.dynamodb.conditions import Key
@@ -24,9 +26,18 @@ class DynamoDBService:
         elif isinstance(obj, list):
             return [self._python_to_dynamo(item) for item in obj]
         elif isinstance(obj, float):
-            return Decimal(str(obj))
+            return _para_decimal(obj)
         return obj
 
+    def _para_item(self, simulation_data: Union[Dict[str, Any], str]) -> Dict[str, Any]:
+        # Corpo já codificado: decodificado direto com números em Decimal, numa passagem
+        if isinstance(simulation_data, str):
+            item: Dict[str, Any] = json.loads(simulation_data, parse_float=Decimal)
+        else:
+            item = self._python_to_dynamo(simulation_data)
+
+        return item
+
     def _dynamo_to_python(self, obj: Any) -> Any:
         if isinstance(obj, dict):
             return {k: self._dynamo_to_python(v) for k, v in obj.items()}
@@ -37,8 +48,9 @@ class DynamoDBService:
         return obj
 
     def save_simulation(
-        self, simulation_data: Dict[str, Any], user_identifier: Optional[str] = None
+        self, simulation_data: Union[Dict[str, Any], str], user_identifier: Optional[str] = None
     ) -> Dict[str, Any]:
+        """Grava uma simulação, em dict ou no JSON já codificado da resposta."""
         try:
             simulation_id = str(uuid.uuid4())
             created_at = datetime.utcnow().isoformat()
@@ -49,7 +61,7 @@ class DynamoDBService:
                 "created_at": created_at,
                 "user_identifier": user_identifier or "anonymous",
                 "ttl": ttl,
-                **self._python_to_dynamo(simulation_data),
+                **self._para_item(simulation_data),
             }
 
             self.table.put_item(Item=item)
@@ -65,6 +77,40 @@ class DynamoDBService:
             logger.error(f"Erro ao salvar: {e.response['Error']['Message']}")
             raise
 
+    def save_simulations(
+        self,
+        simulations: Sequence[Union[Dict[str, Any], str]],
+        user_identifier: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Grava várias simulações com BatchWriteItem (lotes de 25, com reenvio)."""
+        try:
+            created_at = datetime.utcnow().isoformat()
+            ttl = int((datetime.utcnow() + timedelta(days=90)).timestamp())
+            saved = []
+
+            with self.table.batch_writer() as batch:
+                for simulation_data in simulations:
+                    simulation_id = str(uuid.uuid4())
+
+                    batch.put_item(
+                        Item={
+                            "simulation_id": simulation_id,
+                            "created_at": created_at,
+                            "user_identifier": user_identifier or "anonymous",
+                            "ttl": ttl,
+                            **self._para_item(simulation_data),
+                        }
+                    )
+                    saved.append({"simulation_id": simulation_id, "created_at": created_at})
+
+            logger.info(f"Lote de simulações salvo: {len(saved)} itens")
+
+            return saved
+
+        except ClientError as e:
+            logger.error(f"Erro ao salvar lote: {e.response['Error']['Message']}")
+            raise
+
     def get_simulation(self, simulation_id: str, created_at: str) -> Optional[Dict[str, Any]]:
         try:
             response = self.table.get_item(
@@ -123,3 +169,19 @@ def get_dynamodb_service() -> DynamoDBService:
     if _service is None:
         _service = DynamoDBService()
     return _service
+
+
+def _para_decimal(valor: float) -> Decimal:
+    """
+    Decimal exato para o DynamoDB, sem passar por str().
+
+    Valores monetários chegam arredondados ao centavo: o float é o mais próximo
+    de c/100, então o Decimal é montado a partir do inteiro c. Demais valores
+    (taxas, percentuais) usam a representação mais curta do float.
+    """
+    if math.isfinite(valor):
+        centavos = round(valor * 100)
+        if centavos / 100 == valor:
+            return Decimal(centavos).scaleb(-2)
+
+    return Decimal(repr(valor))
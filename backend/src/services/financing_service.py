@@ -1,36 +1,71 @@
 import logging
-from typing import TYPE_CHECKING
+import math
+import os
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
-from src.calculators import CalculatorFactory
-from src.models.domain import ResultadoCalculo
-from src.models.requests import SimulationRequest
+import numpy as np
+from pydantic import ValidationError
+
+from src.calculators import CalculatorFactory, SACCalculator
+from src.calculators.indexed_calculator import colunas_indexadas
+from src.calculators.rate_path_model import ModeloTrajetorias
+from src.calculators.vectorized_calculator import calcular_lote, totais_fechados
+from src.models.domain import Parcela, ResultadoCalculo, arredondar_centavos
+from src.models.requests import (
+    CapacidadeRequest,
+    ComparacaoRequest,
+    GridRequest,
+    MonteCarloRequest,
+    PrazoRequest,
+    SimulationRequest,
+)
 from src.models.responses import (
     Analise,
+    CalibracaoIndexador,
+    CapacidadeResponse,
+    ComparacaoResponse,
+    ComparacaoSistemas,
     Comparativo,
     DadosSimulacao,
     DetalheParcela,
+    GradeAmortizacao,
+    GridResponse,
     IndicadorEconomico,
+    MonteCarloResponse,
     ParcelaAmortizacao,
+    Percentis,
+    PrazoResponse,
     ResultadoFinanciamento,
     SimulationResponse,
     TaxasAplicadas,
 )
 from src.services.comparison_service import ComparisonService
 from src.services.indicator_service import IndicatorService
+from src.services.simulation_cache import chave_da_simulacao, get_simulation_cache
+from src.utils.deadline import Deadline
+from src.utils.exceptions import BusinessException
 
 if TYPE_CHECKING:
-    from src.models.domain import TaxaJuros
+    from src.models.domain import SnapshotTaxa
 
 logger = logging.getLogger(__name__)
 
+PERCENTIS = (5, 25, 50, 75, 95)
+
+# Campos preenchidos a cada requisição, fora do corpo guardado em cache
+CAMPOS_DO_ENVELOPE = {"request_id", "timestamp"}
+
 
 class FinancingService:
-    def __init__(self):
+    def __init__(self) -> None:
         self.indicator_service = IndicatorService()
         self.comparison_service = ComparisonService()
+        self.cache_simulacoes = get_simulation_cache()
 
-    def simular(self, request: SimulationRequest) -> SimulationResponse:
+    def simular(
+        self, request: SimulationRequest, deadline: Optional[Deadline] = None
+    ) -> SimulationResponse:
         request_id = str(uuid4())
 
         logger.info(
@@ -43,67 +78,446 @@ class FinancingService:
             },
         )
 
-        indicador = self.indicator_service.buscar_indicador_com_fallback()
+        snapshot = self.indicator_service.criar_snapshot(deadline)
 
-        taxa = self.indicator_service.calcular_taxa_juros(indicador)
+        return self._simular_com_snapshot(request_id, request, snapshot)
 
-        resultado = self._calcular_financiamento(request, taxa.taxa_mensal)
+    def simular_serializado(
+        self, request: SimulationRequest, deadline: Optional[Deadline] = None
+    ) -> str:
+        """
+        Corpo JSON da simulação, sem request_id e timestamp (ver CAMPOS_DO_ENVELOPE).
 
-        comparativo = self.comparison_service.comparar_com_media_nacional(taxa.taxa_anual)
+        Cotações repetidas com a mesma versão de snapshot saem do cache de
+        simulações já serializadas, sem cálculo, modelos Pydantic ou encoding;
+        só snapshot_id e obtido_em são trocados pelos do snapshot atual.
+        """
+        snapshot = self.indicator_service.criar_snapshot(deadline)
 
-        analise = self.comparison_service.analisar_viabilidade(
-            parcela_mensal=resultado.parcela_mensal,
-            taxa_aplicada=taxa.taxa_anual,
-            taxa_media=comparativo.taxa_media_nacional,
-            prazo_meses=request.prazo_meses,
-            percentual_juros=resultado.percentual_juros,
-        )
+        chave = chave_da_simulacao(request, CalculatorFactory.backend_padrao())
 
-        response = self._montar_resposta(
-            request_id=request_id,
-            request=request,
-            taxa=taxa,
-            resultado=resultado,
-            comparativo=comparativo,
-            analise=analise,
-        )
+        corpo = self.cache_simulacoes.obter(snapshot, chave)
+        if corpo is not None:
+            return corpo
+
+        response = self._simular_com_snapshot(str(uuid4()), request, snapshot)
+        corpo = response.model_dump_json(exclude=CAMPOS_DO_ENVELOPE)
+
+        self.cache_simulacoes.salvar(snapshot, chave, corpo)
+        return corpo
+
+    def _simular_com_snapshot(
+        self, request_id: str, request: SimulationRequest, snapshot: "SnapshotTaxa"
+    ) -> SimulationResponse:
+        resultado = self._calcular_financiamento(request, snapshot)
+
+        response = self._avaliar_e_montar(request_id, request, snapshot, resultado)
 
         logger.info(
             "Simulação concluída com sucesso",
             extra={
                 "request_id": request_id,
+                "snapshot_id": snapshot.snapshot_id,
                 "parcela_mensal": resultado.parcela_mensal,
-                "taxa_anual": taxa.taxa_anual,
+                "taxa_anual": snapshot.taxa.taxa_anual,
             },
         )
 
         return response
 
+    def simular_lote(
+        self, requests: List[SimulationRequest], deadline: Optional[Deadline] = None
+    ) -> Tuple["SnapshotTaxa", List[SimulationResponse]]:
+        """
+        Simula vários financiamentos com um único snapshot de taxa.
+
+        As tabelas de cada tipo de amortização são calculadas juntas, em uma
+        passada vetorial (calcular_lote), exceto no backend "centavos", em que
+        cada simulação usa a calculadora inteira. A ordem das respostas é a da entrada.
+        """
+        snapshot = self.indicator_service.criar_snapshot(deadline)
+
+        if CalculatorFactory.backend_padrao() == "centavos":
+            # Valores em centavos dependem dos arredondamentos mês a mês, sem
+            # equivalente na passada vetorial em float
+            resultados = [self._calcular_financiamento(request, snapshot) for request in requests]
+        else:
+            resultados = self._calcular_lote(requests, snapshot)
+
+        responses = [
+            self._avaliar_e_montar(str(uuid4()), request, snapshot, resultado)
+            for request, resultado in zip(requests, resultados, strict=True)
+        ]
+
+        logger.info(
+            "Lote de simulações concluído",
+            extra={"total": len(requests), "snapshot_id": snapshot.snapshot_id},
+        )
+
+        return snapshot, responses
+
+    def comparar(
+        self, request: ComparacaoRequest, deadline: Optional[Deadline] = None
+    ) -> ComparacaoResponse:
+        """PRICE e SAC para o mesmo financiamento, com um único snapshot de taxa."""
+        snapshot = self.indicator_service.criar_snapshot(deadline)
+
+        price, sac = (
+            self._avaliar_e_montar(
+                str(uuid4()),
+                simulacao,
+                snapshot,
+                self._calcular_financiamento(simulacao, snapshot),
+            )
+            for simulacao in (request.para_sistema("PRICE"), request.para_sistema("SAC"))
+        )
+
+        diferenca_juros = price.resultado.juros_totais - sac.resultado.juros_totais
+
+        comparacao = ComparacaoSistemas(
+            mes_cruzamento=SACCalculator().mes_cruzamento_price(
+                valor_financiado=request.valor_financiado(),
+                taxa_juros_mensal=snapshot.taxa.taxa_mensal,
+                prazo_meses=request.prazo_meses,
+            ),
+            diferenca_juros_totais=arredondar_centavos(diferenca_juros),
+            diferenca_primeira_parcela=arredondar_centavos(
+                sac.resultado.parcela_mensal - price.resultado.parcela_mensal
+            ),
+            sistema_menor_custo="SAC" if diferenca_juros > 0 else "PRICE",
+        )
+
+        logger.info(
+            "Comparação PRICE x SAC concluída",
+            extra={
+                "snapshot_id": snapshot.snapshot_id,
+                "mes_cruzamento": comparacao.mes_cruzamento,
+                "diferenca_juros_totais": comparacao.diferenca_juros_totais,
+            },
+        )
+
+        return ComparacaoResponse(
+            request_id=str(uuid4()), price=price, sac=sac, comparacao=comparacao
+        )
+
+    def calcular_capacidade(
+        self, request: CapacidadeRequest, deadline: Optional[Deadline] = None
+    ) -> CapacidadeResponse:
+        """
+        Maior valor financiado cuja maior parcela cabe em renda × comprometimento.
+
+        Uma única conta em forma fechada (inversa da anuidade PRICE ou da
+        primeira parcela SAC), seguida da simulação com o valor encontrado.
+        """
+        snapshot = self.indicator_service.criar_snapshot(deadline)
+
+        calculator = CalculatorFactory.create(request.tipo_amortizacao)
+        parcela_maxima = request.parcela_maxima()
+
+        # Arredonda para baixo: a parcela resultante nunca passa do máximo
+        valor_financiado = (
+            math.floor(
+                calculator.valor_maximo_financiado(
+                    parcela_maxima=parcela_maxima,
+                    taxa_juros_mensal=snapshot.taxa.taxa_mensal,
+                    prazo_meses=request.prazo_meses,
+                )
+                * 100
+            )
+            / 100
+        )
+
+        try:
+            simulation_request = SimulationRequest(
+                valor_imovel=request.entrada + valor_financiado,
+                entrada=request.entrada,
+                prazo_meses=request.prazo_meses,
+                tipo_amortizacao=request.tipo_amortizacao,
+                regiao=request.regiao,
+            )
+        except ValidationError as e:
+            raise BusinessException(
+                "Valor financiável fora dos limites de simulação para a renda informada"
+            ) from e
+
+        simulacao = self._avaliar_e_montar(
+            str(uuid4()),
+            simulation_request,
+            snapshot,
+            self._calcular_financiamento(simulation_request, snapshot),
+        )
+
+        return CapacidadeResponse(
+            request_id=str(uuid4()),
+            parcela_maxima=round(parcela_maxima, 2),
+            valor_financiado_maximo=valor_financiado,
+            valor_imovel_maximo=round(simulation_request.valor_imovel, 2),
+            simulacao=simulacao,
+        )
+
+    def calcular_prazo_minimo(
+        self, request: PrazoRequest, deadline: Optional[Deadline] = None
+    ) -> PrazoResponse:
+        """
+        Menor prazo (12 a 480 meses) cuja maior parcela cabe em `parcela_maxima`.
+
+        PRICE usa a forma logarítmica n = −ln(1 − P·i/PMT)/ln(1+i); SAC, o limite
+        da primeira parcela n ≥ P/(PMT − P·i).
+        """
+        snapshot = self.indicator_service.criar_snapshot(deadline)
+
+        calculator = CalculatorFactory.create(request.tipo_amortizacao)
+
+        prazo = calculator.prazo_minimo(
+            valor_financiado=request.valor_financiado(),
+            taxa_juros_mensal=snapshot.taxa.taxa_mensal,
+            parcela_maxima=request.parcela_maxima,
+        )
+
+        if prazo is None:
+            raise BusinessException(
+                "Parcela máxima insuficiente: nenhum prazo de até 480 meses atende ao valor"
+            )
+
+        simulation_request = SimulationRequest(
+            valor_imovel=request.valor_imovel,
+            entrada=request.entrada,
+            prazo_meses=prazo,
+            tipo_amortizacao=request.tipo_amortizacao,
+            regiao=request.regiao,
+        )
+
+        simulacao = self._avaliar_e_montar(
+            str(uuid4()),
+            simulation_request,
+            snapshot,
+            self._calcular_financiamento(simulation_request, snapshot),
+        )
+
+        return PrazoResponse(
+            request_id=str(uuid4()),
+            parcela_maxima=request.parcela_maxima,
+            prazo_minimo=prazo,
+            simulacao=simulacao,
+        )
+
+    def simular_grade(
+        self, request: GridRequest, deadline: Optional[Deadline] = None
+    ) -> GridResponse:
+        """
+        Grade entradas × prazos para cada tipo de amortização, sob um único snapshot.
+
+        Cada grade é uma única avaliação das fórmulas fechadas com broadcasting
+        (entradas nas linhas, prazos nas colunas).
+        """
+        snapshot = self.indicator_service.criar_snapshot(deadline)
+
+        valores = request.valor_imovel - np.array(request.entradas)[:, None]
+        prazos = np.array(request.prazos_meses)[None, :]
+
+        grades = {}
+        for tipo in request.tipos_amortizacao:
+            totais = totais_fechados(tipo, valores, snapshot.taxa.taxa_mensal, prazos)
+
+            grades[tipo] = GradeAmortizacao(
+                parcela_mensal=_arredondar(totais.primeira_parcela),
+                ultima_parcela=_arredondar(totais.ultima_parcela),
+                total_pago=_arredondar(totais.total_pago),
+                juros_totais=_arredondar(totais.total_juros),
+            )
+
+        logger.info(
+            "Grade de simulações concluída",
+            extra={
+                "snapshot_id": snapshot.snapshot_id,
+                "combinacoes": valores.size * prazos.size * len(grades),
+            },
+        )
+
+        return GridResponse(
+            request_id=str(uuid4()),
+            valor_imovel=request.valor_imovel,
+            entradas=request.entradas,
+            prazos_meses=request.prazos_meses,
+            taxas=self._taxas_aplicadas(snapshot),
+            grades=grades,
+        )
+
+    def simular_cenarios(
+        self, request: MonteCarloRequest, deadline: Optional[Deadline] = None
+    ) -> MonteCarloResponse:
+        """
+        Distribuição de resultados com o saldo corrigido por trajetórias simuladas do indexador.
+
+        O modelo AR(1) é calibrado na série histórica do indexador; as trajetórias
+        (trajetórias × meses) passam pelo cálculo indexado em blocos de
+        MONTE_CARLO_BLOCK_SIZE linhas, o que limita a memória usada.
+        """
+        snapshot = self.indicator_service.criar_snapshot(deadline)
+        historico = self.indicator_service.buscar_historico(request.indexador, deadline)
+
+        try:
+            modelo = ModeloTrajetorias.calibrar(historico)
+        except ValueError as e:
+            raise BusinessException(str(e)) from e
+
+        rng = np.random.default_rng(request.semente)
+        tamanho_bloco = int(os.getenv("MONTE_CARLO_BLOCK_SIZE", "2500"))
+
+        total_pago = np.empty(request.num_trajetorias)
+        parcela_maxima = np.empty(request.num_trajetorias)
+        saldo_maximo = np.empty(request.num_trajetorias)
+
+        for inicio in range(0, request.num_trajetorias, tamanho_bloco):
+            fim = min(inicio + tamanho_bloco, request.num_trajetorias)
+            correcoes = modelo.gerar(fim - inicio, request.prazo_meses, rng)
+
+            parcela, _, _, saldos = colunas_indexadas(
+                request.tipo_amortizacao,
+                request.valor_financiado(),
+                snapshot.taxa.taxa_mensal,
+                correcoes,
+                request.prazo_meses,
+            )
+
+            total_pago[inicio:fim] = parcela.sum(axis=1)
+            parcela_maxima[inicio:fim] = parcela.max(axis=1)
+            saldo_maximo[inicio:fim] = saldos.max(axis=1)
+
+        logger.info(
+            "Simulação de cenários concluída",
+            extra={
+                "snapshot_id": snapshot.snapshot_id,
+                "indexador": request.indexador,
+                "trajetorias": request.num_trajetorias,
+            },
+        )
+
+        return MonteCarloResponse(
+            request_id=str(uuid4()),
+            dados=DadosSimulacao(
+                valor_imovel=request.valor_imovel,
+                entrada=request.entrada,
+                valor_financiado=request.valor_financiado(),
+                prazo_meses=request.prazo_meses,
+                tipo_amortizacao=request.tipo_amortizacao,
+            ),
+            taxas=self._taxas_aplicadas(snapshot),
+            calibracao=CalibracaoIndexador(
+                indexador=request.indexador,
+                observacoes=modelo.observacoes,
+                media_mensal=round(math.expm1(modelo.media) * 100, 4),
+                volatilidade_mensal=round(modelo.volatilidade * 100, 4),
+                persistencia=round(modelo.persistencia, 4),
+            ),
+            num_trajetorias=request.num_trajetorias,
+            total_pago=_percentis(total_pago),
+            parcela_maxima=_percentis(parcela_maxima),
+            saldo_devedor_maximo=_percentis(saldo_maximo),
+        )
+
+    def gerar_tabela(
+        self,
+        request: SimulationRequest,
+        de_mes: int = 1,
+        ate_mes: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple["SnapshotTaxa", Iterator[Parcela]]:
+        """
+        Tabela completa (ou uma janela de meses), gerada sob demanda.
+
+        Retorna o snapshot de taxa usado e um iterador de parcelas; a tabela
+        nunca é materializada por inteiro.
+        """
+        calculator = CalculatorFactory.create(request.tipo_amortizacao)
+
+        snapshot = self.indicator_service.criar_snapshot(deadline)
+
+        parcelas = calculator.gerar_parcelas(
+            valor_financiado=request.valor_financiado(),
+            taxa_juros_mensal=snapshot.taxa.taxa_mensal,
+            prazo_meses=request.prazo_meses,
+            de_mes=de_mes,
+            ate_mes=ate_mes,
+        )
+
+        return snapshot, parcelas
+
+    def _calcular_lote(
+        self, requests: List[SimulationRequest], snapshot: "SnapshotTaxa"
+    ) -> List[ResultadoCalculo]:
+        resultados: List[Optional[ResultadoCalculo]] = [None] * len(requests)
+
+        for tipo in ("PRICE", "SAC"):
+            posicoes = [i for i, r in enumerate(requests) if r.tipo_amortizacao == tipo]
+            if not posicoes:
+                continue
+
+            lote = calcular_lote(
+                tipo,
+                np.array([requests[i].valor_financiado() for i in posicoes]),
+                np.full(len(posicoes), snapshot.taxa.taxa_mensal),
+                np.array([requests[i].prazo_meses for i in posicoes]),
+            )
+
+            for linha, posicao in enumerate(posicoes):
+                resumo = lote.resumo(linha)
+                resultados[posicao] = ResultadoCalculo(
+                    tabela=resumo,
+                    parcela_mensal=resumo.primeira_parcela().valor_parcela,
+                    taxa=snapshot.taxa,
+                )
+
+        # Todo request é PRICE ou SAC: nenhuma posição fica vazia
+        return [resultado for resultado in resultados if resultado is not None]
+
     def _calcular_financiamento(
-        self, request: SimulationRequest, taxa_mensal: float
+        self, request: SimulationRequest, snapshot: "SnapshotTaxa"
     ) -> ResultadoCalculo:
         calculator = CalculatorFactory.create(request.tipo_amortizacao)
 
         valor_financiado = request.valor_financiado()
 
-        tabela = calculator.calcular(
+        # A resposta só usa totais, primeira/última parcela e o resumo: eles são
+        # calculados em forma fechada, sem gerar todas as parcelas.
+        tabela = calculator.calcular_resumo(
             valor_financiado=valor_financiado,
-            taxa_juros_mensal=taxa_mensal,
+            taxa_juros_mensal=snapshot.taxa.taxa_mensal,
             prazo_meses=request.prazo_meses,
         )
 
         parcela_mensal = tabela.primeira_parcela().valor_parcela
 
-        indicador = self.indicator_service.buscar_indicador_com_fallback()
-        taxa_completa = self.indicator_service.calcular_taxa_juros(indicador)
+        return ResultadoCalculo(tabela=tabela, parcela_mensal=parcela_mensal, taxa=snapshot.taxa)
+
+    def _avaliar_e_montar(
+        self,
+        request_id: str,
+        request: SimulationRequest,
+        snapshot: "SnapshotTaxa",
+        resultado: ResultadoCalculo,
+    ) -> SimulationResponse:
+        comparativo, analise = self.comparison_service.avaliar(
+            snapshot=snapshot,
+            parcela_mensal=resultado.parcela_mensal,
+            prazo_meses=request.prazo_meses,
+            percentual_juros=resultado.percentual_juros,
+        )
 
-        return ResultadoCalculo(tabela=tabela, parcela_mensal=parcela_mensal, taxa=taxa_completa)
+        return self._montar_resposta(
+            request_id=request_id,
+            request=request,
+            snapshot=snapshot,
+            resultado=resultado,
+            comparativo=comparativo,
+            analise=analise,
+        )
 
     def _montar_resposta(
         self,
         request_id: str,
         request: SimulationRequest,
-        taxa: "TaxaJuros",
+        snapshot: "SnapshotTaxa",
         resultado: ResultadoCalculo,
         comparativo: Comparativo,
         analise: Analise,
@@ -116,37 +530,27 @@ class FinancingService:
             tipo_amortizacao=request.tipo_amortizacao,
         )
 
-        taxas = TaxasAplicadas(
-            indicador=IndicadorEconomico(
-                indicador_usado=taxa.indicador.tipo,
-                valor_indicador=taxa.indicador.valor,
-                fonte=taxa.indicador.fonte,
-                data_referencia=taxa.indicador.data_referencia,
-            ),
-            taxa_juros_anual=round(taxa.taxa_anual, 2),
-            taxa_juros_mensal=round(taxa.taxa_mensal, 4),
-            formula_aplicada=taxa.formula,
-        )
+        taxas = self._taxas_aplicadas(snapshot)
 
         primeira = resultado.tabela.primeira_parcela()
         ultima = resultado.tabela.ultima_parcela()
 
         resultado_financiamento = ResultadoFinanciamento(
-            parcela_mensal=round(resultado.parcela_mensal, 2),
-            total_pago=round(resultado.tabela.total_pago, 2),
-            juros_totais=round(resultado.tabela.total_juros, 2),
+            parcela_mensal=arredondar_centavos(resultado.parcela_mensal),
+            total_pago=arredondar_centavos(resultado.tabela.total_pago),
+            juros_totais=arredondar_centavos(resultado.tabela.total_juros),
             percentual_juros=round(resultado.percentual_juros, 2),
             primeira_parcela=DetalheParcela(
-                valor=round(primeira.valor_parcela, 2),
-                juros=round(primeira.valor_juros, 2),
-                amortizacao=round(primeira.valor_amortizacao, 2),
-                saldo_devedor=round(primeira.saldo_devedor, 2),
+                valor=arredondar_centavos(primeira.valor_parcela),
+                juros=arredondar_centavos(primeira.valor_juros),
+                amortizacao=arredondar_centavos(primeira.valor_amortizacao),
+                saldo_devedor=arredondar_centavos(primeira.saldo_devedor),
             ),
             ultima_parcela=DetalheParcela(
-                valor=round(ultima.valor_parcela, 2),
-                juros=round(ultima.valor_juros, 2),
-                amortizacao=round(ultima.valor_amortizacao, 2),
-                saldo_devedor=round(ultima.saldo_devedor, 2),
+                valor=arredondar_centavos(ultima.valor_parcela),
+                juros=arredondar_centavos(ultima.valor_juros),
+                amortizacao=arredondar_centavos(ultima.valor_amortizacao),
+                saldo_devedor=arredondar_centavos(ultima.saldo_devedor),
             ),
         )
 
@@ -163,5 +567,63 @@ class FinancingService:
             tabela_amortizacao_resumida=tabela_resumida,
         )
 
+    def _taxas_aplicadas(self, snapshot: "SnapshotTaxa") -> TaxasAplicadas:
+        taxa = snapshot.taxa
+
+        return TaxasAplicadas(
+            indicador=IndicadorEconomico(
+                indicador_usado=taxa.indicador.tipo,
+                valor_indicador=taxa.indicador.valor,
+                fonte=taxa.indicador.fonte,
+                data_referencia=taxa.indicador.data_referencia,
+            ),
+            taxa_juros_anual=round(taxa.taxa_anual, 2),
+            taxa_juros_mensal=round(taxa.taxa_mensal, 4),
+            formula_aplicada=taxa.formula,
+            snapshot_id=snapshot.snapshot_id,
+            obtido_em=snapshot.obtido_em,
+        )
+
     def close(self):
         self.indicator_service.close()
+
+
+def _arredondar(matriz: np.ndarray) -> List[List[float]]:
+    # Mesmo arredondamento do restante da resposta (np.round difere em empates)
+    return [[arredondar_centavos(valor) for valor in linha] for linha in matriz.tolist()]
+
+
+def _percentis(valores: np.ndarray) -> Percentis:
+    p5, p25, p50, p75, p95 = np.percentile(valores, PERCENTIS).tolist()
+
+    return Percentis(
+        p5=arredondar_centavos(p5),
+        p25=arredondar_centavos(p25),
+        p50=arredondar_centavos(p50),
+        p75=arredondar_centavos(p75),
+        p95=arredondar_centavos(p95),
+    )
+
+
+_service: Optional[FinancingService] = None
+
+
+def get_financing_service() -> FinancingService:
+    """
+    Instância única por container, criada na primeira requisição.
+
+    Mantém IndicatorService, clients e os pools de conexão HTTP (keep-alive)
+    vivos entre invocações "quentes", evitando novo handshake TLS com BCB/IBGE.
+    """
+    global _service
+    if _service is None:
+        _service = FinancingService()
+    return _service
+
+
+def reset_financing_service() -> None:
+    """Fecha e descarta a instância compartilhada (uso em testes)."""
+    global _service
+    if _service is not None:
+        _service.close()
+        _service = None
@@ -1,12 +1,31 @@
+import asyncio
 import logging
 import os
-from datetime import datetime
+import time
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+import httpx
 
 from src.clients import BacenClient, IBGEClient
-from src.models.domain import Indicador, TaxaJuros
+from src.models.domain import Indicador, SnapshotTaxa, TaxaJuros
+from src.services.indicator_store import CHAVE_SNAPSHOT, IndicatorStore, get_indicator_store
+from src.utils.cache import TTLCache
+from src.utils.deadline import Deadline
+from src.utils.exceptions import ExternalServiceException
 
 logger = logging.getLogger(__name__)
 
+# Cache em escopo de módulo: sobrevive entre invocações "quentes" do mesmo container.
+# A série 432 (SELIC) muda no máximo uma vez por dia e o IPCA uma vez por mês.
+_indicator_cache = TTLCache(ttl_seconds=float(os.getenv("INDICATOR_CACHE_TTL", "3600")))
+
+
+def get_indicator_cache() -> TTLCache:
+    return _indicator_cache
+
 
 class IndicatorService:
     """
@@ -16,19 +35,65 @@ class IndicatorService:
     1. Tenta buscar SELIC (Banco Central) - primário
     2. Se falhar, tenta buscar IPCA (IBGE) - fallback
     3. Se ambos falharem, usa taxa base padrão
+
+    Por padrão (INDICATOR_FETCH_CONCURRENT) as duas consultas externas são
+    disparadas em paralelo e a escolha por prioridade acontece quando terminam.
+    O event loop e o httpx.AsyncClient dessa busca vivem com o serviço, então
+    as conexões keep-alive são reaproveitadas entre invocações "quentes".
+
+    Indicadores obtidos com sucesso ficam em cache (uma entrada por tipo)
+    durante INDICATOR_CACHE_TTL segundos. O fallback nunca é cacheado.
+
+    Quando há um store compartilhado (INDICATORS_TABLE), ele é consultado antes
+    das APIs externas: valores com até INDICATOR_STORE_TTL segundos são usados
+    diretamente; valores mais antigos são servidos enquanto um único chamador
+    os atualiza, e continuam sendo servidos se a API externa estiver fora.
     """
 
-    def __init__(self):
+    def __init__(self, store: Optional[IndicatorStore] = None):
         self.taxa_base_anual = float(os.getenv("TAXA_BASE_ANUAL", "10.0"))
         self.fator_ajuste = float(os.getenv("FATOR_AJUSTE", "0.15"))
+        self.store_ttl = float(os.getenv("INDICATOR_STORE_TTL", "3600"))
+        self.refresh_lease = float(os.getenv("INDICATOR_REFRESH_LEASE", "30"))
+        self.snapshot_max_age = float(os.getenv("INDICATOR_SNAPSHOT_MAX_AGE", "10800"))
+        self.snapshot_cache_ttl = float(os.getenv("INDICATOR_SNAPSHOT_CACHE_TTL", "300"))
+        self.busca_paralela = os.getenv("INDICATOR_FETCH_CONCURRENT", "true").lower() == "true"
+        self.prazo_busca = float(os.getenv("INDICATOR_FETCH_DEADLINE", "4"))
+        self.meses_historico = int(os.getenv("INDICATOR_HISTORY_MONTHS", "120"))
 
         self.bacen_client = BacenClient()
         self.ibge_client = IBGEClient()
 
-    def buscar_indicador_com_fallback(self) -> Indicador:
+        self.cache = _indicator_cache
+        self.store = store if store is not None else get_indicator_store()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cliente_async: Optional[httpx.AsyncClient] = None
+        if self.busca_paralela:
+            self._cliente_async = self.bacen_client.http_client.criar_cliente_async()
+
+    def buscar_indicador_com_fallback(self, deadline: Optional[Deadline] = None) -> Indicador:
         logger.info("Iniciando busca de indicador econômico")
 
-        selic = self.bacen_client.buscar_selic()
+        obtidos_em_paralelo: Dict[str, Optional[Indicador]] = {}
+
+        def buscar_selic() -> Optional[Indicador]:
+            cliente = self._cliente_async
+            if cliente is None or not self._pode_buscar_em_paralelo():
+                return self.bacen_client.buscar_selic(deadline=deadline)
+
+            selic, ipca = self._obter_loop().run_until_complete(
+                self._buscar_em_paralelo(cliente, deadline)
+            )
+            obtidos_em_paralelo["IPCA"] = ipca
+            return selic
+
+        def buscar_ipca() -> Optional[Indicador]:
+            if "IPCA" in obtidos_em_paralelo:
+                return obtidos_em_paralelo["IPCA"]
+            return self.ibge_client.buscar_ipca(deadline=deadline)
+
+        selic = self._buscar_com_cache("SELIC", buscar_selic)
         if selic:
             logger.info(
                 "Indicador obtido com sucesso",
@@ -38,7 +103,7 @@ class IndicatorService:
 
         logger.warning("SELIC indisponível, tentando fallback para IPCA")
 
-        ipca = self.ibge_client.buscar_ipca()
+        ipca = self._buscar_com_cache("IPCA", buscar_ipca)
         if ipca:
             logger.info(
                 "Indicador obtido via fallback",
@@ -50,6 +115,232 @@ class IndicatorService:
 
         return self._criar_indicador_fallback()
 
+    def _pode_buscar_em_paralelo(self) -> bool:
+        if not self.busca_paralela:
+            return False
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+
+        # Já dentro de um event loop (run_until_complete não pode ser aninhado)
+        return False
+
+    def _obter_loop(self) -> asyncio.AbstractEventLoop:
+        # O AsyncClient fica preso ao loop em que foi usado pela primeira vez
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    async def _buscar_em_paralelo(
+        self, client: httpx.AsyncClient, deadline: Optional[Deadline] = None
+    ) -> Tuple[Optional[Indicador], Optional[Indicador]]:
+        """
+        Dispara SELIC e IPCA ao mesmo tempo, sob um prazo total de INDICATOR_FETCH_DEADLINE
+        (limitado pelo prazo da requisição, quando informado).
+
+        A SELIC tem prioridade: se ela chegar, o IPCA é cancelado; caso contrário
+        aguarda-se o IPCA apenas pelo tempo restante do prazo. O custo da decisão
+        de fallback é o máximo das latências, não a soma.
+        """
+        loop = asyncio.get_running_loop()
+        prazo = self.prazo_busca if deadline is None else deadline.limitar(self.prazo_busca)
+        limite = loop.time() + prazo
+
+        tarefa_selic = asyncio.create_task(
+            self.bacen_client.buscar_selic_async(client, deadline=deadline)
+        )
+        tarefa_ipca = asyncio.create_task(
+            self.ibge_client.buscar_ipca_async(client, deadline=deadline)
+        )
+
+        try:
+            await asyncio.wait({tarefa_selic}, timeout=prazo)
+            selic = tarefa_selic.result() if tarefa_selic.done() else None
+
+            if selic:
+                return selic, None
+
+            logger.warning("SELIC indisponível, aguardando IPCA já em andamento")
+
+            await asyncio.wait({tarefa_ipca}, timeout=max(0.0, limite - loop.time()))
+            ipca = tarefa_ipca.result() if tarefa_ipca.done() else None
+
+            return None, ipca
+
+        finally:
+            for tarefa in (tarefa_selic, tarefa_ipca):
+                if not tarefa.done():
+                    tarefa.cancel()
+
+            await asyncio.gather(tarefa_selic, tarefa_ipca, return_exceptions=True)
+
+    def criar_snapshot(self, deadline: Optional[Deadline] = None) -> SnapshotTaxa:
+        """
+        Snapshot de taxa para uma requisição.
+
+        Usa o snapshot publicado pela função de prefetch quando disponível, sem
+        nenhuma chamada às APIs externas. Sem snapshot publicado (ou com um mais
+        antigo que INDICATOR_SNAPSHOT_MAX_AGE), resolve o indicador na hora.
+        """
+        snapshot = self._obter_snapshot_publicado()
+        if snapshot:
+            return snapshot
+
+        return self._montar_snapshot(self.buscar_indicador_com_fallback(deadline))
+
+    def buscar_historico(self, tipo: str, deadline: Optional[Deadline] = None) -> List[float]:
+        """
+        Variações mensais (%) dos últimos INDICATOR_HISTORY_MONTHS meses do indicador.
+
+        A série fica no mesmo cache em memória dos indicadores; não há fallback
+        para uma série inventada, então a indisponibilidade vira erro externo.
+        """
+        chave = f"HISTORICO_{tipo}"
+
+        historico: Optional[List[float]] = self.cache.get(chave)
+        if historico:
+            logger.info("Série histórica obtida do cache", extra={"tipo": tipo})
+            return historico
+
+        historico = self.bacen_client.buscar_historico(tipo, self.meses_historico, deadline)
+        if not historico:
+            raise ExternalServiceException(f"Série histórica de {tipo} indisponível")
+
+        self.cache.set(chave, historico)
+        return historico
+
+    def publicar_snapshot(self, deadline: Optional[Deadline] = None) -> SnapshotTaxa:
+        """Consulta SELIC e IPCA nas APIs externas e publica um novo snapshot no store."""
+        if not self.store:
+            raise ExternalServiceException("Store de indicadores não configurado")
+
+        selic = self.bacen_client.buscar_selic(deadline=deadline)
+        ipca = self.ibge_client.buscar_ipca(deadline=deadline)
+
+        for indicador in (selic, ipca):
+            if indicador:
+                self.store.salvar(indicador)
+                self.cache.set(indicador.tipo, indicador)
+
+        # A taxa base padrão não é publicada: um snapshot publicado dispensa a
+        # consulta às APIs nas simulações enquanto for válido
+        indicador = selic or ipca or self._ultimo_valor_conhecido()
+        if not indicador:
+            raise ExternalServiceException("Nenhum indicador disponível para o snapshot")
+
+        snapshot = self._montar_snapshot(indicador)
+        versao = self.store.publicar_snapshot(snapshot)
+        if versao is None:
+            raise ExternalServiceException("Falha ao publicar snapshot de taxa")
+
+        snapshot = replace(snapshot, versao=versao)
+        self.cache.set(CHAVE_SNAPSHOT, snapshot, ttl_seconds=self.snapshot_cache_ttl)
+
+        return snapshot
+
+    def _obter_snapshot_publicado(self) -> Optional[SnapshotTaxa]:
+        snapshot: Optional[SnapshotTaxa] = self.cache.get(CHAVE_SNAPSHOT)
+        if snapshot:
+            return snapshot
+
+        publicado = self.store.obter_snapshot() if self.store else None
+        if not publicado:
+            return None
+
+        snapshot, publicado_em = publicado
+        idade = time.time() - publicado_em
+
+        if idade > self.snapshot_max_age:
+            logger.warning(
+                "Snapshot publicado desatualizado, resolvendo indicador na requisição",
+                extra={"snapshot_id": snapshot.snapshot_id, "idade_segundos": round(idade, 1)},
+            )
+            return None
+
+        self.cache.set(CHAVE_SNAPSHOT, snapshot, ttl_seconds=self.snapshot_cache_ttl)
+        logger.info(
+            "Snapshot publicado obtido do store",
+            extra={"snapshot_id": snapshot.snapshot_id, "versao": snapshot.versao},
+        )
+
+        return snapshot
+
+    def _montar_snapshot(self, indicador: Indicador) -> SnapshotTaxa:
+        taxa = self.calcular_taxa_juros(indicador)
+
+        snapshot = SnapshotTaxa(
+            snapshot_id=str(uuid4()),
+            taxa=taxa,
+            obtido_em=datetime.now(timezone.utc).isoformat(),
+        )
+
+        logger.info(
+            "Snapshot de taxa criado",
+            extra={
+                "snapshot_id": snapshot.snapshot_id,
+                "indicador_tipo": indicador.tipo,
+                "taxa_anual": taxa.taxa_anual,
+            },
+        )
+
+        return snapshot
+
+    def _ultimo_valor_conhecido(self) -> Optional[Indicador]:
+        if not self.store:
+            return None
+
+        for tipo in ("SELIC", "IPCA"):
+            registro = self.store.obter(tipo)
+            if registro:
+                return registro.indicador
+
+        return None
+
+    def _buscar_com_cache(
+        self, tipo: str, buscar: Callable[[], Optional[Indicador]]
+    ) -> Optional[Indicador]:
+        indicador = self.cache.get(tipo)
+        if indicador:
+            logger.info("Indicador obtido do cache", extra={"tipo": tipo, **self.cache.stats()})
+            return indicador
+
+        store = self.store
+        registro = store.obter(tipo) if store else None
+
+        idade = registro.idade() if registro else 0.0
+
+        if registro and idade < self.store_ttl:
+            logger.info("Indicador obtido do store", extra={"tipo": tipo})
+            # Só enquanto o registro do store continuar fresco
+            validade = min(self.cache.ttl_seconds, self.store_ttl - idade)
+            self.cache.set(tipo, registro.indicador, ttl_seconds=validade)
+            return registro.indicador
+
+        if registro and store and not store.adquirir_refresh(tipo, self.refresh_lease):
+            logger.info(
+                "Indicador desatualizado em revalidação por outro chamador",
+                extra={"tipo": tipo, "idade_segundos": round(idade, 1)},
+            )
+            return registro.indicador
+
+        indicador = buscar()
+        if indicador:
+            self.cache.set(tipo, indicador)
+            if self.store:
+                self.store.salvar(indicador)
+            return indicador
+
+        if registro:
+            logger.warning(
+                "API externa indisponível, usando último valor conhecido",
+                extra={"tipo": tipo, "idade_segundos": round(registro.idade(), 1)},
+            )
+            return registro.indicador
+
+        return None
+
     def calcular_taxa_juros(self, indicador: Indicador) -> TaxaJuros:
         if indicador.tipo == "SELIC":
             taxa_anual = self._calcular_taxa_selic(indicador.valor)
@@ -108,5 +399,12 @@ class IndicatorService:
         )
 
     def close(self):
+        if self._cliente_async is not None:
+            self._obter_loop().run_until_complete(self._cliente_async.aclose())
+            self._cliente_async = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
         self.bacen_client.close()
         self.ibge_client.close()
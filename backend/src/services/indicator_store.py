@@ -0,0 +1,192 @@
+import logging
+import os
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+import boto3
+from botocore.exceptions import ClientError
+
+from src.models.domain import Indicador, SnapshotTaxa, TaxaJuros
+
+logger = logging.getLogger(__name__)
+
+CHAVE_SNAPSHOT = "SNAPSHOT"
+
+
+@dataclass
+class RegistroIndicador:
+    """Último valor conhecido de um indicador, como gravado no store compartilhado."""
+
+    indicador: Indicador
+    atualizado_em: float
+
+    def idade(self, agora: Optional[float] = None) -> float:
+        return (agora if agora is not None else time.time()) - self.atualizado_em
+
+
+class IndicatorStore:
+    """
+    Store de indicadores compartilhado entre containers (tabela DynamoDB).
+
+    Cada indicador (SELIC, IPCA) é um item. O atributo refresh_ate funciona como
+    um lease: apenas quem o adquire consulta a API externa enquanto os demais
+    continuam servindo o valor armazenado (stale-while-revalidate).
+
+    O item SNAPSHOT guarda o snapshot de taxa publicado pela função agendada
+    de prefetch, com um número de versão incrementado a cada publicação.
+    """
+
+    def __init__(self, table_name: Optional[str] = None):
+        self.dynamodb = boto3.resource("dynamodb")
+        self.table_name = table_name or os.getenv("INDICATORS_TABLE", "financing-indicators-dev")
+        self.table = self.dynamodb.Table(self.table_name)
+
+    def obter(self, tipo: str) -> Optional[RegistroIndicador]:
+        try:
+            response = self.table.get_item(Key={"indicador": tipo}, ConsistentRead=False)
+        except ClientError as e:
+            logger.error(f"Erro ao ler indicador do store: {e.response['Error']['Message']}")
+            return None
+
+        item = response.get("Item")
+        if not item or "valor" not in item:
+            return None
+
+        return RegistroIndicador(
+            indicador=Indicador(
+                tipo=item["indicador"],
+                valor=float(item["valor"]),
+                fonte=item["fonte"],
+                data_referencia=item["data_referencia"],
+            ),
+            atualizado_em=float(item["atualizado_em"]),
+        )
+
+    def salvar(self, indicador: Indicador) -> None:
+        try:
+            self.table.put_item(
+                Item={
+                    "indicador": indicador.tipo,
+                    "valor": Decimal(str(indicador.valor)),
+                    "fonte": indicador.fonte,
+                    "data_referencia": indicador.data_referencia,
+                    "atualizado_em": Decimal(str(time.time())),
+                }
+            )
+            logger.info("Indicador gravado no store", extra={"tipo": indicador.tipo})
+
+        except ClientError as e:
+            logger.error(f"Erro ao gravar indicador no store: {e.response['Error']['Message']}")
+
+    def adquirir_refresh(self, tipo: str, lease_seconds: float) -> bool:
+        """
+        Tenta adquirir o direito de atualizar o indicador.
+
+        Retorna False se outro chamador já detém um lease válido. Erros do store
+        retornam True: sem coordenação, é preferível consultar a API externa.
+        """
+        agora = time.time()
+
+        try:
+            self.table.update_item(
+                Key={"indicador": tipo},
+                UpdateExpression="SET refresh_ate = :ate",
+                ConditionExpression="attribute_not_exists(refresh_ate) OR refresh_ate < :agora",
+                ExpressionAttributeValues={
+                    ":ate": Decimal(str(agora + lease_seconds)),
+                    ":agora": Decimal(str(agora)),
+                },
+            )
+            return True
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+
+            logger.error(f"Erro ao adquirir lease no store: {e.response['Error']['Message']}")
+            return True
+
+    def publicar_snapshot(self, snapshot: SnapshotTaxa) -> Optional[int]:
+        """Publica o snapshot como versão corrente. Retorna a versão gravada."""
+        taxa = snapshot.taxa
+
+        try:
+            response = self.table.update_item(
+                Key={"indicador": CHAVE_SNAPSHOT},
+                UpdateExpression=(
+                    "SET snapshot_id = :id, obtido_em = :obtido_em, taxa_anual = :anual, "
+                    "taxa_mensal = :mensal, formula = :formula, indicador_tipo = :tipo, "
+                    "indicador_valor = :valor, indicador_fonte = :fonte, "
+                    "indicador_data_referencia = :data_ref, atualizado_em = :agora "
+                    "ADD versao :um"
+                ),
+                ExpressionAttributeValues={
+                    ":id": snapshot.snapshot_id,
+                    ":obtido_em": snapshot.obtido_em,
+                    ":anual": Decimal(str(taxa.taxa_anual)),
+                    ":mensal": Decimal(str(taxa.taxa_mensal)),
+                    ":formula": taxa.formula,
+                    ":tipo": taxa.indicador.tipo,
+                    ":valor": Decimal(str(taxa.indicador.valor)),
+                    ":fonte": taxa.indicador.fonte,
+                    ":data_ref": taxa.indicador.data_referencia,
+                    ":agora": Decimal(str(time.time())),
+                    ":um": 1,
+                },
+                ReturnValues="UPDATED_NEW",
+            )
+
+            versao = int(response["Attributes"]["versao"])
+            logger.info(
+                "Snapshot de taxa publicado",
+                extra={"snapshot_id": snapshot.snapshot_id, "versao": versao},
+            )
+            return versao
+
+        except ClientError as e:
+            logger.error(f"Erro ao publicar snapshot: {e.response['Error']['Message']}")
+            return None
+
+    def obter_snapshot(self) -> Optional[tuple[SnapshotTaxa, float]]:
+        """Retorna o snapshot publicado e o instante (epoch) da publicação."""
+        try:
+            response = self.table.get_item(Key={"indicador": CHAVE_SNAPSHOT})
+        except ClientError as e:
+            logger.error(f"Erro ao ler snapshot do store: {e.response['Error']['Message']}")
+            return None
+
+        item = response.get("Item")
+        if not item:
+            return None
+
+        snapshot = SnapshotTaxa(
+            snapshot_id=item["snapshot_id"],
+            taxa=TaxaJuros(
+                taxa_anual=float(item["taxa_anual"]),
+                taxa_mensal=float(item["taxa_mensal"]),
+                indicador=Indicador(
+                    tipo=item["indicador_tipo"],
+                    valor=float(item["indicador_valor"]),
+                    fonte=item["indicador_fonte"],
+                    data_referencia=item["indicador_data_referencia"],
+                ),
+                formula=item["formula"],
+            ),
+            obtido_em=item["obtido_em"],
+            versao=int(item["versao"]),
+        )
+
+        return snapshot, float(item["atualizado_em"])
+
+
+_store = None
+
+
+def get_indicator_store() -> Optional[IndicatorStore]:
+    """Retorna o store compartilhado, ou None se INDICATORS_TABLE não estiver configurada."""
+    global _store
+    if _store is None and os.getenv("INDICATORS_TABLE"):
+        _store = IndicatorStore()
+    return _store
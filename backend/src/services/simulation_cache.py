@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional
+
+from src.utils.cache import LRUCache
+from src.utils.metrics import registrar_metrica
+
+if TYPE_CHECKING:
+    from src.models.domain import SnapshotTaxa
+    from src.models.requests import SimulationRequest
+
+logger = logging.getLogger(__name__)
+
+
+def versao_do_snapshot(snapshot: "SnapshotTaxa") -> Hashable:
+    """
+    Versão do snapshot para fins de cache.
+
+    Snapshots publicados têm versão explícita. Os montados na hora ganham um
+    snapshot_id novo a cada requisição, então a versão passa a ser o próprio
+    indicador (tipo, valor, data de referência) e a taxa resultante.
+    """
+    if snapshot.versao is not None:
+        return ("versao", snapshot.versao)
+
+    indicador = snapshot.indicador
+    return (indicador.tipo, indicador.valor, indicador.data_referencia, snapshot.taxa.taxa_mensal)
+
+
+def chave_da_simulacao(request: "SimulationRequest", backend: str) -> Hashable:
+    """Requisição normalizada: valores em reais arredondados ao centavo."""
+    return (
+        backend,
+        request.tipo_amortizacao,
+        round(request.valor_imovel, 2),
+        round(request.entrada, 2),
+        request.prazo_meses,
+        request.regiao,
+    )
+
+
+@dataclass(frozen=True)
+class SimulacaoEmCache:
+    """Corpo serializado e os campos do snapshot gravados nele."""
+
+    corpo: str
+    snapshot_id: str
+    obtido_em: str
+
+    def para_snapshot(self, snapshot: "SnapshotTaxa") -> str:
+        """
+        Corpo com snapshot_id e obtido_em do snapshot desta requisição.
+
+        Snapshots da mesma versão dão o mesmo cálculo, mas cada requisição
+        informa o seu: os dois campos são trocados no texto, sem decodificar.
+        """
+        corpo = self.corpo
+
+        for campo, anterior, atual in (
+            ("snapshot_id", self.snapshot_id, snapshot.snapshot_id),
+            ("obtido_em", self.obtido_em, snapshot.obtido_em),
+        ):
+            if atual != anterior:
+                corpo = corpo.replace(_membro(campo, anterior), _membro(campo, atual), 1)
+
+        return corpo
+
+
+def _membro(campo: str, valor: str) -> str:
+    # Mesmo formato compacto do model_dump_json
+    return f"{json.dumps(campo)}:{json.dumps(valor, ensure_ascii=False)}"
+
+
+class CacheSimulacoes:
+    """
+    Corpos de resposta de simulação já serializados (JSON), por requisição e snapshot.
+
+    Guarda só a versão de snapshot mais recente: quando o indicador muda, as
+    entradas anteriores são descartadas de uma vez. Um acerto devolve o corpo
+    com snapshot_id e obtido_em do snapshot da requisição atual. Cada consulta registra a
+    métrica SimulationCache (resultado=hit|miss); `stats()` traz o hit ratio.
+    """
+
+    def __init__(self, cache: LRUCache):
+        self.cache = cache
+        self.versao: Optional[Hashable] = None
+        self.invalidacoes = 0
+
+    def obter(self, snapshot: "SnapshotTaxa", chave: Hashable) -> Optional[str]:
+        self._acompanhar_versao(versao_do_snapshot(snapshot))
+
+        entrada = self.cache.get(chave)
+        registrar_metrica("SimulationCache", resultado="hit" if entrada is not None else "miss")
+        return entrada.para_snapshot(snapshot) if entrada is not None else None
+
+    def salvar(self, snapshot: "SnapshotTaxa", chave: Hashable, corpo: str) -> None:
+        # Outra versão chegou enquanto esta era calculada: não repovoa o cache
+        if versao_do_snapshot(snapshot) == self.versao:
+            self.cache.set(chave, SimulacaoEmCache(corpo, snapshot.snapshot_id, snapshot.obtido_em))
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.cache.stats(), "invalidacoes": self.invalidacoes}
+
+    def limpar(self) -> None:
+        self.cache.clear()
+        self.versao = None
+        self.invalidacoes = 0
+
+    def _acompanhar_versao(self, versao: Hashable) -> None:
+        if versao == self.versao:
+            return
+
+        if self.versao is not None:
+            self.cache.invalidate_all()
+            self.invalidacoes += 1
+            registrar_metrica("SimulationCacheInvalidation")
+            logger.info(
+                "Snapshot de taxa mudou, cache de simulações descartado",
+                extra={"versao_anterior": str(self.versao), "versao": str(versao)},
+            )
+
+        self.versao = versao
+
+
+def _max_bytes() -> Optional[int]:
+    valor = int(os.getenv("SIMULATION_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+    return valor if valor > 0 else None
+
+
+_simulation_cache = CacheSimulacoes(
+    LRUCache(
+        ttl_seconds=float(os.getenv("SIMULATION_CACHE_TTL", "900")),
+        max_entries=int(os.getenv("SIMULATION_CACHE_MAX_ENTRIES", "1000")),
+        max_bytes=_max_bytes(),
+        tamanho=lambda entrada: len(entrada.corpo.encode()),
+    )
+)
+
+
+def get_simulation_cache() -> CacheSimulacoes:
+    return _simulation_cache
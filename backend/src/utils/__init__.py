@@ -1,3 +1,4 @@
+from src.utils.cache import TTLCache
 from src.utils.exceptions import (
     BusinessException,
     CalculationException,
@@ -12,4 +13,5 @@ __all__ = [
     "ExternalServiceException",
     "CalculationException",
     "handle_exception",
+    "TTLCache",
 ]
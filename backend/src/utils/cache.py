@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Cache em memória com expiração por tempo (TTL).
+
+    Pensado para viver em escopo de módulo e sobreviver entre invocações
+    "quentes" do Lambda. Cada chave tem sua própria expiração.
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expira_em, valor = entry
+            if self._clock() >= expira_em:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return valor
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "size": len(self._entries),
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LRUCache(TTLCache):
+    """
+    TTLCache com limite de entradas e de bytes, descartando a menos usada.
+
+    O tamanho de cada valor vem de `tamanho` (padrão: len), pensado para
+    corpos de resposta já serializados (str/bytes).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        max_bytes: Optional[int] = None,
+        tamanho: Callable[[Any], int] = len,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(ttl_seconds, clock)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._tamanho = tamanho
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expira_em, valor = entry
+            if self._clock() >= expira_em:
+                self._remover(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return valor
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        tamanho = self._tamanho(value)
+
+        with self._lock:
+            if self.max_bytes is not None and tamanho > self.max_bytes:
+                return
+
+            if key in self._entries:
+                self._remover(key)
+
+            self._entries[key] = (self._clock() + ttl, value)
+            self._bytes += tamanho
+
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remover(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remover(key)
+
+    def invalidate_all(self) -> None:
+        """Descarta todas as entradas, preservando os contadores de hits/misses."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._bytes = 0
+            self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats.update(
+                bytes=self._bytes,
+                evictions=self.evictions,
+                max_entries=self.max_entries,
+                max_bytes=self.max_bytes,
+            )
+        return stats
+
+    def _remover(self, key: Hashable) -> None:
+        _, valor = self._entries.pop(key)
+        self._bytes -= self._tamanho(valor)
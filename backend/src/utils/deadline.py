@@ -0,0 +1,38 @@
+import os
+import time
+from typing import Any, Callable, Optional
+
+
+class Deadline:
+    """Prazo absoluto de uma requisição, propagado do handler até os clients HTTP."""
+
+    def __init__(self, segundos: float, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._limite = clock() + segundos
+
+    @classmethod
+    def do_contexto_lambda(cls, context: Any) -> Optional["Deadline"]:
+        """
+        Cria o prazo a partir do tempo restante da invocação Lambda.
+
+        Reserva DEADLINE_SAFETY_MARGIN_MS para cálculo, persistência e resposta.
+        Retorna None quando o contexto não informa o tempo restante (execução local).
+        """
+        obter_restante = getattr(context, "get_remaining_time_in_millis", None)
+        restante_ms = obter_restante() if callable(obter_restante) else None
+
+        if not isinstance(restante_ms, (int, float)):
+            return None
+
+        margem_ms = float(os.getenv("DEADLINE_SAFETY_MARGIN_MS", "1000"))
+        return cls(max(0.0, (restante_ms - margem_ms) / 1000))
+
+    def restante(self) -> float:
+        return max(0.0, self._limite - self._clock())
+
+    def expirado(self) -> bool:
+        return self.restante() <= 0
+
+    def limitar(self, segundos: float) -> float:
+        """Retorna o menor valor entre `segundos` e o tempo restante."""
+        return min(segundos, self.restante())
@@ -0,0 +1,60 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Dict
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+NAMESPACE = "FinancingSimulator"
+
+_contadores: Dict[str, float] = defaultdict(float)
+_lock = threading.Lock()
+
+
+def registrar_metrica(nome: str, valor: float = 1, unidade: str = "Count", **dimensoes) -> None:
+    """
+    Registra uma métrica no formato CloudWatch Embedded Metric Format (EMF).
+
+    A linha de log JSON é convertida em métrica pelo CloudWatch sem chamadas
+    de API. O valor também é acumulado em memória (ver obter_contadores).
+    """
+    with _lock:
+        _contadores[_chave(nome, dimensoes)] += valor
+
+    logger.info(
+        f"Métrica {nome}",
+        extra={
+            "_aws": {
+                "Timestamp": int(time.time() * 1000),
+                "CloudWatchMetrics": [
+                    {
+                        "Namespace": NAMESPACE,
+                        "Dimensions": [list(dimensoes.keys())],
+                        "Metrics": [{"Name": nome, "Unit": unidade}],
+                    }
+                ],
+            },
+            nome: valor,
+            **dimensoes,
+        },
+    )
+
+
+def obter_contadores() -> Dict[str, float]:
+    with _lock:
+        return dict(_contadores)
+
+
+def resetar_contadores() -> None:
+    with _lock:
+        _contadores.clear()
+
+
+def _chave(nome: str, dimensoes: dict) -> str:
+    if not dimensoes:
+        return nome
+
+    sufixo = ",".join(f"{k}={v}" for k, v in sorted(dimensoes.items()))
+    return f"{nome}[{sufixo}]"
@@ -0,0 +1,33 @@
+import pytest
+
+from src.services.indicator_service import get_indicator_cache
+from src.services.simulation_cache import get_simulation_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self) -> float:
+        return self.agora
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def busca_sequencial(monkeypatch):
+    # Para testes que simulam os métodos síncronos dos clients;
+    # a busca paralela tem testes próprios em test_indicator_service.py
+    monkeypatch.setenv("INDICATOR_FETCH_CONCURRENT", "false")
+
+
+@pytest.fixture
+def limpar_cache():
+    get_indicator_cache().clear()
+    get_simulation_cache().limpar()
+    yield
+    get_indicator_cache().clear()
+    get_simulation_cache().limpar()
@@ -1,7 +1,20 @@
 import json
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
-from src.handlers.financing_handler import handler
+import pytest
+
+from src.handlers.financing_handler import (
+    _com_envelope,
+    _com_fragmentos,
+    capacidade,
+    cenarios,
+    comparar,
+    grade,
+    handler,
+    prazo,
+    simular_lote,
+    tabela,
+)
 
 
 class TestFinancingHandlerIntegration:
@@ -50,6 +63,30 @@ class TestFinancingHandlerIntegration:
         assert body["resultado"]["total_pago"] > 400000
         assert body["resultado"]["juros_totais"] > 0
 
+    def test_handler_cotacao_repetida_com_envelope_proprio(self):
+        """Cotação repetida reaproveita o corpo, mas com request_id e timestamp da requisição."""
+        event = {
+            "body": json.dumps({
+                "valor_imovel": 420000,
+                "entrada": 84000,
+                "prazo_meses": 300,
+                "tipo_amortizacao": "PRICE",
+                "regiao": "MG"
+            })
+        }
+
+        corpos = []
+        for request_id in ("cotacao-1", "cotacao-2"):
+            context = Mock()
+            context.request_id = request_id
+            response = handler(event, context)
+            assert response["statusCode"] == 200
+            corpos.append(json.loads(response["body"]))
+
+        assert [corpo["request_id"] for corpo in corpos] == ["cotacao-1", "cotacao-2"]
+        assert all(corpo["timestamp"] for corpo in corpos)
+        assert corpos[0]["resultado"] == corpos[1]["resultado"]
+
     def test_handler_request_sac(self):
         """Testa handler com sistema SAC."""
         event = {
@@ -282,6 +319,337 @@ class TestFinancingHandlerIntegration:
         assert body["simulacao"]["prazo_meses"] == 480
 
 
+class TestSimulacaoEmLoteHandler:
+    """Testes do endpoint de simulação em lote."""
+
+    ITEM = {
+        "valor_imovel": 500000,
+        "entrada": 100000,
+        "prazo_meses": 360,
+        "tipo_amortizacao": "PRICE",
+        "regiao": "SP"
+    }
+
+    def _chamar(self, body):
+        context = Mock()
+        context.request_id = "test-lote"
+        return simular_lote({"body": json.dumps(body)}, context)
+
+    def test_lote_com_itens_validos_e_invalidos(self):
+        body = {
+            "simulacoes": [
+                self.ITEM,
+                {**self.ITEM, "regiao": "XX"},
+                {**self.ITEM, "tipo_amortizacao": "SAC", "prazo_meses": 120},
+            ]
+        }
+
+        response = self._chamar(body)
+
+        assert response["statusCode"] == 200
+        resultado = json.loads(response["body"])
+
+        assert resultado["total"] == 3
+        assert resultado["sucesso"] == 2
+        assert resultado["falhas"] == 1
+        assert [r["status"] for r in resultado["resultados"]] == ["ok", "erro", "ok"]
+        assert resultado["resultados"][1]["erros"][0]["field"] == "regiao"
+
+        snapshots = {
+            r["resultado"]["taxas"]["snapshot_id"]
+            for r in resultado["resultados"]
+            if r["status"] == "ok"
+        }
+        assert snapshots == {resultado["snapshot_id"]}
+
+    def test_lote_vazio(self):
+        response = self._chamar({"simulacoes": []})
+
+        assert response["statusCode"] == 400
+
+    def test_lote_acima_do_limite(self, monkeypatch):
+        monkeypatch.setenv("BATCH_MAX_ITEMS", "2")
+
+        response = self._chamar({"simulacoes": [self.ITEM] * 3})
+
+        assert response["statusCode"] == 400
+
+    def test_item_que_nao_e_objeto(self):
+        response = self._chamar({"simulacoes": [self.ITEM, 42]})
+
+        resultado = json.loads(response["body"])
+        assert resultado["resultados"][1]["status"] == "erro"
+
+
+class TestComparacaoHandler:
+    """Testes do endpoint de comparação PRICE x SAC."""
+
+    def test_comparacao(self):
+        event = {
+            "body": json.dumps({
+                "valor_imovel": 500000,
+                "entrada": 100000,
+                "prazo_meses": 360,
+                "regiao": "SP"
+            })
+        }
+        context = Mock()
+        context.request_id = "test-comparacao"
+
+        response = comparar(event, context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+
+        assert body["price"]["simulacao"]["tipo_amortizacao"] == "PRICE"
+        assert body["sac"]["simulacao"]["tipo_amortizacao"] == "SAC"
+        assert body["comparacao"]["mes_cruzamento"] > 1
+        assert body["comparacao"]["diferenca_juros_totais"] > 0
+
+    def test_item_persistido_igual_a_resposta(self):
+        """O mesmo JSON serve a resposta e o item gravado no DynamoDB."""
+        event = {
+            "body": json.dumps({
+                "valor_imovel": 500000,
+                "entrada": 100000,
+                "prazo_meses": 360,
+                "regiao": "SP"
+            })
+        }
+        context = Mock()
+        context.request_id = "test-comparacao"
+
+        db_service = Mock()
+        db_service.save_simulation.return_value = {"simulation_id": "sim-1"}
+
+        with patch(
+            "src.handlers.financing_handler.get_dynamodb_service", return_value=db_service
+        ):
+            response = comparar(event, context)
+
+        body = json.loads(response["body"])
+        gravado = json.loads(db_service.save_simulation.call_args.kwargs["simulation_data"])
+
+        assert body.pop("simulation_id") == "sim-1"
+        assert gravado == body
+        assert gravado["request_id"] == "test-comparacao"
+
+    def test_comparacao_invalida(self):
+        event = {"body": json.dumps({"valor_imovel": 500000, "entrada": 600000})}
+        context = Mock()
+        context.request_id = "test-comparacao"
+
+        response = comparar(event, context)
+
+        assert response["statusCode"] == 400
+
+
+class TestBodyNaoObjeto:
+    """JSON válido que não é objeto: 400 de validação, não erro interno."""
+
+    @pytest.mark.parametrize(
+        "endpoint", [handler, tabela, comparar, grade, cenarios, capacidade, prazo, simular_lote]
+    )
+    @pytest.mark.parametrize("body", ["null", "[]", '"x"', "42"])
+    def test_body_nao_objeto(self, endpoint, body):
+        context = Mock()
+        context.request_id = "test-body"
+
+        response = endpoint({"body": body}, context)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["code"] == "VALIDATION_ERROR"
+
+
+class TestEnvelopeJson:
+    """Campos acrescentados a objetos JSON já serializados."""
+
+    @pytest.mark.parametrize(
+        "corpo, campos",
+        [
+            ('{"a":1,"b":[2]}', {"request_id": "r-1"}),
+            ("{}", {"request_id": "r-1"}),
+            ("{ }", {"request_id": "r-1", "simulation_id": None}),
+            ('{"a":1}', {}),
+            ("{}", {}),
+        ],
+    )
+    def test_resultado_e_json_valido(self, corpo, campos):
+        assert json.loads(_com_envelope(corpo, campos)) == {**campos, **json.loads(corpo)}
+
+    def test_fragmentos_sem_campos_e_sem_fragmentos(self):
+        assert json.loads(_com_fragmentos({})) == {}
+        assert json.loads(_com_fragmentos({"total": 0})) == {"total": 0}
+        assert json.loads(_com_fragmentos({}, resultados="[]")) == {"resultados": []}
+
+
+class TestCapacidadeHandler:
+    """Testes do endpoint de capacidade de financiamento."""
+
+    def _chamar(self, body):
+        context = Mock()
+        context.request_id = "test-capacidade"
+        return capacidade({"body": json.dumps(body)}, context)
+
+    def test_capacidade_pela_renda(self):
+        response = self._chamar({
+            "renda_mensal": 10000,
+            "entrada": 100000,
+            "prazo_meses": 360,
+            "tipo_amortizacao": "SAC",
+            "regiao": "SP"
+        })
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+
+        assert body["parcela_maxima"] == 3000
+        assert body["valor_financiado_maximo"] > 0
+        assert body["simulacao"]["resultado"]["parcela_mensal"] <= 3000
+
+    def test_renda_invalida(self):
+        response = self._chamar({
+            "renda_mensal": 0, "prazo_meses": 360, "tipo_amortizacao": "SAC", "regiao": "SP"
+        })
+
+        assert response["statusCode"] == 400
+
+    def test_renda_fora_dos_limites(self):
+        response = self._chamar({
+            "renda_mensal": 1e9, "prazo_meses": 360, "tipo_amortizacao": "SAC", "regiao": "SP"
+        })
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["code"] == "BUSINESS_ERROR"
+
+
+class TestPrazoHandler:
+    """Testes do endpoint de prazo mínimo."""
+
+    def test_prazo_minimo(self):
+        event = {
+            "body": json.dumps({
+                "valor_imovel": 500000,
+                "entrada": 100000,
+                "parcela_maxima": 5000,
+                "tipo_amortizacao": "PRICE",
+                "regiao": "SP"
+            })
+        }
+        context = Mock()
+        context.request_id = "test-prazo"
+
+        response = prazo(event, context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert 12 <= body["prazo_minimo"] <= 480
+        assert body["simulacao"]["resultado"]["parcela_mensal"] <= 5000
+
+
+class TestGradeHandler:
+    """Testes do endpoint de grade de simulações."""
+
+    def test_grade_entradas_por_prazos(self):
+        event = {
+            "body": json.dumps({
+                "valor_imovel": 500000,
+                "entradas": [50000, 100000, 150000],
+                "prazos_meses": [120, 240, 360, 480],
+                "regiao": "SP"
+            })
+        }
+        context = Mock()
+        context.request_id = "test-grade"
+
+        response = grade(event, context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+
+        assert set(body["grades"]) == {"PRICE", "SAC"}
+        parcelas = body["grades"]["PRICE"]["parcela_mensal"]
+        assert len(parcelas) == 3
+        assert all(len(linha) == 4 for linha in parcelas)
+        # Parcela cai com o prazo e com a entrada
+        assert parcelas[0][0] > parcelas[0][3]
+        assert parcelas[0][0] > parcelas[2][0]
+
+    def test_grade_invalida(self):
+        event = {"body": json.dumps({"valor_imovel": 500000, "entradas": [], "regiao": "SP"})}
+        context = Mock()
+        context.request_id = "test-grade"
+
+        response = grade(event, context)
+
+        assert response["statusCode"] == 400
+
+
+class TestTabelaHandler:
+    """Testes do endpoint de tabela completa (NDJSON/CSV)."""
+
+    BODY = {
+        "valor_imovel": 500000,
+        "entrada": 100000,
+        "prazo_meses": 360,
+        "tipo_amortizacao": "SAC",
+        "regiao": "SP"
+    }
+
+    def _chamar(self, query=None, headers=None, body=None):
+        event = {
+            "body": json.dumps(body or self.BODY),
+            "queryStringParameters": query,
+            "headers": headers or {},
+        }
+        context = Mock()
+        context.request_id = "test-tabela"
+        return tabela(event, context)
+
+    def test_ndjson_primeira_pagina(self):
+        response = self._chamar()
+
+        assert response["statusCode"] == 200
+        assert response["headers"]["Content-Type"] == "application/x-ndjson"
+        assert response["headers"]["X-Total-Months"] == "360"
+        assert response["headers"]["X-Next-From-Month"] == "121"
+
+        linhas = [json.loads(linha) for linha in response["body"].splitlines()]
+        assert len(linhas) == 120
+        assert [linha["mes"] for linha in linhas] == list(range(1, 121))
+
+    def test_janela_final_sem_proxima_pagina(self):
+        response = self._chamar(query={"from_month": "301", "to_month": "360"})
+
+        linhas = [json.loads(linha) for linha in response["body"].splitlines()]
+        assert linhas[0]["mes"] == 301
+        assert linhas[-1]["mes"] == 360
+        assert linhas[-1]["saldo_devedor"] == 0
+        assert "X-Next-From-Month" not in response["headers"]
+
+    def test_csv_via_accept(self):
+        response = self._chamar(
+            query={"from_month": "1", "to_month": "2"}, headers={"accept": "text/csv"}
+        )
+
+        assert response["headers"]["Content-Type"].startswith("text/csv")
+        linhas = response["body"].splitlines()
+        assert linhas[0] == "mes,parcela,juros,amortizacao,saldo_devedor"
+        assert len(linhas) == 3
+        assert linhas[1].startswith("1,")
+
+    def test_janela_invalida(self):
+        response = self._chamar(query={"from_month": "400"})
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["code"] == "INVALID_PARAMETERS"
+
+    def test_formato_invalido(self):
+        response = self._chamar(query={"format": "xml"})
+
+        assert response["statusCode"] == 400
+
+
 class TestHealthHandler:
     """Testes para health check handler."""
 
@@ -301,3 +669,56 @@ class TestHealthHandler:
         assert body["service"] == "financing-simulator"
         assert "timestamp" in body
         assert "version" in body
+
+
+@pytest.mark.usefixtures("limpar_cache")
+class TestCenariosHandler:
+    """Testes do endpoint de simulação de Monte Carlo."""
+
+    BODY = {
+        "valor_imovel": 500000,
+        "entrada": 100000,
+        "prazo_meses": 360,
+        "tipo_amortizacao": "SAC",
+        "regiao": "SP",
+        "indexador": "SELIC",
+        "num_trajetorias": 500,
+        "semente": 7,
+    }
+
+    def test_cenarios_percentis(self):
+        historico = [0.8, 0.85, 0.9, 0.95, 1.0, 1.05, 1.0, 0.95, 0.9, 0.85, 0.8, 0.83] * 10
+        context = Mock()
+        context.request_id = "test-cenarios"
+
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_historico", return_value=historico
+        ):
+            response = cenarios({"body": json.dumps(self.BODY)}, context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+
+        assert body["num_trajetorias"] == 500
+        assert body["calibracao"]["indexador"] == "SELIC"
+        assert set(body["total_pago"]) == {"p5", "p25", "p50", "p75", "p95"}
+        assert body["total_pago"]["p5"] <= body["total_pago"]["p95"]
+
+    def test_cenarios_sem_serie_historica(self):
+        context = Mock()
+        context.request_id = "test-cenarios"
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_historico", return_value=None):
+            response = cenarios({"body": json.dumps(self.BODY)}, context)
+
+        assert response["statusCode"] == 503
+
+    def test_cenarios_trajetorias_demais(self):
+        context = Mock()
+        context.request_id = "test-cenarios"
+
+        response = cenarios(
+            {"body": json.dumps({**self.BODY, "num_trajetorias": 50_000})}, context
+        )
+
+        assert response["statusCode"] == 400
@@ -0,0 +1,170 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.models.domain import Indicador
+from src.services.indicator_service import IndicatorService, get_indicator_cache
+from src.utils.cache import LRUCache, TTLCache
+
+pytestmark = pytest.mark.usefixtures("busca_sequencial")
+
+
+class TestTTLCache:
+    """Testes para o cache com expiração."""
+
+    def test_hit_e_miss(self):
+        cache = TTLCache(ttl_seconds=60)
+
+        assert cache.get("SELIC") is None
+        cache.set("SELIC", 11.75)
+
+        assert cache.get("SELIC") == 11.75
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.stats()["hit_ratio"] == 0.5
+
+    def test_expiracao(self, clock):
+        cache = TTLCache(ttl_seconds=60, clock=clock)
+
+        cache.set("SELIC", 11.75)
+        clock.agora = 59.9
+        assert cache.get("SELIC") == 11.75
+
+        clock.agora = 60.0
+        assert cache.get("SELIC") is None
+        assert len(cache) == 0
+
+    def test_ttl_por_entrada(self, clock):
+        cache = TTLCache(ttl_seconds=60, clock=clock)
+
+        cache.set("IPCA", 0.5, ttl_seconds=10)
+        clock.agora = 11
+        assert cache.get("IPCA") is None
+
+    def test_clear_zera_contadores(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set("SELIC", 1.0)
+        cache.get("SELIC")
+
+        cache.clear()
+
+        assert cache.stats() == {
+            "hits": 0,
+            "misses": 0,
+            "hit_ratio": 0.0,
+            "size": 0,
+            "ttl_seconds": 60,
+        }
+
+
+class TestLRUCache:
+    """Testes do cache com limite de entradas e de bytes."""
+
+    def test_descarta_menos_usada(self):
+        cache = LRUCache(ttl_seconds=60, max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.evictions == 1
+
+    def test_limite_de_bytes(self):
+        cache = LRUCache(ttl_seconds=60, max_entries=10, max_bytes=10)
+        cache.set("a", "x" * 4)
+        cache.set("b", "x" * 4)
+        cache.set("c", "x" * 4)
+
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 8
+
+    def test_valor_maior_que_o_limite_nao_entra(self):
+        cache = LRUCache(ttl_seconds=60, max_entries=10, max_bytes=10)
+        cache.set("a", "x" * 4)
+        cache.set("grande", "x" * 11)
+
+        assert cache.get("grande") is None
+        assert cache.get("a") == "x" * 4
+
+    def test_substituir_chave_atualiza_bytes(self):
+        cache = LRUCache(ttl_seconds=60, max_entries=10, max_bytes=10)
+        cache.set("a", "x" * 8)
+        cache.set("a", "x" * 2)
+
+        assert cache.stats()["bytes"] == 2
+        assert cache.evictions == 0
+
+    def test_expiracao(self, clock):
+        cache = LRUCache(ttl_seconds=60, max_entries=10, clock=clock)
+        cache.set("a", "1")
+
+        clock.agora = 60.0
+
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_invalidate_all_preserva_contadores(self):
+        cache = LRUCache(ttl_seconds=60, max_entries=10)
+        cache.set("a", "1")
+        cache.get("a")
+        cache.get("b")
+
+        cache.invalidate_all()
+
+        stats = cache.stats()
+        assert stats["size"] == 0
+        assert stats["bytes"] == 0
+        assert stats["hit_ratio"] == 0.5
+
+
+@pytest.mark.usefixtures("limpar_cache")
+class TestIndicatorServiceCache:
+    """Testes do cache de indicadores entre invocações."""
+
+    def _selic(self) -> Indicador:
+        return Indicador(
+            tipo="SELIC", valor=11.75, fonte="Banco Central do Brasil", data_referencia="2026-01-06"
+        )
+
+    def _ipca(self) -> Indicador:
+        return Indicador(tipo="IPCA", valor=0.52, fonte="IBGE", data_referencia="2026-01-01")
+
+    def test_selic_cacheada_entre_instancias(self):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=self._selic()
+        ) as buscar_selic:
+            primeiro = IndicatorService().buscar_indicador_com_fallback()
+            segundo = IndicatorService().buscar_indicador_com_fallback()
+
+        assert primeiro.valor == segundo.valor == 11.75
+        assert buscar_selic.call_count == 1
+        assert get_indicator_cache().hits == 1
+
+    def test_ipca_tem_entrada_propria(self):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=None
+        ) as buscar_selic, patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca", return_value=self._ipca()
+        ) as buscar_ipca:
+            service = IndicatorService()
+            service.buscar_indicador_com_fallback()
+            indicador = service.buscar_indicador_com_fallback()
+
+        assert indicador.tipo == "IPCA"
+        assert buscar_ipca.call_count == 1
+        assert buscar_selic.call_count == 2
+        assert get_indicator_cache().get("SELIC") is None
+
+    def test_fallback_nao_e_cacheado(self):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=None
+        ), patch("src.clients.ibge_client.IBGEClient.buscar_ipca", return_value=None):
+            indicador = IndicatorService().buscar_indicador_com_fallback()
+
+        assert indicador.tipo == "TAXA_BASE"
+        assert len(get_indicator_cache()) == 0
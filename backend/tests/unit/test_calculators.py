@@ -1,6 +1,36 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
 import pytest
 
 from src.calculators import CalculatorFactory, PRICECalculator, SACCalculator
+from src.calculators.cents_calculator import colunas_em_centavos
+from src.calculators.cet_calculator import (
+    calcular_cet,
+    calcular_cet_lote,
+    taxa_interna_retorno,
+)
+from src.calculators.indexed_calculator import (
+    calcular_indexado,
+    colunas_indexadas,
+    projetar_correcoes,
+)
+from src.calculators.prepayment_calculator import calcular_com_amortizacoes
+from src.calculators.rate_path_model import ModeloTrajetorias
+from src.calculators.vectorized_calculator import (
+    VectorizedPRICECalculator,
+    VectorizedSACCalculator,
+    calcular_lote,
+    totais_fechados,
+)
+from src.models.domain import (
+    AmortizacaoExtraordinaria,
+    EncargosFinanciamento,
+    arredondar_centavos,
+)
 
 
 class TestPRICECalculator:
@@ -254,3 +284,710 @@ class TestComparacaoPRICEvsSAC:
             sac_result.parcelas[0].valor_parcela >
             sac_result.parcelas[-1].valor_parcela
         )
+
+
+CENARIOS = [
+    (100000, 1.0, 12),
+    (300000, 0.85, 360),
+    (750000, 1.2, 480),
+    (50000, 0.0, 24),
+]
+
+
+def _entradas_aleatorias(quantidade, semente=42):
+    """Valores com centavos, taxas com 4 casas e prazos variados (muitos empates de meio centavo)."""
+    rng = np.random.default_rng(semente)
+
+    return zip(
+        np.round(rng.uniform(50_000, 2_000_000, quantidade), 2).tolist(),
+        np.round(rng.uniform(0.3, 1.5, quantidade), 4).tolist(),
+        rng.integers(12, 481, quantidade).tolist(),
+        strict=True,
+    )
+
+
+def _maior_diferenca_em_centavos(obtidas, esperadas) -> int:
+    return max(
+        round(abs(a - b) * 100)
+        for obtida, esperada in zip(obtidas, esperadas, strict=True)
+        for a, b in zip(obtida.to_dict().values(), esperada.to_dict().values(), strict=True)
+    )
+
+
+# Empates de meio centavo são arredondados igualmente em todos os caminhos. Em PRICE,
+# (1+i)^k amplifica o ruído de ponto flutuante (no laço e na forma fechada), então um
+# valor a menos de ~1e-6 do meio centavo ainda pode cair em centavos vizinhos.
+TOLERANCIA_CENTAVOS = {"PRICE": 1, "SAC": 0}
+
+
+class TestFactorySemNumpy:
+    def test_backends_python_e_centavos_nao_importam_numpy(self):
+        # numpy=None em sys.modules faz qualquer import do NumPy falhar
+        codigo = (
+            "import sys; sys.modules['numpy'] = None\n"
+            "from src.calculators import CalculatorFactory\n"
+            "for backend in ('python', 'centavos'):\n"
+            "    CalculatorFactory.create('PRICE', backend).calcular_resumo(300000, 0.85, 360)\n"
+            "    CalculatorFactory.create('SAC', backend).calcular(300000, 0.85, 360)\n"
+        )
+        raiz = Path(__file__).resolve().parents[2]
+
+        resultado = subprocess.run(
+            [sys.executable, "-c", codigo],
+            cwd=raiz,
+            env={**os.environ, "PYTHONPATH": str(raiz)},
+            capture_output=True,
+            text=True,
+        )
+
+        assert resultado.returncode == 0, resultado.stderr
+
+
+class TestBackendNumpy:
+    """
+    O backend NumPy deve reproduzir o cálculo em laço ao centavo (SAC) ou com
+    no máximo 1 centavo de diferença (PRICE, ver TOLERANCIA_CENTAVOS)
+    """
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    @pytest.mark.parametrize("valor,taxa,prazo", CENARIOS)
+    def test_igual_ao_laco(self, tipo, valor, taxa, prazo):
+        esperado = CalculatorFactory.create(tipo, backend="python").calcular(valor, taxa, prazo)
+        obtido = CalculatorFactory.create(tipo, backend="numpy").calcular(valor, taxa, prazo)
+
+        assert len(obtido.parcelas) == len(esperado.parcelas)
+        for p_obtida, p_esperada in zip(obtido.parcelas, esperado.parcelas, strict=True):
+            assert p_obtida.to_dict() == p_esperada.to_dict()
+
+        assert obtido.total_pago == pytest.approx(esperado.total_pago, abs=0.01)
+        assert obtido.total_juros == pytest.approx(esperado.total_juros, abs=0.01)
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_igual_ao_laco_em_entradas_aleatorias(self, tipo):
+        laco = CalculatorFactory.create(tipo, backend="python")
+        numpy = CalculatorFactory.create(tipo, backend="numpy")
+
+        for valor, taxa, prazo in _entradas_aleatorias(300):
+            esperado = laco.calcular(valor, taxa, prazo)
+            obtido = numpy.calcular(valor, taxa, prazo)
+
+            diferenca = _maior_diferenca_em_centavos(obtido.parcelas, esperado.parcelas)
+            assert diferenca <= TOLERANCIA_CENTAVOS[tipo], (valor, taxa, prazo)
+
+    def test_factory_backend_numpy(self):
+        assert isinstance(CalculatorFactory.create("PRICE", backend="numpy"), VectorizedPRICECalculator)
+        assert isinstance(CalculatorFactory.create("SAC", backend="numpy"), VectorizedSACCalculator)
+
+    def test_factory_backend_do_ambiente(self, monkeypatch):
+        monkeypatch.setenv("CALCULATOR_BACKEND", "numpy")
+
+        assert isinstance(CalculatorFactory.create("SAC"), VectorizedSACCalculator)
+
+    def test_backend_invalido(self):
+        with pytest.raises(ValueError, match="Backend de cálculo"):
+            CalculatorFactory.create("PRICE", backend="fortran")
+
+    def test_validacao_mantida(self):
+        with pytest.raises(ValueError):
+            CalculatorFactory.create("PRICE", backend="numpy").calcular(-1000, 1.0, 12)
+
+
+class TestCalculoEmLote:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_lote_igual_aos_calculos_individuais(self, tipo):
+        valores = [valor for valor, _, _ in CENARIOS]
+        taxas = [taxa for _, taxa, _ in CENARIOS]
+        prazos = [prazo for _, _, prazo in CENARIOS]
+
+        lote = calcular_lote(tipo, valores, taxas, prazos)
+        calc = CalculatorFactory.create(tipo, backend="python")
+
+        for linha, (valor, taxa, prazo) in enumerate(CENARIOS):
+            esperado = calc.calcular(valor, taxa, prazo)
+
+            assert lote.total_pago[linha] == pytest.approx(esperado.total_pago, abs=0.01)
+            assert lote.total_juros[linha] == pytest.approx(esperado.total_juros, abs=0.01)
+            assert lote.parcela[linha, 0] == pytest.approx(
+                esperado.primeira_parcela().valor_parcela, abs=0.01
+            )
+            assert lote.parcela[linha, prazo - 1] == pytest.approx(
+                esperado.ultima_parcela().valor_parcela, abs=0.01
+            )
+
+            # Meses além do prazo ficam zerados
+            assert not lote.parcela[linha, prazo:].any()
+            assert lote.saldo[linha, prazo - 1] == 0.0
+
+    def test_lote_parametros_invalidos(self):
+        with pytest.raises(ValueError):
+            calcular_lote("PRICE", [100000, -1], [1.0, 1.0], [12, 12])
+
+    def test_lote_tipo_invalido(self):
+        with pytest.raises(ValueError):
+            calcular_lote("GAUSS", [100000], [1.0], [12])
+
+
+class TestResumoFormaFechada:
+    """calcular_resumo deve coincidir com a tabela completa sem gerá-la"""
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    @pytest.mark.parametrize("valor,taxa,prazo", CENARIOS)
+    def test_resumo_igual_a_tabela(self, tipo, valor, taxa, prazo):
+        calc = CalculatorFactory.create(tipo)
+
+        tabela = calc.calcular(valor, taxa, prazo)
+        resumo = calc.calcular_resumo(valor, taxa, prazo)
+
+        assert [p.to_dict() for p in resumo.resumo()] == [p.to_dict() for p in tabela.resumo()]
+        assert resumo.primeira_parcela().to_dict() == tabela.primeira_parcela().to_dict()
+        assert resumo.ultima_parcela().to_dict() == tabela.ultima_parcela().to_dict()
+        assert resumo.total_pago == pytest.approx(tabela.total_pago, abs=0.01)
+        assert resumo.total_juros == pytest.approx(tabela.total_juros, abs=0.01)
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_resumo_igual_ao_laco_em_entradas_aleatorias(self, tipo):
+        calc = CalculatorFactory.create(tipo, backend="python")
+
+        for valor, taxa, prazo in _entradas_aleatorias(300, semente=7):
+            tabela = calc.calcular(valor, taxa, prazo)
+            resumo = calc.calcular_resumo(valor, taxa, prazo)
+
+            diferenca = _maior_diferenca_em_centavos(resumo.resumo(), tabela.resumo())
+            assert diferenca <= TOLERANCIA_CENTAVOS[tipo], (valor, taxa, prazo)
+
+            for fechado, laco in (
+                (resumo.total_pago, tabela.total_pago),
+                (resumo.total_juros, tabela.total_juros),
+            ):
+                assert abs(arredondar_centavos(fechado) - arredondar_centavos(laco)) <= (
+                    TOLERANCIA_CENTAVOS[tipo] / 100 + 1e-9
+                ), (valor, taxa, prazo)
+
+    def test_resumo_prazo_curto_tem_todas_as_parcelas(self):
+        resumo = SACCalculator().calcular_resumo(100000, 1.0, 12, num_pontos=24)
+
+        assert [p.numero for p in resumo.parcelas] == list(range(1, 13))
+
+    def test_resumo_com_outro_numero_de_pontos(self):
+        resumo = PRICECalculator().calcular_resumo(100000, 1.0, 360)
+
+        with pytest.raises(ValueError):
+            resumo.resumo(num_pontos=6)
+
+    def test_resumo_valida_parametros(self):
+        with pytest.raises(ValueError):
+            PRICECalculator().calcular_resumo(100000, -1.0, 360)
+
+
+class TestGeracaoDeParcelas:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_janela_igual_a_tabela(self, tipo):
+        calc = CalculatorFactory.create(tipo)
+
+        tabela = calc.calcular(400000, 0.85, 360)
+        janela = list(calc.gerar_parcelas(400000, 0.85, 360, de_mes=100, ate_mes=130))
+
+        assert [p.numero for p in janela] == list(range(100, 131))
+        assert [p.to_dict() for p in janela] == [p.to_dict() for p in tabela.parcelas[99:130]]
+
+    def test_tabela_inteira_por_padrao(self):
+        parcelas = list(SACCalculator().gerar_parcelas(120000, 1.0, 24))
+
+        assert len(parcelas) == 24
+        assert parcelas[-1].saldo_devedor == 0.0
+
+    @pytest.mark.parametrize("de_mes,ate_mes", [(0, 10), (10, 5), (1, 25)])
+    def test_intervalo_invalido_falha_imediatamente(self, de_mes, ate_mes):
+        with pytest.raises(ValueError, match="Intervalo"):
+            PRICECalculator().gerar_parcelas(120000, 1.0, 24, de_mes=de_mes, ate_mes=ate_mes)
+
+
+class TestTotaisFechados:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_grade_igual_ao_laco(self, tipo):
+        valores = np.array([400000.0, 250000.0])[:, None]
+        prazos = np.array([12, 180, 480])[None, :]
+
+        totais = totais_fechados(tipo, valores, 0.85, prazos)
+        calc = CalculatorFactory.create(tipo)
+
+        assert totais.total_pago.shape == (2, 3)
+        for i, valor in enumerate(valores[:, 0]):
+            for j, prazo in enumerate(prazos[0]):
+                tabela = calc.calcular(float(valor), 0.85, int(prazo))
+
+                assert totais.primeira_parcela[i, j] == pytest.approx(
+                    tabela.primeira_parcela().valor_parcela, abs=0.01
+                )
+                assert totais.ultima_parcela[i, j] == pytest.approx(
+                    tabela.ultima_parcela().valor_parcela, abs=0.01
+                )
+                assert totais.total_pago[i, j] == pytest.approx(tabela.total_pago, abs=0.01)
+                assert totais.total_juros[i, j] == pytest.approx(tabela.total_juros, abs=0.01)
+
+    def test_taxa_zero(self):
+        totais = totais_fechados("PRICE", np.array([1200.0]), 0.0, np.array([12]))
+
+        assert totais.primeira_parcela[0] == 100.0
+        assert totais.total_juros[0] == 0.0
+
+
+class TestCruzamentoPRICEvsSAC:
+    @pytest.mark.parametrize("valor,taxa,prazo", CENARIOS + [(1000000, 2.0, 480)])
+    def test_mes_igual_ao_das_tabelas(self, valor, taxa, prazo):
+        sac = SACCalculator().calcular(valor, taxa, prazo)
+        price = PRICECalculator().calcular(valor, taxa, prazo)
+
+        esperado = next(
+            p_sac.numero
+            for p_sac, p_price in zip(sac.parcelas, price.parcelas, strict=True)
+            if p_sac.valor_parcela <= p_price.valor_parcela
+        )
+
+        assert SACCalculator().mes_cruzamento_price(valor, taxa, prazo) == esperado
+
+
+class TestValorMaximoFinanciado:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    @pytest.mark.parametrize("parcela,taxa,prazo", [(3000, 0.85, 360), (1500, 1.2, 60), (900, 0.0, 120)])
+    def test_maior_parcela_igual_ao_limite(self, tipo, parcela, taxa, prazo):
+        calc = CalculatorFactory.create(tipo)
+
+        valor = calc.valor_maximo_financiado(parcela, taxa, prazo)
+        tabela = calc.calcular(valor, taxa, prazo)
+
+        maior = max(p.valor_parcela for p in tabela.parcelas)
+        assert maior == pytest.approx(parcela, abs=1e-6)
+
+    def test_parcela_invalida(self):
+        with pytest.raises(ValueError, match="Parcela máxima"):
+            PRICECalculator().valor_maximo_financiado(0, 1.0, 360)
+
+
+class TestPrazoMinimo:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    @pytest.mark.parametrize(
+        "valor,taxa,parcela",
+        [(300000, 0.85, 3000), (300000, 0.85, 4000), (100000, 0.0, 1000), (100000, 1.0, 50000)],
+    )
+    def test_igual_a_busca_por_todos_os_prazos(self, tipo, valor, taxa, parcela):
+        calc = CalculatorFactory.create(tipo)
+
+        esperado = next(
+            (
+                prazo
+                for prazo in range(12, 481)
+                if max(p.valor_parcela for p in calc.calcular(valor, taxa, prazo).parcelas)
+                <= parcela
+            ),
+            None,
+        )
+
+        assert calc.prazo_minimo(valor, taxa, parcela) == esperado
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_parcela_abaixo_dos_juros(self, tipo):
+        # 1% de 400 mil = 4 mil só de juros no primeiro mês
+        assert CalculatorFactory.create(tipo).prazo_minimo(400000, 1.0, 3999) is None
+
+
+def _meses_ate_quitar(tipo, saldo, i, parcela_fixa, amortizacao_fixa):
+    meses = 0
+    while saldo > 1e-6:
+        meses += 1
+        saldo -= (parcela_fixa - saldo * i) if tipo == "PRICE" else amortizacao_fixa
+    return meses
+
+
+def _tabela_referencia(tipo, valor, taxa, prazo, eventos):
+    """Laço mês a mês com amortizações extraordinárias, para comparação."""
+    i = taxa / 100
+    saldo = valor
+    prazo_final = prazo
+    parcela_fixa = valor * i / (1 - (1 + i) ** -prazo) if i else valor / prazo
+    amortizacao_fixa = valor / prazo
+    por_mes = {evento.mes: evento for evento in eventos}
+    linhas = []
+
+    mes = 0
+    while saldo > 0:
+        mes += 1
+        juros = saldo * i
+
+        if tipo == "PRICE":
+            ultima = mes == prazo_final or saldo * (1 + i) <= parcela_fixa + 1e-6
+            amortizacao = saldo if ultima else parcela_fixa - juros
+        else:
+            ultima = mes == prazo_final or saldo <= amortizacao_fixa + 1e-6
+            amortizacao = saldo if ultima else amortizacao_fixa
+
+        saldo -= amortizacao
+        parcela = amortizacao + juros
+
+        evento = por_mes.get(mes)
+        if evento and saldo > 0:
+            extra = min(evento.valor, saldo)
+            saldo -= extra
+            parcela += extra
+            amortizacao += extra
+
+            if evento.modo == "REDUZIR_PARCELA" and saldo > 0:
+                restante = prazo_final - mes
+                parcela_fixa = saldo * i / (1 - (1 + i) ** -restante) if i else saldo / restante
+                amortizacao_fixa = saldo / restante
+            elif evento.modo == "REDUZIR_PRAZO" and saldo > 0:
+                prazo_final = mes + _meses_ate_quitar(tipo, saldo, i, parcela_fixa, amortizacao_fixa)
+
+        if ultima:
+            saldo = 0.0
+
+        linhas.append((parcela, juros, amortizacao, max(saldo, 0.0)))
+
+    return linhas
+
+
+class TestAmortizacaoExtraordinaria:
+    EVENTOS = [
+        [AmortizacaoExtraordinaria(mes=12, valor=20000, modo="REDUZIR_PRAZO")],
+        [AmortizacaoExtraordinaria(mes=24, valor=35000, modo="REDUZIR_PARCELA")],
+        [
+            AmortizacaoExtraordinaria(mes=6, valor=10000, modo="REDUZIR_PARCELA"),
+            AmortizacaoExtraordinaria(mes=60, valor=50000, modo="REDUZIR_PRAZO"),
+            AmortizacaoExtraordinaria(mes=61, valor=5000, modo="REDUZIR_PARCELA"),
+            AmortizacaoExtraordinaria(mes=120, valor=80000, modo="REDUZIR_PRAZO"),
+        ],
+    ]
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    @pytest.mark.parametrize("taxa", [0.85, 0.0])
+    @pytest.mark.parametrize("eventos", EVENTOS)
+    def test_igual_ao_laco_de_referencia(self, tipo, taxa, eventos):
+        tabela = calcular_com_amortizacoes(tipo, 300000, taxa, 360, eventos)
+        referencia = _tabela_referencia(tipo, 300000, taxa, 360, eventos)
+
+        assert len(tabela.parcelas) == len(referencia)
+        for parcela, (valor, juros, amortizacao, saldo) in zip(tabela.parcelas, referencia, strict=True):
+            assert parcela.valor_parcela == pytest.approx(valor, abs=0.01)
+            assert parcela.valor_juros == pytest.approx(juros, abs=0.01)
+            assert parcela.valor_amortizacao == pytest.approx(amortizacao, abs=0.01)
+            assert parcela.saldo_devedor == pytest.approx(saldo, abs=0.01)
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_sem_eventos_igual_a_tabela(self, tipo):
+        tabela = calcular_com_amortizacoes(tipo, 300000, 0.85, 360, [])
+        esperado = CalculatorFactory.create(tipo).calcular(300000, 0.85, 360)
+
+        assert [p.to_dict() for p in tabela.parcelas] == [p.to_dict() for p in esperado.parcelas]
+
+    @pytest.mark.parametrize("backend", ["python", "numpy"])
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_calculadoras_aceitam_eventos(self, tipo, backend):
+        eventos = self.EVENTOS[2]
+        calculator = CalculatorFactory.create(tipo, backend)
+
+        tabela = calculator.calcular(300000, 0.85, 360, amortizacoes=eventos)
+        esperado = calcular_com_amortizacoes(tipo, 300000, 0.85, 360, eventos)
+
+        assert [p.to_dict() for p in tabela.parcelas] == [p.to_dict() for p in esperado.parcelas]
+
+    @pytest.mark.parametrize("backend", ["python", "numpy"])
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_resumo_com_eventos_sai_da_tabela(self, tipo, backend):
+        eventos = [AmortizacaoExtraordinaria(mes=24, valor=100000, modo="REDUZIR_PRAZO")]
+        calculator = CalculatorFactory.create(tipo, backend)
+
+        resumo = calculator.calcular_resumo(300000, 0.85, 360, amortizacoes=eventos)
+        tabela = calcular_com_amortizacoes(tipo, 300000, 0.85, 360, eventos)
+
+        assert resumo.prazo_meses == len(tabela.parcelas) < 360
+        assert resumo.total_pago == tabela.total_pago
+        assert resumo.total_juros == tabela.total_juros
+        assert [p.to_dict() for p in resumo.parcelas] == [p.to_dict() for p in tabela.resumo()]
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_backend_centavos_recusa_eventos(self, tipo):
+        calculator = CalculatorFactory.create(tipo, "centavos")
+
+        with pytest.raises(ValueError, match="centavos"):
+            calculator.calcular(300000, 0.85, 360, amortizacoes=self.EVENTOS[0])
+
+    def test_reduzir_prazo_encurta_e_reduz_juros(self):
+        sem = PRICECalculator().calcular(300000, 0.85, 360)
+        com = calcular_com_amortizacoes(
+            "PRICE", 300000, 0.85, 360, [AmortizacaoExtraordinaria(12, 50000, "REDUZIR_PRAZO")]
+        )
+
+        assert len(com.parcelas) < 360
+        assert com.total_juros < sem.total_juros
+        assert com.parcelas[12].valor_parcela == pytest.approx(sem.parcelas[12].valor_parcela)
+
+    def test_quitacao_antecipada(self):
+        tabela = calcular_com_amortizacoes(
+            "SAC", 100000, 1.0, 120, [AmortizacaoExtraordinaria(10, 1e9, "REDUZIR_PRAZO")]
+        )
+
+        assert len(tabela.parcelas) == 10
+        assert tabela.ultima_parcela().saldo_devedor == 0.0
+
+    @pytest.mark.parametrize(
+        "eventos",
+        [
+            [AmortizacaoExtraordinaria(10, -1, "REDUZIR_PRAZO")],
+            [AmortizacaoExtraordinaria(10, 1000, "REDUZIR_PRAZO")] * 2,
+            [AmortizacaoExtraordinaria(120, 1000, "REDUZIR_PRAZO")],
+        ],
+    )
+    def test_eventos_invalidos(self, eventos):
+        with pytest.raises(ValueError):
+            calcular_com_amortizacoes("PRICE", 100000, 1.0, 120, eventos)
+
+    def test_evento_apos_quitacao(self):
+        eventos = [
+            AmortizacaoExtraordinaria(10, 90000, "REDUZIR_PRAZO"),
+            AmortizacaoExtraordinaria(100, 1000, "REDUZIR_PRAZO"),
+        ]
+
+        with pytest.raises(ValueError, match="após a quitação"):
+            calcular_com_amortizacoes("PRICE", 100000, 1.0, 120, eventos)
+
+
+def _tabela_indexada_referencia(tipo, valor, taxas, correcoes, prazo):
+    """Laço mês a mês: corrige o saldo, cobra juros e recalcula a parcela."""
+    linhas = []
+    saldo = valor
+
+    for k in range(prazo):
+        restantes = prazo - k
+        i = taxas[k] / 100
+        saldo *= 1 + correcoes[k] / 100
+        juros = saldo * i
+
+        if tipo == "SAC" or i == 0:
+            amortizacao = saldo / restantes
+        else:
+            fator = (1 + i) ** restantes
+            amortizacao = saldo * i * fator / (fator - 1) - juros
+
+        saldo -= amortizacao
+        linhas.append((amortizacao + juros, juros, amortizacao, saldo))
+
+    return linhas
+
+
+class TestTabelaIndexada:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_igual_ao_laco_de_referencia(self, tipo):
+        rng = np.random.default_rng(7)
+        taxas = rng.uniform(0.6, 1.1, 360)
+        correcoes = rng.uniform(-0.1, 0.6, 360)
+        taxas[100:110] = 0.0
+
+        tabela = calcular_indexado(tipo, 300000, taxas, correcoes, 360)
+        referencia = _tabela_indexada_referencia(tipo, 300000, taxas, correcoes, 360)
+
+        for parcela, (valor, juros, amortizacao, saldo) in zip(tabela.parcelas, referencia, strict=True):
+            assert parcela.valor_parcela == pytest.approx(valor, abs=0.01)
+            assert parcela.valor_juros == pytest.approx(juros, abs=0.01)
+            assert parcela.valor_amortizacao == pytest.approx(amortizacao, abs=0.01)
+            assert parcela.saldo_devedor == pytest.approx(saldo, abs=0.01)
+
+        assert tabela.ultima_parcela().saldo_devedor == 0.0
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    @pytest.mark.parametrize("taxa", [0.85, 0.0])
+    def test_sem_correcao_igual_a_tabela(self, tipo, taxa):
+        tabela = calcular_indexado(tipo, 300000, taxa, 0.0, 360)
+        esperado = CalculatorFactory.create(tipo).calcular(300000, taxa, 360)
+
+        assert [p.to_dict() for p in tabela.parcelas] == [p.to_dict() for p in esperado.parcelas]
+
+    def test_correcao_positiva_aumenta_parcelas_price(self):
+        tabela = calcular_indexado("PRICE", 300000, 0.85, 0.2, 360)
+        parcelas = np.asarray(tabela.valores_parcela)
+
+        assert np.all(np.diff(parcelas) > 0)
+        assert tabela.total_pago > PRICECalculator().calcular(300000, 0.85, 360).total_pago
+
+    def test_trajetoria_com_tamanho_errado(self):
+        with pytest.raises(ValueError, match="360 meses"):
+            calcular_indexado("PRICE", 300000, 0.85, [0.1] * 12, 360)
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_trajetorias_2d_iguais_as_individuais(self, tipo):
+        correcoes = np.random.default_rng(3).uniform(0.0, 0.8, (4, 120))
+
+        parcelas, _, _, saldos = colunas_indexadas(tipo, 200000, 0.9, correcoes, 120)
+
+        assert parcelas.shape == saldos.shape == (4, 120)
+        for linha in range(4):
+            tabela = calcular_indexado(tipo, 200000, 0.9, correcoes[linha], 120)
+            np.testing.assert_allclose(parcelas[linha], tabela.valores_parcela)
+            np.testing.assert_allclose(saldos[linha], tabela.saldos_devedores)
+
+    def test_projecao_pela_media_geometrica(self):
+        correcoes = projetar_correcoes([0.5, 0.3, -0.1], 24)
+
+        esperado = ((1.005 * 1.003 * 0.999) ** (1 / 3) - 1) * 100
+        assert correcoes.shape == (24,)
+        assert correcoes[0] == pytest.approx(esperado)
+
+    def test_projecao_sem_historico(self):
+        with pytest.raises(ValueError):
+            projetar_correcoes([], 24)
+
+
+class TestCET:
+    ENCARGOS = EncargosFinanciamento(
+        tarifas_iniciais=3000,
+        taxa_administracao_mensal=25,
+        mip_percentual_mensal=0.02,
+        dfi_percentual_mensal=0.01,
+    )
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_sem_encargos_igual_a_taxa_nominal(self, tipo):
+        tabela = CalculatorFactory.create(tipo).calcular(300000, 0.85, 480)
+
+        resultado = calcular_cet(tabela, 300000, EncargosFinanciamento())
+
+        assert resultado.cet_mensal == pytest.approx(0.85, abs=1e-8)
+        assert resultado.cet_anual == pytest.approx((1.0085**12 - 1) * 100, abs=1e-6)
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_encargos_aumentam_o_cet_e_zeram_o_vpl(self, tipo):
+        tabela = CalculatorFactory.create(tipo).calcular(300000, 0.85, 480)
+
+        resultado = calcular_cet(tabela, 300000, self.ENCARGOS, valor_imovel=400000)
+
+        assert resultado.cet_mensal > 0.85
+        taxa = resultado.cet_mensal / 100
+        vpl = sum(f / (1 + taxa) ** t for t, f in enumerate(resultado.fluxo))
+        assert vpl == pytest.approx(0, abs=1e-4)
+
+    def test_fluxo_com_encargos(self):
+        tabela = PRICECalculator().calcular(100000, 1.0, 12)
+
+        fluxo = calcular_cet(tabela, 100000, self.ENCARGOS, valor_imovel=200000).fluxo
+
+        assert fluxo[0] == 97000
+        assert fluxo[1] == pytest.approx(-(tabela.parcelas[0].valor_parcela + 25 + 20 + 20))
+        saldo = tabela.parcelas[0].saldo_devedor
+        assert fluxo[2] == pytest.approx(
+            -(tabela.parcelas[1].valor_parcela + 25 + saldo * 0.0002 + 20)
+        )
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_lote_igual_ao_individual(self, tipo):
+        valores = np.array([150000.0, 300000.0, 800000.0])
+        taxas = np.array([0.7, 0.85, 1.1])
+        prazos = np.array([120, 360, 480])
+
+        mensal, anual = calcular_cet_lote(
+            calcular_lote(tipo, valores, taxas, prazos), valores, self.ENCARGOS, 1000000
+        )
+
+        for i in range(3):
+            tabela = CalculatorFactory.create(tipo).calcular(valores[i], taxas[i], int(prazos[i]))
+            individual = calcular_cet(tabela, valores[i], self.ENCARGOS, valor_imovel=1000000)
+            assert mensal[i] == pytest.approx(individual.cet_mensal, abs=1e-9)
+            assert anual[i] == pytest.approx(individual.cet_anual, abs=1e-8)
+
+    def test_tir_sem_troca_de_sinal(self):
+        taxas = taxa_interna_retorno(np.array([[100.0, 10.0, 10.0], [100.0, -60.0, -60.0]]))
+
+        assert np.isnan(taxas[0])
+        assert taxas[1] == pytest.approx(0.130662, abs=1e-6)
+
+    def test_tarifas_maiores_que_o_valor(self):
+        tabela = PRICECalculator().calcular(1000, 1.0, 12)
+
+        with pytest.raises(ValueError):
+            calcular_cet(tabela, 1000, EncargosFinanciamento(tarifas_iniciais=1000))
+
+
+class TestModeloTrajetorias:
+    def test_calibracao_recupera_parametros(self):
+        rng = np.random.default_rng(11)
+        media, persistencia, volatilidade = 0.004, 0.6, 0.002
+
+        x = np.empty(5000)
+        x[0] = media
+        for t in range(1, x.size):
+            x[t] = media + persistencia * (x[t - 1] - media) + volatilidade * rng.standard_normal()
+
+        modelo = ModeloTrajetorias.calibrar(np.expm1(x) * 100)
+
+        assert modelo.media == pytest.approx(media, abs=2e-4)
+        assert modelo.persistencia == pytest.approx(persistencia, abs=0.05)
+        assert modelo.volatilidade == pytest.approx(volatilidade, rel=0.05)
+        assert modelo.observacoes == 5000
+
+    def test_gerar_trajetorias(self):
+        modelo = ModeloTrajetorias(
+            media=0.004, persistencia=0.5, volatilidade=0.001, ultimo=0.004, observacoes=120
+        )
+
+        trajetorias = modelo.gerar(2000, 360, np.random.default_rng(1))
+        repetidas = modelo.gerar(2000, 360, np.random.default_rng(1))
+
+        assert trajetorias.shape == (2000, 360)
+        np.testing.assert_array_equal(trajetorias, repetidas)
+        assert trajetorias.mean() == pytest.approx(np.expm1(0.004) * 100, rel=0.01)
+
+    def test_serie_sem_variacao(self):
+        modelo = ModeloTrajetorias.calibrar([0.5] * 24)
+
+        assert modelo.persistencia == 0.0
+        assert modelo.volatilidade == 0.0
+        np.testing.assert_allclose(modelo.gerar(10, 12), 0.5)
+
+    def test_serie_curta(self):
+        with pytest.raises(ValueError, match="12 meses"):
+            ModeloTrajetorias.calibrar([0.4] * 6)
+
+
+class TestCalculoEmCentavos:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    @pytest.mark.parametrize("valor,taxa,prazo", CENARIOS)
+    def test_linhas_somam_os_totais(self, tipo, valor, taxa, prazo):
+        tabela = CalculatorFactory.create(tipo, backend="centavos").calcular(valor, taxa, prazo)
+        linhas = [p.to_dict() for p in tabela.parcelas]
+
+        assert sum(round(linha["parcela"] * 100) for linha in linhas) == round(
+            tabela.total_pago * 100
+        )
+        assert sum(round(linha["juros"] * 100) for linha in linhas) == round(
+            tabela.total_juros * 100
+        )
+        assert sum(round(linha["amortizacao"] * 100) for linha in linhas) == round(valor * 100)
+        assert tabela.ultima_parcela().saldo_devedor == 0.0
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_proximo_da_tabela_em_float(self, tipo):
+        centavos = CalculatorFactory.create(tipo, backend="centavos").calcular(300000, 0.85, 360)
+        exata = CalculatorFactory.create(tipo, backend="python").calcular(300000, 0.85, 360)
+
+        for mes in range(12):
+            assert centavos.parcelas[mes].valor_parcela == pytest.approx(
+                exata.parcelas[mes].valor_parcela, abs=0.01
+            )
+        assert centavos.total_pago == pytest.approx(exata.total_pago, rel=1e-4)
+
+    def test_ultima_parcela_absorve_o_residuo(self):
+        parcelas, juros, amortizacoes, saldos = colunas_em_centavos("SAC", 1000, 0.0, 3)
+
+        assert list(amortizacoes) == [33333, 33333, 33334]
+        assert list(saldos) == [66667, 33334, 0]
+        assert list(parcelas) == list(amortizacoes)
+
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_resumo_e_janela_iguais_a_tabela(self, tipo):
+        calculator = CalculatorFactory.create(tipo, backend="centavos")
+        tabela = calculator.calcular(250000, 0.9, 240)
+
+        resumo = calculator.calcular_resumo(250000, 0.9, 240)
+        janela = list(calculator.gerar_parcelas(250000, 0.9, 240, de_mes=100, ate_mes=110))
+
+        assert resumo.total_pago == tabela.total_pago
+        assert [p.to_dict() for p in resumo.parcelas] == [p.to_dict() for p in tabela.resumo()]
+        assert [p.to_dict() for p in janela] == [p.to_dict() for p in tabela.parcelas[99:110]]
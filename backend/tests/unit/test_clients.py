@@ -0,0 +1,386 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.clients.base_client import BaseHTTPClient
+from src.clients.circuit_breaker import (
+    CircuitBreaker,
+    obter_circuit_breaker,
+    resetar_circuit_breakers,
+)
+from src.clients.response_cache import ResponseCache
+from src.clients.retry import RetryPolicy
+from src.utils.deadline import Deadline
+from src.utils.metrics import obter_contadores, resetar_contadores
+
+
+@pytest.fixture(autouse=True)
+def isolar_estado_global():
+    resetar_circuit_breakers()
+    resetar_contadores()
+    yield
+    resetar_circuit_breakers()
+
+
+def _transport(respostas):
+    """Transport que devolve as respostas em sequência e registra as chamadas."""
+    chamadas = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        chamadas.append(request)
+        resposta = respostas[min(len(chamadas), len(respostas)) - 1]
+        if isinstance(resposta, Exception):
+            raise resposta
+        return resposta
+
+    return httpx.MockTransport(handler), chamadas
+
+
+class TestBaseHTTPClient:
+    """Testes do cliente HTTP base."""
+
+    def _client(self, transport, max_retries=2, retry_policy=None, cache=None) -> BaseHTTPClient:
+        client = BaseHTTPClient(
+            timeout=1,
+            max_retries=max_retries,
+            retry_policy=retry_policy or RetryPolicy(max_tentativas=max_retries, backoff_base=0),
+            cache=cache,
+        )
+        client.client = httpx.Client(transport=transport)
+        return client
+
+    def test_get_sucesso(self):
+        transport, chamadas = _transport([httpx.Response(200, json=[{"valor": "11.75"}])])
+
+        assert self._client(transport).get("https://api.test/selic") == [{"valor": "11.75"}]
+        assert len(chamadas) == 1
+
+    def test_get_retry_em_erro_5xx(self):
+        transport, chamadas = _transport(
+            [httpx.Response(503), httpx.Response(200, json={"ok": True})]
+        )
+
+        assert self._client(transport).get("https://api.test/selic") == {"ok": True}
+        assert len(chamadas) == 2
+
+    def test_get_sem_retry_em_erro_4xx(self):
+        transport, chamadas = _transport([httpx.Response(404)])
+
+        assert self._client(transport).get("https://api.test/selic") is None
+        assert len(chamadas) == 1
+
+    def test_aget_mesma_politica_de_retry(self):
+        transport, chamadas = _transport(
+            [httpx.ReadTimeout("timeout"), httpx.Response(200, json={"ok": True})]
+        )
+        client = BaseHTTPClient(timeout=1, max_retries=2)
+
+        async def executar():
+            async with httpx.AsyncClient(transport=transport) as async_client:
+                return await client.aget(async_client, "https://api.test/ipca")
+
+        assert asyncio.run(executar()) == {"ok": True}
+        assert len(chamadas) == 2
+
+
+class TestCircuitBreaker:
+    """Testes do circuit breaker por host."""
+
+    def test_abre_apos_limite_de_falhas(self):
+        breaker = CircuitBreaker("api.test", limite_falhas=3, tempo_espera=30)
+
+        for _ in range(2):
+            breaker.registrar_falha()
+        assert breaker.estado == "CLOSED"
+
+        breaker.registrar_falha()
+        assert breaker.estado == "OPEN"
+        assert breaker.permite_requisicao() is False
+
+    def test_sucesso_zera_falhas(self):
+        breaker = CircuitBreaker("api.test", limite_falhas=2)
+
+        breaker.registrar_falha()
+        breaker.registrar_sucesso()
+        breaker.registrar_falha()
+
+        assert breaker.estado == "CLOSED"
+
+    def test_half_open_libera_uma_requisicao(self, clock):
+        breaker = CircuitBreaker("api.test", limite_falhas=1, tempo_espera=30, clock=clock)
+        breaker.registrar_falha()
+
+        clock.agora = 30
+        assert breaker.permite_requisicao() is True
+        assert breaker.estado == "HALF_OPEN"
+        assert breaker.permite_requisicao() is False
+
+        breaker.registrar_sucesso()
+        assert breaker.estado == "CLOSED"
+
+    def test_falha_em_half_open_reabre(self, clock):
+        breaker = CircuitBreaker("api.test", limite_falhas=1, tempo_espera=30, clock=clock)
+        breaker.registrar_falha()
+
+        clock.agora = 31
+        breaker.permite_requisicao()
+        breaker.registrar_falha()
+
+        assert breaker.estado == "OPEN"
+        assert breaker.permite_requisicao() is False
+
+    def test_teste_sem_resultado_expira(self, clock):
+        breaker = CircuitBreaker(
+            "api.test", limite_falhas=1, tempo_espera=30, duracao_teste=10, clock=clock
+        )
+        breaker.registrar_falha()
+
+        clock.agora = 30
+        assert breaker.permite_requisicao() is True
+
+        clock.agora = 39
+        assert breaker.permite_requisicao() is False
+
+        clock.agora = 40
+        assert breaker.permite_requisicao() is True
+
+    def test_teste_cancelado_libera_o_circuito(self):
+        breaker = obter_circuit_breaker("api.test")
+        for _ in range(breaker.limite_falhas):
+            breaker.registrar_falha()
+        breaker.tempo_espera = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={"ok": True})
+
+        client = TestBaseHTTPClient()._client(httpx.MockTransport(handler))
+
+        async def executar():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_client:
+                tarefa = asyncio.create_task(client.aget(async_client, "https://api.test/ipca"))
+                await asyncio.sleep(0.01)
+                tarefa.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await tarefa
+
+        asyncio.run(executar())
+
+        assert breaker.estado == "HALF_OPEN"
+        assert breaker.permite_requisicao() is True
+
+    def test_transicoes_geram_metricas(self):
+        breaker = CircuitBreaker("api.test", limite_falhas=1)
+        breaker.registrar_falha()
+        breaker.permite_requisicao()
+
+        contadores = obter_contadores()
+        assert contadores["CircuitBreakerTransition[estado=OPEN,host=api.test]"] == 1
+        assert contadores["CircuitBreakerRejected[host=api.test]"] == 1
+
+    def test_estado_compartilhado_entre_clients(self, monkeypatch):
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "2")
+        transport, chamadas = _transport([httpx.Response(503)])
+
+        primeiro = TestBaseHTTPClient()._client(transport)
+        segundo = TestBaseHTTPClient()._client(transport)
+
+        assert primeiro.get("https://api.test/selic") is None
+        assert obter_circuit_breaker("api.test").estado == "OPEN"
+
+        # Circuito aberto: falha imediata, sem nova requisição
+        assert segundo.get("https://api.test/outra") is None
+        assert len(chamadas) == 2
+
+    def test_erro_4xx_nao_abre_circuito(self, monkeypatch):
+        monkeypatch.setenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "1")
+        transport, _ = _transport([httpx.Response(404)])
+
+        TestBaseHTTPClient()._client(transport).get("https://api.test/selic")
+
+        assert obter_circuit_breaker("api.test").estado == "CLOSED"
+
+
+class FakeContext:
+    def __init__(self, restante_ms):
+        self.restante_ms = restante_ms
+
+    def get_remaining_time_in_millis(self):
+        return self.restante_ms
+
+
+class TestRetryComPrazo:
+    """Testes do retry com backoff e prazo da requisição."""
+
+    def test_deadline_do_contexto_lambda(self, monkeypatch):
+        monkeypatch.setenv("DEADLINE_SAFETY_MARGIN_MS", "1000")
+
+        deadline = Deadline.do_contexto_lambda(FakeContext(5000))
+
+        assert 3.9 < deadline.restante() <= 4.0
+
+    def test_deadline_sem_contexto(self):
+        assert Deadline.do_contexto_lambda(None) is None
+        assert Deadline.do_contexto_lambda(object()) is None
+
+    def test_backoff_exponencial_limitado(self):
+        policy = RetryPolicy(max_tentativas=5, backoff_base=0.1, backoff_max=0.3)
+
+        for tentativa, teto in [(1, 0.1), (2, 0.2), (3, 0.3), (4, 0.3)]:
+            esperas = [policy.espera(tentativa) for _ in range(50)]
+            assert all(0 <= espera <= teto for espera in esperas)
+
+    def test_timeout_limitado_pelo_prazo(self):
+        policy = RetryPolicy(tempo_minimo_tentativa=0.25)
+
+        assert policy.timeout_tentativa(3, None) == 3
+        assert policy.timeout_tentativa(3, Deadline(1.0)) <= 1.0
+        assert policy.timeout_tentativa(3, Deadline(0.1)) is None
+
+    def test_prazo_esgotado_nao_envia_requisicao(self):
+        transport, chamadas = _transport([httpx.Response(200, json={"ok": True})])
+
+        resultado = (
+            TestBaseHTTPClient()
+            ._client(transport)
+            .get("https://api.test/selic", deadline=Deadline(0))
+        )
+
+        assert resultado is None
+        assert chamadas == []
+
+    def test_sem_retry_quando_espera_ultrapassa_prazo(self, monkeypatch):
+        transport, chamadas = _transport(
+            [httpx.Response(503), httpx.Response(200, json={"ok": True})]
+        )
+        monkeypatch.setattr(RetryPolicy, "espera", lambda self, tentativa: 10)
+        client = TestBaseHTTPClient()._client(transport, max_retries=3)
+
+        resultado = client.get("https://api.test/selic", deadline=Deadline(2))
+
+        assert resultado is None
+        assert len(chamadas) == 1
+
+    def test_tentativas_vem_da_politica(self):
+        transport, chamadas = _transport([httpx.Response(503)])
+        client = TestBaseHTTPClient()._client(
+            transport, max_retries=5, retry_policy=RetryPolicy(max_tentativas=1, backoff_base=0)
+        )
+
+        assert client.get("https://api.test/selic") is None
+        assert client.max_retries == 1
+        assert len(chamadas) == 1
+
+
+class TestResponseCache:
+    """Testes do cache de respostas HTTP."""
+
+    def _cache(self, clock, **kwargs) -> ResponseCache:
+        return ResponseCache(ttl_minimo=kwargs.pop("ttl_minimo", {}), clock=clock, **kwargs)
+
+    def _get(self, transport, cache, url="https://api.test/selic", params=None):
+        return TestBaseHTTPClient()._client(transport, cache=cache).get(url, params=params)
+
+    def test_max_age_evita_nova_requisicao(self, clock):
+        cache = self._cache(clock)
+        transport, chamadas = _transport(
+            [httpx.Response(200, json={"v": 1}, headers={"Cache-Control": "max-age=60"})]
+        )
+
+        assert self._get(transport, cache) == {"v": 1}
+        clock.agora = 59
+        assert self._get(transport, cache) == {"v": 1}
+        assert len(chamadas) == 1
+
+        clock.agora = 61
+        self._get(transport, cache)
+        assert len(chamadas) == 2
+
+    def test_chave_inclui_parametros(self, clock):
+        cache = self._cache(clock)
+        transport, chamadas = _transport(
+            [httpx.Response(200, json={}, headers={"Cache-Control": "max-age=60"})]
+        )
+
+        self._get(transport, cache, params={"b": 2, "a": 1})
+        self._get(transport, cache, params={"a": 1, "b": 2})
+        self._get(transport, cache, params={"a": 2})
+
+        assert len(chamadas) == 2
+
+    def test_revalidacao_com_etag(self, clock):
+        cache = self._cache(clock)
+        transport, chamadas = _transport(
+            [
+                httpx.Response(
+                    200, json={"v": 1}, headers={"ETag": '"abc"', "Cache-Control": "no-cache"}
+                ),
+                httpx.Response(304, headers={"Cache-Control": "max-age=30"}),
+            ]
+        )
+
+        assert self._get(transport, cache) == {"v": 1}
+        assert self._get(transport, cache) == {"v": 1}
+        assert chamadas[1].headers["If-None-Match"] == '"abc"'
+
+        # 304 renovou a entrada por 30s
+        assert self._get(transport, cache) == {"v": 1}
+        assert len(chamadas) == 2
+
+    def test_last_modified_enviado(self, clock):
+        cache = self._cache(clock)
+        data = "Tue, 06 Jan 2026 10:00:00 GMT"
+        transport, chamadas = _transport(
+            [httpx.Response(200, json={}, headers={"Last-Modified": data}), httpx.Response(304)]
+        )
+
+        self._get(transport, cache)
+        self._get(transport, cache)
+
+        assert chamadas[1].headers["If-Modified-Since"] == data
+
+    def test_no_store_nao_cacheia(self, clock):
+        cache = self._cache(clock, ttl_minimo={"https://api.test/": 3600})
+        transport, chamadas = _transport(
+            [httpx.Response(200, json={}, headers={"Cache-Control": "no-store"})]
+        )
+
+        self._get(transport, cache)
+        self._get(transport, cache)
+
+        assert len(chamadas) == 2
+
+    def test_ttl_minimo_por_url(self, clock):
+        cache = self._cache(clock, ttl_minimo={"https://api.bcb.gov.br/dados/serie/": 3600})
+        transport, chamadas = _transport([httpx.Response(200, json=[{"valor": "11.75"}])])
+        url = "https://api.bcb.gov.br/dados/serie/bcdata.sgs.432/dados/ultimos/1"
+
+        self._get(transport, cache, url=url)
+        clock.agora = 3599
+        self._get(transport, cache, url=url)
+
+        assert len(chamadas) == 1
+
+    def test_cache_negativo_para_4xx(self, clock):
+        cache = self._cache(clock, ttl_negativo=60)
+        transport, chamadas = _transport([httpx.Response(404)])
+
+        assert self._get(transport, cache) is None
+        assert self._get(transport, cache) is None
+        assert len(chamadas) == 1
+
+        clock.agora = 61
+        self._get(transport, cache)
+        assert len(chamadas) == 2
+
+    def test_persistencia_em_disco(self, clock, tmp_path):
+        transport, chamadas = _transport(
+            [httpx.Response(200, json={"v": 1}, headers={"Cache-Control": "max-age=60"})]
+        )
+
+        self._get(transport, self._cache(clock, diretorio=str(tmp_path)))
+        outro_processo = self._cache(clock, diretorio=str(tmp_path))
+
+        assert self._get(transport, outro_processo) == {"v": 1}
+        assert len(chamadas) == 1
@@ -0,0 +1,79 @@
+import json
+from decimal import Decimal
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.services.dynamodb_service import DynamoDBService, _para_decimal
+
+TABELA = "financing-simulations-test"
+
+
+@pytest.fixture
+def db_service(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("DYNAMODB_TABLE", TABELA)
+
+    with mock_aws():
+        boto3.client("dynamodb").create_table(
+            TableName=TABELA,
+            AttributeDefinitions=[
+                {"AttributeName": "simulation_id", "AttributeType": "S"},
+                {"AttributeName": "created_at", "AttributeType": "S"},
+            ],
+            KeySchema=[
+                {"AttributeName": "simulation_id", "KeyType": "HASH"},
+                {"AttributeName": "created_at", "KeyType": "RANGE"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield DynamoDBService()
+
+
+class TestSaveSimulations:
+    def test_grava_lote_maior_que_25_itens(self, db_service):
+        dados = [{"resultado": {"parcela_mensal": 1000.0 + i}} for i in range(60)]
+
+        salvos = db_service.save_simulations(dados, user_identifier="parceiro")
+
+        assert len(salvos) == 60
+        assert len({s["simulation_id"] for s in salvos}) == 60
+
+        item = db_service.get_simulation(salvos[59]["simulation_id"], salvos[59]["created_at"])
+        assert item["resultado"]["parcela_mensal"] == 1059.0
+        assert item["user_identifier"] == "parceiro"
+
+
+class TestConversaoDecimal:
+    @pytest.mark.parametrize(
+        "valor, esperado",
+        [
+            (3512.47, "3512.47"),
+            (0.1 + 0.2, "0.30000000000000004"),
+            (0.8368, "0.8368"),
+            (1636632.0, "1636632.00"),
+            (-12.5, "-12.50"),
+        ],
+    )
+    def test_para_decimal(self, valor, esperado):
+        assert _para_decimal(valor) == Decimal(esperado)
+
+    def test_valores_em_centavos_voltam_iguais(self, db_service):
+        dados = {"resultado": {"total_pago": 1636658.83, "parcelas": [3409.65, 3436.48, 0.01]}}
+
+        salvo = db_service.save_simulation(dados)
+        item = db_service.get_simulation(salvo["simulation_id"], salvo["created_at"])
+
+        assert item["resultado"] == dados["resultado"]
+
+    def test_json_codificado_gravado_como_o_dict(self, db_service):
+        dados = {"request_id": "r-1", "resultado": {"total_pago": 1636658.83, "taxa": 0.1 + 0.2}}
+
+        salvo = db_service.save_simulation(json.dumps(dados))
+        item = db_service.get_simulation(salvo["simulation_id"], salvo["created_at"])
+
+        assert item["request_id"] == "r-1"
+        assert item["resultado"] == dados["resultado"]
@@ -0,0 +1,449 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.models.domain import Indicador
+from src.models.requests import (
+    CapacidadeRequest,
+    ComparacaoRequest,
+    GridRequest,
+    MonteCarloRequest,
+    PrazoRequest,
+    SimulationRequest,
+)
+from src.services import FinancingService
+from src.services.financing_service import get_financing_service, reset_financing_service
+from src.services.indicator_service import get_indicator_cache
+from src.services.simulation_cache import get_simulation_cache
+from src.utils.exceptions import BusinessException, ExternalServiceException
+
+pytestmark = pytest.mark.usefixtures("busca_sequencial", "limpar_cache")
+
+
+@pytest.fixture
+def selic():
+    return Indicador(
+        tipo="SELIC", valor=11.75, fonte="Banco Central do Brasil", data_referencia="2026-01-06"
+    )
+
+
+@pytest.fixture
+def request_price():
+    return SimulationRequest(
+        valor_imovel=500000,
+        entrada=100000,
+        prazo_meses=360,
+        tipo_amortizacao="PRICE",
+        regiao="SP",
+    )
+
+
+class TestSnapshotTaxa:
+    """Testes do snapshot de taxa por requisição."""
+
+    def test_indicador_buscado_uma_vez_por_simulacao(self, selic, request_price):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic
+        ) as buscar_selic:
+            service = FinancingService()
+            service.simular(request_price)
+            service.close()
+
+        assert buscar_selic.call_count == 1
+
+    def test_resposta_carrega_snapshot(self, selic, request_price):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            response = service.simular(request_price)
+            service.close()
+
+        taxas = response.taxas
+        assert taxas.snapshot_id
+        assert taxas.obtido_em
+        assert taxas.indicador.indicador_usado == "SELIC"
+
+        dump = response.model_dump(mode="json")
+        assert dump["taxas"]["snapshot_id"] == taxas.snapshot_id
+
+    def test_snapshot_imutavel(self, selic):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            snapshot = service.indicator_service.criar_snapshot()
+            service.close()
+
+        assert snapshot.indicador is snapshot.taxa.indicador
+
+        with pytest.raises(AttributeError):
+            snapshot.snapshot_id = "outro"
+
+
+class TestServicoCompartilhado:
+    """Testes da instância reaproveitada entre invocações."""
+
+    @pytest.fixture(autouse=True)
+    def resetar_servico(self):
+        reset_financing_service()
+        yield
+        reset_financing_service()
+
+    def test_instancia_unica(self):
+        assert get_financing_service() is get_financing_service()
+
+    def test_handler_reaproveita_conexoes(self, selic, request_price):
+        from src.handlers.financing_handler import handler
+
+        event = {"body": request_price.model_dump_json()}
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            handler(event, None)
+            service = get_financing_service()
+            handler(event, None)
+
+        assert get_financing_service() is service
+        assert not service.indicator_service.bacen_client.http_client.client.is_closed
+
+    def test_reset_fecha_clients(self):
+        service = get_financing_service()
+        http_client = service.indicator_service.bacen_client.http_client.client
+
+        reset_financing_service()
+
+        assert http_client.is_closed
+        assert get_financing_service() is not service
+
+
+class TestCacheDeSimulacoes:
+    """Testes do corpo de resposta memorizado por requisição e snapshot."""
+
+    def test_cotacao_repetida_nao_recalcula(self, selic, request_price):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            with patch.object(
+                service, "_calcular_financiamento", wraps=service._calcular_financiamento
+            ) as calcular:
+                primeiro = service.simular_serializado(request_price)
+                segundo = service.simular_serializado(
+                    request_price.model_copy(update={"valor_imovel": 500000.001})
+                )
+            service.close()
+
+        primeiro, segundo = json.loads(primeiro), json.loads(segundo)
+        for corpo in (primeiro, segundo):
+            del corpo["taxas"]["snapshot_id"], corpo["taxas"]["obtido_em"]
+
+        assert primeiro == segundo
+        assert calcular.call_count == 1
+        assert get_simulation_cache().stats()["hit_ratio"] == 0.5
+
+    def test_acerto_informa_o_snapshot_da_requisicao(self, selic, request_price):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            service.simular_serializado(request_price)
+
+            snapshot = service.indicator_service.criar_snapshot()
+            with patch.object(service.indicator_service, "criar_snapshot", return_value=snapshot):
+                corpo = json.loads(service.simular_serializado(request_price))
+            service.close()
+
+        assert get_simulation_cache().stats()["hits"] == 1
+        assert corpo["taxas"]["snapshot_id"] == snapshot.snapshot_id
+        assert corpo["taxas"]["obtido_em"] == snapshot.obtido_em
+
+    def test_corpo_igual_ao_da_simulacao(self, selic, request_price):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            corpo = json.loads(service.simular_serializado(request_price))
+            response = service.simular(request_price).model_dump(mode="json")
+            service.close()
+
+        assert "request_id" not in corpo and "timestamp" not in corpo
+        assert corpo["resultado"] == response["resultado"]
+        assert corpo["tabela_amortizacao_resumida"] == response["tabela_amortizacao_resumida"]
+
+    def test_indicador_novo_invalida_o_cache(self, selic, request_price):
+        nova_selic = Indicador(
+            tipo="SELIC", valor=10.5, fonte="Banco Central do Brasil", data_referencia="2026-01-07"
+        )
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            antes = json.loads(service.simular_serializado(request_price))
+
+        get_indicator_cache().clear()
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=nova_selic):
+            depois = json.loads(service.simular_serializado(request_price))
+            service.close()
+
+        assert depois["resultado"]["parcela_mensal"] < antes["resultado"]["parcela_mensal"]
+        assert get_simulation_cache().invalidacoes == 1
+        assert len(get_simulation_cache().cache) == 1
+
+
+class TestSimulacaoEmLote:
+    """Testes do lote de simulações com snapshot único."""
+
+    @pytest.fixture
+    def requests_mistos(self, request_price):
+        return [
+            request_price,
+            request_price.model_copy(update={"tipo_amortizacao": "SAC", "prazo_meses": 240}),
+            request_price.model_copy(update={"entrada": 250000, "prazo_meses": 120}),
+        ]
+
+    def test_lote_igual_a_simulacoes_individuais(self, selic, requests_mistos):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            snapshot, respostas = service.simular_lote(requests_mistos)
+            individuais = [service.simular(request) for request in requests_mistos]
+            service.close()
+
+        assert len(respostas) == len(requests_mistos)
+
+        for lote, individual in zip(respostas, individuais, strict=True):
+            assert lote.taxas.snapshot_id == snapshot.snapshot_id
+            assert lote.simulacao == individual.simulacao
+            assert lote.resultado == individual.resultado
+            assert lote.tabela_amortizacao_resumida == individual.tabela_amortizacao_resumida
+
+    def test_lote_em_centavos_igual_a_simulacoes_individuais(
+        self, selic, requests_mistos, monkeypatch
+    ):
+        monkeypatch.setenv("CALCULATOR_BACKEND", "centavos")
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            _, respostas = service.simular_lote(requests_mistos)
+            individuais = [service.simular(request) for request in requests_mistos]
+            service.close()
+
+        for lote, individual in zip(respostas, individuais, strict=True):
+            assert lote.resultado == individual.resultado
+            assert lote.tabela_amortizacao_resumida[-1].saldo_devedor == 0.0
+
+    def test_indicador_buscado_uma_vez_por_lote(self, selic, requests_mistos):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic
+        ) as buscar_selic:
+            service = FinancingService()
+            service.simular_lote(requests_mistos * 10)
+            service.close()
+
+        assert buscar_selic.call_count == 1
+
+
+class TestGradeDeSimulacoes:
+    def test_grade_igual_a_simulacoes_individuais(self, selic, request_price):
+        grid = GridRequest(
+            valor_imovel=500000, entradas=[50000, 100000], prazos_meses=[120, 360], regiao="SP"
+        )
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            resposta = service.simular_grade(grid)
+
+            for tipo in ("PRICE", "SAC"):
+                for i, entrada in enumerate(grid.entradas):
+                    for j, prazo in enumerate(grid.prazos_meses):
+                        individual = service.simular(
+                            request_price.model_copy(
+                                update={
+                                    "entrada": entrada,
+                                    "prazo_meses": prazo,
+                                    "tipo_amortizacao": tipo,
+                                }
+                            )
+                        )
+                        grade = resposta.grades[tipo]
+
+                        assert grade.parcela_mensal[i][j] == individual.resultado.parcela_mensal
+                        assert grade.total_pago[i][j] == individual.resultado.total_pago
+                        assert grade.juros_totais[i][j] == individual.resultado.juros_totais
+            service.close()
+
+    def test_grade_valida_entradas(self):
+        with pytest.raises(ValueError):
+            GridRequest(valor_imovel=500000, entradas=[600000], prazos_meses=[120], regiao="SP")
+
+        with pytest.raises(ValueError):
+            GridRequest(valor_imovel=500000, entradas=[0], prazos_meses=[6], regiao="SP")
+
+
+class TestComparacaoPRICEvsSAC:
+    @pytest.fixture
+    def comparacao_request(self):
+        return ComparacaoRequest(
+            valor_imovel=500000, entrada=100000, prazo_meses=360, regiao="SP"
+        )
+
+    def test_um_snapshot_para_os_dois_sistemas(self, selic, comparacao_request):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic
+        ) as buscar_selic:
+            service = FinancingService()
+            resposta = service.comparar(comparacao_request)
+            service.close()
+
+        assert buscar_selic.call_count == 1
+        assert resposta.price.taxas.snapshot_id == resposta.sac.taxas.snapshot_id
+        assert resposta.price.simulacao.tipo_amortizacao == "PRICE"
+        assert resposta.sac.simulacao.tipo_amortizacao == "SAC"
+
+    def test_diferencas(self, selic, comparacao_request):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            resposta = service.comparar(comparacao_request)
+            service.close()
+
+        comparacao = resposta.comparacao
+
+        assert comparacao.sistema_menor_custo == "SAC"
+        assert comparacao.diferenca_juros_totais == pytest.approx(
+            resposta.price.resultado.juros_totais - resposta.sac.resultado.juros_totais,
+            abs=0.01,
+        )
+        assert comparacao.diferenca_primeira_parcela > 0
+        assert 1 < comparacao.mes_cruzamento < 360
+
+
+class TestCapacidadeDeFinanciamento:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_parcela_cabe_na_renda(self, selic, tipo):
+        request = CapacidadeRequest(
+            renda_mensal=12000, entrada=80000, prazo_meses=360, tipo_amortizacao=tipo, regiao="SP"
+        )
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            resposta = service.calcular_capacidade(request)
+            service.close()
+
+        assert resposta.parcela_maxima == 3600.0
+        assert resposta.valor_imovel_maximo == pytest.approx(
+            resposta.valor_financiado_maximo + 80000, abs=0.01
+        )
+        assert resposta.simulacao.simulacao.valor_financiado == pytest.approx(
+            resposta.valor_financiado_maximo, abs=0.01
+        )
+        # Parcela no limite, sem ultrapassá-lo
+        assert 3599.9 <= resposta.simulacao.resultado.parcela_mensal <= 3600.0
+
+    def test_renda_alem_dos_limites(self, selic):
+        request = CapacidadeRequest(
+            renda_mensal=1e9, prazo_meses=360, tipo_amortizacao="PRICE", regiao="SP"
+        )
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            with pytest.raises(BusinessException):
+                service.calcular_capacidade(request)
+            service.close()
+
+
+class TestPrazoMinimo:
+    @pytest.mark.parametrize("tipo", ["PRICE", "SAC"])
+    def test_prazo_minimo_atende_a_parcela(self, selic, tipo):
+        request = PrazoRequest(
+            valor_imovel=500000,
+            entrada=100000,
+            parcela_maxima=4500,
+            tipo_amortizacao=tipo,
+            regiao="SP",
+        )
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            resposta = service.calcular_prazo_minimo(request)
+            um_mes_antes = service.simular(
+                SimulationRequest(
+                    valor_imovel=500000,
+                    entrada=100000,
+                    prazo_meses=resposta.prazo_minimo - 1,
+                    tipo_amortizacao=tipo,
+                    regiao="SP",
+                )
+            )
+            service.close()
+
+        assert resposta.simulacao.simulacao.prazo_meses == resposta.prazo_minimo
+        assert resposta.simulacao.resultado.parcela_mensal <= 4500
+        assert um_mes_antes.resultado.parcela_mensal > 4500
+
+    def test_parcela_insuficiente(self, selic):
+        request = PrazoRequest(
+            valor_imovel=500000,
+            entrada=100000,
+            parcela_maxima=1000,
+            tipo_amortizacao="PRICE",
+            regiao="SP",
+        )
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic):
+            service = FinancingService()
+            with pytest.raises(BusinessException, match="Parcela máxima insuficiente"):
+                service.calcular_prazo_minimo(request)
+            service.close()
+
+
+class TestSimulacaoDeCenarios:
+    HISTORICO = [0.42, 0.38, 0.51, 0.33, 0.29, 0.45, 0.61, 0.48, 0.26, 0.31, 0.44, 0.52] * 5
+
+    @pytest.fixture
+    def cenarios_request(self):
+        return MonteCarloRequest(
+            valor_imovel=500000,
+            entrada=100000,
+            prazo_meses=360,
+            tipo_amortizacao="PRICE",
+            regiao="SP",
+            indexador="IPCA",
+            num_trajetorias=3000,
+            semente=42,
+        )
+
+    def test_percentis_ordenados_e_reprodutiveis(self, selic, cenarios_request, monkeypatch):
+        monkeypatch.setenv("MONTE_CARLO_BLOCK_SIZE", "1000")
+
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic
+        ), patch(
+            "src.clients.bacen_client.BacenClient.buscar_historico", return_value=self.HISTORICO
+        ) as buscar_historico:
+            service = FinancingService()
+            resposta = service.simular_cenarios(cenarios_request)
+            repetida = service.simular_cenarios(cenarios_request)
+            service.close()
+
+        # Série histórica buscada uma vez e reaproveitada do cache
+        buscar_historico.assert_called_once()
+
+        for percentis in (resposta.total_pago, resposta.parcela_maxima):
+            assert percentis.p5 <= percentis.p25 <= percentis.p50 <= percentis.p75 <= percentis.p95
+
+        assert resposta.total_pago == repetida.total_pago
+        assert resposta.calibracao.observacoes == len(self.HISTORICO)
+
+        # Correção positiva: paga-se mais do que na tabela sem correção
+        campos = set(SimulationRequest.model_fields)
+        sem_correcao = service.simular(
+            SimulationRequest(**cenarios_request.model_dump(include=campos))
+        )
+        assert resposta.total_pago.p5 > sem_correcao.resultado.total_pago
+
+    def test_serie_historica_indisponivel(self, selic, cenarios_request):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic
+        ), patch("src.clients.bacen_client.BacenClient.buscar_historico", return_value=None):
+            service = FinancingService()
+            with pytest.raises(ExternalServiceException):
+                service.simular_cenarios(cenarios_request)
+            service.close()
+
+    def test_serie_historica_curta(self, selic, cenarios_request):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=selic
+        ), patch("src.clients.bacen_client.BacenClient.buscar_historico", return_value=[0.4] * 6):
+            service = FinancingService()
+            with pytest.raises(BusinessException):
+                service.simular_cenarios(cenarios_request)
+            service.close()
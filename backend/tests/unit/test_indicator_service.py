@@ -0,0 +1,121 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.models.domain import Indicador
+from src.services.indicator_service import IndicatorService, get_indicator_cache
+
+SELIC = Indicador(
+    tipo="SELIC", valor=11.75, fonte="Banco Central do Brasil", data_referencia="2026-01-06"
+)
+IPCA = Indicador(tipo="IPCA", valor=0.52, fonte="IBGE", data_referencia="2026-01-01")
+
+
+@pytest.fixture(autouse=True)
+def limpar_cache(monkeypatch):
+    monkeypatch.setenv("INDICATOR_FETCH_CONCURRENT", "true")
+    monkeypatch.setenv("INDICATOR_FETCH_DEADLINE", "0.5")
+    get_indicator_cache().clear()
+    yield
+    get_indicator_cache().clear()
+
+
+def _resposta_lenta(indicador, segundos):
+    async def buscar(self, client, deadline=None):
+        await asyncio.sleep(segundos)
+        return indicador
+
+    return buscar
+
+
+class TestBuscaParalela:
+    """Testes da busca paralela de SELIC e IPCA."""
+
+    def test_selic_tem_prioridade(self):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic_async",
+            _resposta_lenta(SELIC, 0.1),
+        ), patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca_async", _resposta_lenta(IPCA, 0.01)
+        ):
+            indicador = IndicatorService(store=None).buscar_indicador_com_fallback()
+
+        assert indicador.tipo == "SELIC"
+
+    def test_fallback_custa_o_maximo_das_latencias(self):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic_async",
+            _resposta_lenta(None, 0.2),
+        ), patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca_async", _resposta_lenta(IPCA, 0.2)
+        ), patch("src.clients.ibge_client.IBGEClient.buscar_ipca") as buscar_ipca_sync:
+            service = IndicatorService(store=None)
+            inicio = time.perf_counter()
+            indicador = service.buscar_indicador_com_fallback()
+            duracao = time.perf_counter() - inicio
+
+        assert indicador.tipo == "IPCA"
+        assert duracao < 0.35
+        buscar_ipca_sync.assert_not_called()
+
+    def test_prazo_total_respeitado(self):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic_async",
+            _resposta_lenta(SELIC, 5),
+        ), patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca_async", _resposta_lenta(IPCA, 5)
+        ):
+            service = IndicatorService(store=None)
+            inicio = time.perf_counter()
+            indicador = service.buscar_indicador_com_fallback()
+            duracao = time.perf_counter() - inicio
+
+        assert indicador.tipo == "TAXA_BASE"
+        assert duracao < 1.0
+
+    def test_ipca_obtido_em_paralelo_e_cacheado(self):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic_async",
+            _resposta_lenta(None, 0.01),
+        ), patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca_async", _resposta_lenta(IPCA, 0.01)
+        ):
+            IndicatorService(store=None).buscar_indicador_com_fallback()
+
+        assert get_indicator_cache().get("IPCA") == IPCA
+
+    def test_cliente_async_reaproveitado_entre_buscas(self):
+        clientes = []
+
+        async def buscar(self, client, deadline=None):
+            clientes.append(client)
+            return SELIC
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic_async", buscar), patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca_async", _resposta_lenta(IPCA, 0.01)
+        ):
+            service = IndicatorService(store=None)
+            service.buscar_indicador_com_fallback()
+            get_indicator_cache().clear()
+            service.buscar_indicador_com_fallback()
+
+        assert len(clientes) == 2
+        assert clientes[0] is clientes[1]
+        assert not clientes[0].is_closed
+
+        service.close()
+        assert clientes[0].is_closed
+
+    def test_sequencial_dentro_de_event_loop(self):
+        async def executar():
+            return IndicatorService(store=None).buscar_indicador_com_fallback()
+
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=SELIC
+        ) as buscar_selic:
+            indicador = asyncio.run(executar())
+
+        assert indicador.tipo == "SELIC"
+        buscar_selic.assert_called_once()
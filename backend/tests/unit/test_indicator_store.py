@@ -0,0 +1,235 @@
+from unittest.mock import Mock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.models.domain import Indicador
+from src.services.indicator_service import IndicatorService, get_indicator_cache
+from src.services.indicator_store import IndicatorStore
+from src.utils.cache import TTLCache
+from src.utils.exceptions import ExternalServiceException
+
+TABELA = "financing-indicators-test"
+
+
+@pytest.fixture
+def store(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+
+    with mock_aws():
+        boto3.client("dynamodb").create_table(
+            TableName=TABELA,
+            AttributeDefinitions=[{"AttributeName": "indicador", "AttributeType": "S"}],
+            KeySchema=[{"AttributeName": "indicador", "KeyType": "HASH"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield IndicatorStore(table_name=TABELA)
+
+
+pytestmark = pytest.mark.usefixtures("busca_sequencial", "limpar_cache")
+
+
+def _selic(valor: float = 11.75) -> Indicador:
+    return Indicador(
+        tipo="SELIC", valor=valor, fonte="Banco Central do Brasil", data_referencia="2026-01-06"
+    )
+
+
+def _envelhecer(store: IndicatorStore, tipo: str, segundos: float) -> None:
+    registro = store.obter(tipo)
+    store.table.update_item(
+        Key={"indicador": tipo},
+        UpdateExpression="SET atualizado_em = :t",
+        ExpressionAttributeValues={":t": int(registro.atualizado_em - segundos)},
+    )
+
+
+class TestIndicatorStore:
+    """Testes do store compartilhado de indicadores."""
+
+    def test_salvar_e_obter(self, store):
+        store.salvar(_selic())
+
+        registro = store.obter("SELIC")
+
+        assert registro.indicador == _selic()
+        assert registro.idade() < 5
+
+    def test_obter_inexistente(self, store):
+        assert store.obter("IPCA") is None
+
+    def test_lease_exclusivo(self, store):
+        store.salvar(_selic())
+
+        assert store.adquirir_refresh("SELIC", lease_seconds=30) is True
+        assert store.adquirir_refresh("SELIC", lease_seconds=30) is False
+
+    def test_salvar_libera_lease(self, store):
+        store.salvar(_selic())
+        store.adquirir_refresh("SELIC", lease_seconds=30)
+
+        store.salvar(_selic(12.0))
+
+        assert store.adquirir_refresh("SELIC", lease_seconds=30) is True
+
+
+class TestIndicatorServiceComStore:
+    """Testes da estratégia stale-while-revalidate do IndicatorService."""
+
+    def test_valor_fresco_evita_api_externa(self, store):
+        store.salvar(_selic())
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic") as buscar_selic:
+            indicador = IndicatorService(store=store).buscar_indicador_com_fallback()
+
+        assert indicador.valor == 11.75
+        buscar_selic.assert_not_called()
+
+    def test_api_externa_grava_no_store(self, store):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic()):
+            IndicatorService(store=store).buscar_indicador_com_fallback()
+
+        assert store.obter("SELIC").indicador.valor == 11.75
+
+    def test_cache_local_expira_com_o_registro_do_store(self, store, clock, monkeypatch):
+        cache = TTLCache(ttl_seconds=3600, clock=clock)
+        monkeypatch.setattr("src.services.indicator_service._indicator_cache", cache)
+        store.salvar(_selic())
+        _envelhecer(store, "SELIC", 3000)
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic") as buscar_selic:
+            IndicatorService(store=store).buscar_indicador_com_fallback()
+
+        buscar_selic.assert_not_called()
+        clock.agora = 590
+        assert cache.get("SELIC") is not None
+        clock.agora = 601
+        assert cache.get("SELIC") is None
+
+    def test_valor_desatualizado_servido_durante_revalidacao(self, store):
+        store.salvar(_selic())
+        _envelhecer(store, "SELIC", 7200)
+        store.adquirir_refresh("SELIC", lease_seconds=30)
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic") as buscar_selic:
+            indicador = IndicatorService(store=store).buscar_indicador_com_fallback()
+
+        assert indicador.tipo == "SELIC"
+        buscar_selic.assert_not_called()
+
+    def test_valor_desatualizado_e_revalidado(self, store):
+        store.salvar(_selic())
+        _envelhecer(store, "SELIC", 7200)
+
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic(12.25)
+        ):
+            indicador = IndicatorService(store=store).buscar_indicador_com_fallback()
+
+        assert indicador.valor == 12.25
+        assert store.obter("SELIC").idade() < 5
+
+    def test_ultimo_valor_conhecido_durante_indisponibilidade(self, store):
+        store.salvar(_selic())
+        _envelhecer(store, "SELIC", 86400 * 3)
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=None), patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca", return_value=None
+        ):
+            indicador = IndicatorService(store=store).buscar_indicador_com_fallback()
+
+        assert indicador.tipo == "SELIC"
+        assert indicador.valor == 11.75
+
+
+class TestSnapshotPublicado:
+    """Testes do snapshot publicado pela função de prefetch."""
+
+    def test_publicacao_incrementa_versao(self, store):
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic()
+        ), patch("src.clients.ibge_client.IBGEClient.buscar_ipca", return_value=None):
+            service = IndicatorService(store=store)
+            primeiro = service.publicar_snapshot()
+            segundo = service.publicar_snapshot()
+
+        assert primeiro.versao == 1
+        assert segundo.versao == 2
+        assert store.obter_snapshot()[0].snapshot_id == segundo.snapshot_id
+
+    def test_simulacao_usa_snapshot_sem_api_externa(self, store):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic()):
+            publicado = IndicatorService(store=store).publicar_snapshot()
+
+        get_indicator_cache().clear()
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic") as buscar_selic, patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca"
+        ) as buscar_ipca:
+            snapshot = IndicatorService(store=store).criar_snapshot()
+
+        assert snapshot == publicado
+        buscar_selic.assert_not_called()
+        buscar_ipca.assert_not_called()
+
+    def test_snapshot_muito_antigo_e_ignorado(self, store, monkeypatch):
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic()):
+            publicado = IndicatorService(store=store).publicar_snapshot()
+
+        get_indicator_cache().clear()
+        monkeypatch.setenv("INDICATOR_SNAPSHOT_MAX_AGE", "-1")
+
+        with patch("src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic()):
+            snapshot = IndicatorService(store=store).criar_snapshot()
+
+        assert snapshot.snapshot_id != publicado.snapshot_id
+        assert snapshot.versao is None
+
+    def test_handler_prefetch(self, store, monkeypatch):
+        from src.handlers.indicator_prefetch_handler import handler
+
+        monkeypatch.setattr("src.services.indicator_store._store", store)
+
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic()
+        ), patch("src.clients.ibge_client.IBGEClient.buscar_ipca", return_value=None):
+            resultado = handler({}, None)
+
+        assert resultado["status"] == "ok"
+        assert resultado["versao"] == 1
+        assert resultado["indicador"] == "SELIC"
+
+    def test_handler_prefetch_respeita_tempo_da_invocacao(self, store, monkeypatch):
+        from src.handlers.indicator_prefetch_handler import handler
+
+        monkeypatch.setattr("src.services.indicator_store._store", store)
+        context = Mock()
+        context.get_remaining_time_in_millis.return_value = 15000
+
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=_selic()
+        ) as buscar_selic, patch(
+            "src.clients.ibge_client.IBGEClient.buscar_ipca", return_value=None
+        ) as buscar_ipca:
+            handler({}, context)
+
+        for busca in (buscar_selic, buscar_ipca):
+            deadline = busca.call_args.kwargs["deadline"]
+            assert 13 < deadline.restante() <= 14
+
+    def test_handler_prefetch_sem_indicador_falha(self, store, monkeypatch):
+        from src.handlers.indicator_prefetch_handler import handler
+
+        monkeypatch.setattr("src.services.indicator_store._store", store)
+
+        with patch(
+            "src.clients.bacen_client.BacenClient.buscar_selic", return_value=None
+        ), patch("src.clients.ibge_client.IBGEClient.buscar_ipca", return_value=None):
+            with pytest.raises(ExternalServiceException):
+                handler({}, None)
+
+        # A taxa base padrão não vira snapshot publicado
+        assert store.obter_snapshot() is None
@@ -1,7 +1,13 @@
 import pytest
 from pydantic import ValidationError
 
-from src.models.requests import SimulationRequest
+from src.models.domain import Parcela, TabelaAmortizacao, arredondar_centavos
+from src.models.requests import (
+    CapacidadeRequest,
+    GridRequest,
+    PrazoRequest,
+    SimulationRequest,
+)
 
 
 class TestSimulationRequest:
@@ -207,3 +213,101 @@ class TestSimulationRequest:
         )
 
         assert request.tipo_amortizacao == "SAC"
+
+
+class TestCamposComuns:
+    """Requisições que herdam os campos e validadores de DadosRegiao e derivados."""
+
+    REQUISICOES = [
+        (GridRequest, {"valor_imovel": 500000, "entradas": [100000], "prazos_meses": [360]}),
+        (CapacidadeRequest, {"renda_mensal": 15000, "prazo_meses": 360, "tipo_amortizacao": "SAC"}),
+        (
+            PrazoRequest,
+            {
+                "valor_imovel": 500000,
+                "entrada": 100000,
+                "parcela_maxima": 4000,
+                "tipo_amortizacao": "PRICE",
+            },
+        ),
+    ]
+
+    @pytest.mark.parametrize("modelo,campos", REQUISICOES)
+    def test_regiao_em_maiusculas(self, modelo, campos):
+        assert modelo(**campos, regiao="sp").regiao == "SP"
+
+    @pytest.mark.parametrize("modelo,campos", REQUISICOES)
+    def test_regiao_invalida(self, modelo, campos):
+        with pytest.raises(ValidationError, match="inválida"):
+            modelo(**campos, regiao="XX")
+
+    def test_prazo_com_entrada_maior_que_imovel(self):
+        with pytest.raises(ValidationError, match="Entrada deve ser menor"):
+            PrazoRequest(
+                valor_imovel=500000,
+                entrada=500000,
+                parcela_maxima=4000,
+                tipo_amortizacao="PRICE",
+                regiao="SP",
+            )
+
+    def test_prazo_fora_do_intervalo(self):
+        with pytest.raises(ValidationError):
+            CapacidadeRequest(renda_mensal=15000, prazo_meses=600, tipo_amortizacao="SAC", regiao="SP")
+
+
+class TestTabelaAmortizacao:
+    @pytest.fixture
+    def tabela(self):
+        parcelas = [
+            Parcela(numero=mes, valor_parcela=110.0 - mes, valor_juros=10.0 - mes,
+                    valor_amortizacao=100.0, saldo_devedor=300.0 - 100.0 * mes)
+            for mes in range(1, 4)
+        ]
+        return TabelaAmortizacao.de_parcelas(parcelas, total_pago=324.0, total_juros=24.0)
+
+    def test_acesso_por_indice(self, tabela):
+        assert len(tabela.parcelas) == 3
+        assert tabela.parcelas[0].numero == 1
+        assert tabela.parcelas[-1].numero == 3
+        assert tabela.parcelas[1].valor_juros == 8.0
+
+    def test_indice_fora_da_tabela(self, tabela):
+        with pytest.raises(IndexError):
+            tabela.parcelas[3]
+
+    def test_fatia_e_iteracao(self, tabela):
+        assert [p.numero for p in tabela.parcelas[1:]] == [2, 3]
+        assert [p.saldo_devedor for p in tabela.parcelas] == [200.0, 100.0, 0.0]
+
+    def test_linhas_criadas_sob_demanda(self, tabela):
+        assert tabela.primeira_parcela() == tabela.parcelas[0]
+        assert tabela.ultima_parcela().to_dict() == {
+            "mes": 3, "parcela": 107.0, "juros": 7.0, "amortizacao": 100.0, "saldo_devedor": 0.0
+        }
+        assert tabela.parcelas[0] is not tabela.parcelas[0]
+
+    def test_sem_dict_por_objeto(self, tabela):
+        assert not hasattr(tabela, "__dict__")
+        assert not hasattr(tabela.primeira_parcela(), "__dict__")
+
+
+class TestArredondamentoCentavos:
+    @pytest.mark.parametrize(
+        "valor, esperado",
+        [
+            (0.125, 0.13),
+            (2.675, 2.68),
+            (1234.565, 1234.57),
+            (1234.5649, 1234.56),
+            (-12.345, -12.35),
+            (-0.001, 0.0),
+            (3512.47, 3512.47),
+        ],
+    )
+    def test_meio_centavo_para_longe_do_zero(self, valor, esperado):
+        assert arredondar_centavos(valor) == esperado
+
+    def test_ruido_de_ponto_flutuante_nao_muda_o_centavo(self):
+        empate = 1234.565
+        assert arredondar_centavos(empate + 1e-9) == arredondar_centavos(empate - 1e-9)